@@ -10,14 +10,16 @@ Read endpoints require the ``device:read`` scope; create requires
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from urllib.parse import urlencode
 
-import requests
-
+from roboflow.adapters import transport
 from roboflow.adapters.rfapi import RoboflowError
 from roboflow.config import API_URL
 
+if TYPE_CHECKING:
+    import requests
+
 DEFAULT_TIMEOUT = (10, 60)
 
 # Cap on raw error-body bytes surfaced through exception messages. Server-side
@@ -111,7 +113,7 @@ def _raise_for_status(response: requests.Response) -> None:
 
 def list_devices(api_key: str, workspace: str) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2`` — returns the parsed JSON response."""
-    response = requests.get(_build_url(workspace, "", api_key), timeout=DEFAULT_TIMEOUT)
+    response = transport.get(_build_url(workspace, "", api_key), timeout=DEFAULT_TIMEOUT)
     _raise_for_status(response)
     return response.json()
 
@@ -140,7 +142,7 @@ def create_device(
     if source_device_id is not None:
         # Body field is camelCase per docs/api/deployments/overview.md
         body["sourceDeviceId"] = source_device_id
-    response = requests.post(
+    response = transport.post(
         _build_url(workspace, "", api_key),
         json=body,
         timeout=DEFAULT_TIMEOUT,
@@ -151,7 +153,7 @@ def create_device(
 
 def get_device(api_key: str, workspace: str, device_id: str) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId``."""
-    response = requests.get(_build_url(workspace, f"/{device_id}", api_key), timeout=DEFAULT_TIMEOUT)
+    response = transport.get(_build_url(workspace, f"/{device_id}", api_key), timeout=DEFAULT_TIMEOUT)
     _raise_for_status(response)
     return response.json()
 
@@ -163,7 +165,7 @@ def get_device_config(api_key: str, workspace: str, device_id: str) -> Dict[str,
         The response can include ``environment_variables`` and integration
         credentials. Treat the returned dict as sensitive.
     """
-    response = requests.get(_build_url(workspace, f"/{device_id}/config", api_key), timeout=DEFAULT_TIMEOUT)
+    response = transport.get(_build_url(workspace, f"/{device_id}/config", api_key), timeout=DEFAULT_TIMEOUT)
     _raise_for_status(response)
     return response.json()
 
@@ -177,7 +179,7 @@ def get_device_config_history(
     cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/config/history``."""
-    response = requests.get(
+    response = transport.get(
         _build_url(
             workspace,
             f"/{device_id}/config/history",
@@ -192,14 +194,14 @@ def get_device_config_history(
 
 def list_device_streams(api_key: str, workspace: str, device_id: str) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/streams``."""
-    response = requests.get(_build_url(workspace, f"/{device_id}/streams", api_key), timeout=DEFAULT_TIMEOUT)
+    response = transport.get(_build_url(workspace, f"/{device_id}/streams", api_key), timeout=DEFAULT_TIMEOUT)
     _raise_for_status(response)
     return response.json()
 
 
 def get_device_stream(api_key: str, workspace: str, device_id: str, stream_id: str) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/streams/:streamId``."""
-    response = requests.get(
+    response = transport.get(
         _build_url(workspace, f"/{device_id}/streams/{stream_id}", api_key),
         timeout=DEFAULT_TIMEOUT,
     )
@@ -220,7 +222,7 @@ def get_device_logs(
     cursor: Optional[str] = None,
 ) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/logs``. Rate limited 5/min/IP."""
-    response = requests.get(
+    response = transport.get(
         _build_url(
             workspace,
             f"/{device_id}/logs",
@@ -248,7 +250,7 @@ def get_device_telemetry(
     time_period: Optional[str] = None,
 ) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/telemetry``. Rate limited 60/min."""
-    response = requests.get(
+    response = transport.get(
         _build_url(
             workspace,
             f"/{device_id}/telemetry",
@@ -276,7 +278,7 @@ def get_device_events(
     direction: Optional[str] = None,
 ) -> Dict[str, Any]:
     """``GET /:workspace/devices/v2/:deviceId/events``."""
-    response = requests.get(
+    response = transport.get(
         _build_url(
             workspace,
             f"/{device_id}/events",
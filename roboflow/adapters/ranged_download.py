@@ -0,0 +1,308 @@
+"""Parallel HTTP range downloads for large exports.
+
+The first request asks for ``Range: bytes=0-<part_size - 1>``. A ``206`` answer
+with a ``Content-Range`` header reveals the total size: the file is
+preallocated and the remaining ranges are fetched over ``connections``
+parallel requests, each writing its part at its own offset. Any other answer
+(typically a ``200`` with the whole body) is streamed to disk as it arrives,
+so servers without range support cost nothing extra.
+
+Subsequent range requests carry ``If-Range`` with the first response's
+``ETag``, so a file replaced mid-download is detected instead of being
+stitched together from two versions.
+
+Data is written to ``<path>.partial`` and only renamed to ``path`` once its
+size (and MD5, when the server reports one in ``x-goog-hash`` or
+``Content-MD5``) has been verified. For ranged downloads a small
+``<path>.partial.json`` checkpoint lists the parts already on disk: if the
+process dies, the next call for the same file (same size and ``ETag``, even
+through a freshly signed URL) fetches only the missing parts.
+"""
+
+from __future__ import annotations
+
+import base64
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from requests.exceptions import RequestException
+
+from roboflow.adapters import transport
+from roboflow.adapters.rfapi import RoboflowError
+
+DEFAULT_CONNECTIONS = 8
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+BUFFER_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+_GOOG_MD5 = re.compile(r"(?:^|,)\s*md5=([^,\s]+)")
+
+
+class DownloadError(RoboflowError):
+    pass
+
+
+def download(
+    url: str,
+    path: str,
+    *,
+    connections: int = DEFAULT_CONNECTIONS,
+    part_size: int = DEFAULT_PART_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    resume: bool = True,
+) -> int:
+    """
+    Download ``url`` to ``path``, over several connections when the server supports ranges.
+
+    ``path`` only appears once the download is complete and verified; a size or
+    checksum mismatch raises :class:`DownloadError` and discards the partial data.
+
+    Args:
+        url (str): file to download (e.g. a signed export link)
+        path (str): destination file, overwritten if it exists
+        connections (int): parallel range requests; ``1`` streams on a single connection
+        part_size (int): bytes per range request
+        progress (callable): called as ``progress(bytes_done, total_size)`` as data
+            arrives; ``total_size`` is ``None`` when the server does not report it
+        resume (bool): continue from the checkpoint of an interrupted download of the
+            same file instead of starting over
+
+    Returns:
+        int: number of bytes written
+    """
+    partial = f"{path}.partial"
+    tracker = _Progress(progress)
+    headers = {"Range": f"bytes=0-{part_size - 1}", "Accept-Encoding": "identity"} if connections > 1 else {}
+    try:
+        response = transport.get(url, headers=headers, stream=True, timeout=(60, 600))
+    except RequestException as e:
+        raise DownloadError(f"Could not download {url}: {e}") from e
+    if response.status_code == 416 and connections > 1:
+        # e.g. an empty file, which has no byte 0 to ask for
+        response.close()
+        return download(url, path, connections=1, progress=progress, resume=resume)
+    with response:
+        _check_status(response)
+        content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if response.status_code != 206 or content_range is None:
+            # no range support: nothing to resume from, stream the whole body
+            total = None if response.headers.get("Content-Encoding") else _content_length(response)
+            tracker.total = total
+            written = _stream(response, partial, tracker)
+            _verify(partial, written if total is None else total, _md5(response, ranged=False))
+            os.replace(partial, path)
+            return written
+
+        first, last, total = (int(group) for group in content_range.groups())
+        validator = response.headers.get("ETag")
+        parts = [(first, last)] + _split(last + 1, total, part_size)
+        checkpoint = _Checkpoint.load(partial, total, validator, parts) if resume else None
+        if checkpoint is None:
+            checkpoint = _Checkpoint(partial, total, validator, parts)
+            with open(partial, "wb") as f:
+                f.truncate(total)
+        tracker.total = total
+        tracker.done = sum(end - start + 1 for start, end in parts if start in checkpoint.done)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(connections, len(parts))) as executor:
+            futures = []
+            if first not in checkpoint.done:
+                futures.append(executor.submit(_write_part, response, partial, first, last, tracker, checkpoint))
+            futures += [
+                executor.submit(_fetch_part, url, partial, start, end, validator, tracker, checkpoint)
+                for start, end in parts[1:]
+                if start not in checkpoint.done
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    try:
+        _verify(partial, total, _md5(response, ranged=True))
+    finally:
+        checkpoint.remove()
+    os.replace(partial, path)
+    return total
+
+
+def _split(start: int, total: int, part_size: int) -> List[Tuple[int, int]]:
+    """Inclusive byte ranges covering ``[start, total)``."""
+    return [(offset, min(offset + part_size, total) - 1) for offset in range(start, total, part_size)]
+
+
+def _fetch_part(
+    url: str,
+    path: str,
+    start: int,
+    end: int,
+    validator: Optional[str],
+    tracker: _Progress,
+    checkpoint: _Checkpoint,
+) -> None:
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    if validator:
+        headers["If-Range"] = validator
+    try:
+        response = transport.get(url, headers=headers, stream=True, timeout=(60, 600))
+    except RequestException as e:
+        raise DownloadError(f"Could not download bytes {start}-{end} of {url}: {e}") from e
+    with response:
+        _check_status(response)
+        content_range = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if response.status_code != 206 or content_range is None or int(content_range.group(1)) != start:
+            raise DownloadError(f"Server did not return bytes {start}-{end} of {url}; the file may have changed")
+        _write_part(response, path, start, end, tracker, checkpoint)
+
+
+def _write_part(response, path: str, start: int, end: int, tracker: _Progress, checkpoint: _Checkpoint) -> None:
+    expected = end - start + 1
+    written = 0
+    with open(path, "r+b") as f:
+        f.seek(start)
+        try:
+            for chunk in response.iter_content(chunk_size=BUFFER_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+                tracker.add(len(chunk))
+        except RequestException as e:
+            # the part stays out of the checkpoint, so a resumed download fetches it again
+            raise DownloadError(f"Bytes {start}-{end}: connection lost after {written} of {expected} bytes: {e}") from e
+    if written != expected:
+        raise DownloadError(f"Bytes {start}-{end}: received {written} of {expected} bytes")
+    checkpoint.mark_done(start)
+
+
+def _stream(response, path: str, tracker: _Progress) -> int:
+    written = 0
+    with open(path, "wb") as f:
+        try:
+            for chunk in response.iter_content(chunk_size=BUFFER_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+                tracker.add(len(chunk))
+        except RequestException as e:
+            raise DownloadError(f"Connection lost after {written} bytes: {e}") from e
+    return written
+
+
+def _md5(response, ranged: bool) -> Optional[str]:
+    """Hex MD5 of the whole file as reported by the server, if any."""
+    encoded = None
+    match = _GOOG_MD5.search(response.headers.get("x-goog-hash", ""))
+    if match:
+        encoded = match.group(1)
+    elif not ranged:
+        # Content-MD5 of a 206 covers only that range
+        encoded = response.headers.get("Content-MD5")
+    if not encoded:
+        return None
+    try:
+        return base64.b64decode(encoded).hex()
+    except ValueError:
+        return None
+
+
+def _verify(path: str, size: int, md5: Optional[str]) -> None:
+    """Check the downloaded file's size and checksum; discard it if they do not match."""
+    actual = os.path.getsize(path)
+    problem = None
+    if actual != size:
+        problem = f"expected {size} bytes, got {actual}"
+    elif md5 is not None:
+        digest = hashlib.md5(usedforsecurity=False)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(BUFFER_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != md5:
+            problem = f"MD5 {digest.hexdigest()} does not match the server's {md5}"
+    if problem:
+        os.remove(path)
+        raise DownloadError(f"Downloaded file is corrupt ({problem})")
+
+
+def _check_status(response) -> None:
+    if response.status_code >= 400:
+        raise DownloadError(f"Download failed ({response.status_code})", status_code=response.status_code)
+
+
+def _content_length(response) -> Optional[int]:
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class _Checkpoint:
+    """Parts of ``<path>.partial`` already on disk, persisted next to it as JSON."""
+
+    def __init__(self, partial: str, total: int, validator: Optional[str], parts: List[Tuple[int, int]]):
+        self.path = f"{partial}.json"
+        self.total = total
+        self.validator = validator
+        self.parts = parts
+        self.done: set = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, partial: str, total: int, validator: Optional[str], parts: List[Tuple[int, int]]
+    ) -> Optional[_Checkpoint]:
+        """The checkpoint of an earlier download of the same file, or ``None`` if there is nothing to resume."""
+        checkpoint = cls(partial, total, validator, parts)
+        if not validator:
+            return None
+        try:
+            with open(checkpoint.path) as f:
+                state = json.load(f)
+            if os.path.getsize(partial) != total:
+                return None
+        except (OSError, ValueError):
+            return None
+        if (
+            state.get("total") != total
+            or state.get("etag") != validator
+            or state.get("parts") != [list(p) for p in parts]
+        ):
+            return None
+        checkpoint.done = set(state.get("done", []))
+        return checkpoint
+
+    def mark_done(self, start: int) -> None:
+        with self._lock:
+            self.done.add(start)
+            state = {"total": self.total, "etag": self.validator, "parts": self.parts, "done": sorted(self.done)}
+            with open(f"{self.path}.tmp", "w") as f:
+                json.dump(state, f)
+            os.replace(f"{self.path}.tmp", self.path)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _Progress:
+    def __init__(self, callback: Optional[ProgressCallback]):
+        self.callback = callback
+        self.total: Optional[int] = None
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def add(self, count: int) -> None:
+        if self.callback is None:
+            return
+        with self._lock:
+            self.done += count
+            self.callback(self.done, self.total)
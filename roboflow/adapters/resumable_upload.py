@@ -0,0 +1,209 @@
+"""Chunked, resumable uploads to signed URLs (GCS resumable-session protocol).
+
+A session is opened with ``POST <signed url>`` and ``x-goog-resumable: start``;
+the returned ``Location`` is the session URI. Data is then sent in ``PUT``
+requests carrying ``Content-Range: bytes <first>-<last>/<total or *>``. The
+server answers ``308`` with a ``Range: bytes=0-<n>`` header while the upload is
+incomplete and ``200``/``201`` once the final chunk is in.
+
+When a chunk fails (connection error, timeout, 429 or 5xx) only that chunk is
+retried: the session is asked how many bytes it already holds (``PUT`` with
+``Content-Range: bytes */<total>``) and sending resumes from there. A session
+URI stays valid for about a week, so an upload can also be resumed by a later
+process that passes the same ``session_url`` and source.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from random import random
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from requests.exceptions import RequestException
+
+from roboflow.adapters import transport
+from roboflow.adapters.rfapi import RoboflowError
+
+# GCS requires every chunk but the last to be a multiple of 256 KiB.
+CHUNK_GRANULARITY = 256 * 1024
+DEFAULT_CHUNK_SIZE = 32 * CHUNK_GRANULARITY
+DEFAULT_MAX_RETRIES = 8
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+_RANGE = re.compile(r"bytes=0-(\d+)")
+
+
+class ResumableUploadError(RoboflowError):
+    pass
+
+
+class _TransientError(Exception):
+    pass
+
+
+def start_session(signed_url: str, content_type: str = "application/zip") -> str:
+    """Open a resumable session on ``signed_url`` and return the session URI."""
+    try:
+        response = transport.post(
+            signed_url,
+            headers={"x-goog-resumable": "start", "Content-Type": content_type},
+            data=b"",
+            timeout=(60, 60),
+        )
+    except RequestException as e:
+        raise ResumableUploadError(f"Could not start resumable upload: {e}") from e
+    session_url = response.headers.get("Location")
+    if response.status_code not in (200, 201) or not session_url:
+        raise ResumableUploadError(
+            f"Could not start resumable upload ({response.status_code}): {response.text}",
+            status_code=response.status_code,
+        )
+    return session_url
+
+
+def query_offset(session_url: str, total_size: Optional[int] = None) -> Optional[int]:
+    """Number of bytes the session has persisted, or ``None`` if the upload is already complete."""
+    response = transport.put(
+        session_url,
+        data=b"",
+        headers={"Content-Range": f"bytes */{'*' if total_size is None else total_size}"},
+        timeout=(60, 60),
+    )
+    if response.status_code in (200, 201):
+        return None
+    if response.status_code == 308:
+        return _persisted(response)
+    _raise_for_status(response)
+    return None  # unreachable
+
+
+def upload(
+    session_url: str,
+    source: Union[str, Iterable[bytes]],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    progress: Optional[ProgressCallback] = None,
+    resume: bool = False,
+) -> None:
+    """
+    Send ``source`` through a resumable session in ``chunk_size`` pieces.
+
+    Args:
+        session_url (str): URI returned by :func:`start_session`
+        source (str | Iterable[bytes]): path of the file to upload, or an iterable of
+            byte strings (e.g. ``zipstream.iter_zip``) whose total size need not be known
+        chunk_size (int): bytes per request, rounded down to a multiple of 256 KiB
+        max_retries (int): attempts per chunk before giving up
+        progress (callable): called as ``progress(bytes_sent, total_size)`` after each
+            chunk; ``total_size`` is ``None`` for a stream until its end is reached
+        resume (bool): ask the session how much it already holds and skip those bytes
+            of ``source`` (for restarting an interrupted upload in a new process)
+    """
+    chunk_size = max(CHUNK_GRANULARITY, chunk_size - chunk_size % CHUNK_GRANULARITY)
+    total_size = os.path.getsize(source) if isinstance(source, str) else None
+
+    offset = 0
+    if resume:
+        try:
+            persisted = query_offset(session_url, total_size)
+        except (RequestException, _TransientError) as e:
+            raise ResumableUploadError(f"Could not query resumable upload status: {e}") from e
+        if persisted is None:
+            return
+        offset = persisted
+
+    pieces = _rechunk(_iter_source(source, offset), chunk_size)
+    start = offset
+    chunk = next(pieces, b"")
+    while True:
+        following = next(pieces, None)
+        last = following is None
+        _send_chunk(session_url, chunk, start, start + len(chunk) if last else total_size, last, max_retries)
+        start += len(chunk)
+        if progress is not None:
+            progress(start, start if last else total_size)
+        if following is None:
+            return
+        chunk = following
+
+
+def _send_chunk(session_url: str, chunk: bytes, start: int, total: Optional[int], last: bool, max_retries: int) -> None:
+    end = start + len(chunk)
+    sent_from = start
+    attempt = 0
+    while True:
+        data = chunk[sent_from - start :]
+        total_str = "*" if total is None else str(total)
+        content_range = f"bytes {sent_from}-{end - 1}/{total_str}" if data else f"bytes */{total_str}"
+        try:
+            response = transport.put(
+                session_url, data=data, headers={"Content-Range": content_range}, timeout=(60, 600)
+            )
+            if response.status_code in (200, 201):
+                return
+            if response.status_code != 308:
+                _raise_for_status(response)
+            persisted = _persisted(response)
+            if persisted >= end and not last:
+                return
+            if persisted < start:
+                raise ResumableUploadError(
+                    f"Upload session lost data: holds {persisted} bytes, expected at least {start}"
+                )
+            # The server kept only part of the chunk (or wants the final empty request); send the rest.
+            sent_from = persisted
+            raise _TransientError(f"session holds {persisted} of {end} bytes")
+        except (RequestException, _TransientError) as e:
+            if attempt >= max_retries:
+                raise ResumableUploadError(f"Chunk at byte {start} failed after {attempt} retries: {e}") from e
+            time.sleep(random() * min(30.0, 0.1 * 2**attempt))
+            attempt += 1
+            try:
+                persisted_now = query_offset(session_url, total)
+            except (RequestException, _TransientError):
+                continue
+            if persisted_now is None:
+                return
+            sent_from = min(max(persisted_now, start), end)
+
+
+def _persisted(response) -> int:
+    match = _RANGE.match(response.headers.get("Range", ""))
+    return int(match.group(1)) + 1 if match else 0
+
+
+def _raise_for_status(response) -> None:
+    if response.status_code == 429 or response.status_code >= 500:
+        raise _TransientError(f"HTTP {response.status_code}")
+    raise ResumableUploadError(
+        f"Resumable upload failed ({response.status_code}): {response.text}", status_code=response.status_code
+    )
+
+
+def _iter_source(source: Union[str, Iterable[bytes]], skip: int) -> Iterator[bytes]:
+    if isinstance(source, str):
+        with open(source, "rb") as fh:
+            fh.seek(skip)
+            yield from iter(lambda: fh.read(DEFAULT_CHUNK_SIZE), b"")
+        return
+    for piece in source:
+        if skip >= len(piece):
+            skip -= len(piece)
+            continue
+        yield piece[skip:]
+        skip = 0
+
+
+def _rechunk(pieces: Iterable[bytes], size: int) -> Iterator[bytes]:
+    buffer = bytearray()
+    for piece in pieces:
+        buffer += piece
+        while len(buffer) >= size:
+            yield bytes(buffer[:size])
+            del buffer[:size]
+    if buffer:
+        yield bytes(buffer)
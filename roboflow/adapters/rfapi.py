@@ -2,13 +2,14 @@ import json
 import mimetypes
 import os
 import urllib
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import quote
 
 import requests
 from requests.exceptions import RequestException
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+from roboflow.adapters import transport
 from roboflow.config import API_URL, DEFAULT_BATCH_NAME, DEFAULT_JOB_NAME
 
 
@@ -43,7 +44,7 @@ class AnnotationSaveError(RoboflowError):
 
 def get_workspace(api_key, workspace_url):
     url = f"{API_URL}/{workspace_url}?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     result = response.json()
@@ -52,7 +53,7 @@ def get_workspace(api_key, workspace_url):
 
 def get_project(api_key, workspace_url, project_url):
     url = f"{API_URL}/{workspace_url}/{project_url}?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     result = response.json()
@@ -64,7 +65,7 @@ def get_project_health(api_key, workspace_url, project_url, regenerate=False):
     url = f"{API_URL}/{workspace_url}/{project_url}/health?api_key={api_key}"
     if regenerate:
         url += "&regenerate=true"
-    response = requests.get(url)
+    response = transport.get(url)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -99,7 +100,7 @@ def start_version_training(
     if epochs is not None:
         data["epochs"] = epochs
 
-    response = requests.post(url, json=data)
+    response = transport.post(url, json=data)
     if not response.ok:
         raise RoboflowError(response.text)
     return True
@@ -122,7 +123,7 @@ def cancel_version_training(
     body: Dict[str, Union[str, int, bool]] = {}
     if continue_if_no_refund:
         body["continueIfNoRefund"] = True
-    response = requests.post(url, json=body)
+    response = transport.post(url, json=body)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json() if response.content else {"success": True}
@@ -135,7 +136,7 @@ def stop_version_training(api_key: str, workspace_url: str, project_url: str, ve
     phase gracefully (mining or training).
     """
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}/train/stop?api_key={api_key}"
-    response = requests.post(url, json={})
+    response = transport.post(url, json={})
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json() if response.content else {"success": True}
@@ -149,7 +150,7 @@ def get_training_results(api_key: str, workspace_url: str, project_url: str, ver
     returns a minimal bundle with the produced model(s).
     """
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}/training/results?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -172,7 +173,7 @@ def list_trainings_for_version(api_key: str, workspace_url: str, project_url: st
     ``{trainingId, status, modelType, modelGroup, modelIds, start}``.
     """
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}/v2/trainings?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     data = response.json()
@@ -191,7 +192,7 @@ def get_training(api_key: str, workspace_url: str, project_url: str, version: st
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}/v2/trainings/get?api_key={api_key}"
     if training_id:
         url += f"&trainingId={quote(str(training_id), safe='')}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -216,7 +217,7 @@ def get_train_recipe(
         f"{API_URL}/{workspace_url}/{project_url}/{version}/v2/trainings/recipe"
         f"?api_key={api_key}&modelType={encoded_model_type}"
     )
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -257,7 +258,7 @@ def create_training_v2(
         data["epochs"] = epochs
     if train_recipe is not None:
         data["trainRecipe"] = train_recipe
-    response = requests.post(url, json=data)
+    response = transport.post(url, json=data)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json() if response.content else {"status": "training_started"}
@@ -282,7 +283,7 @@ def cancel_training_v2(
         body["trainingId"] = training_id
     if continue_if_no_refund:
         body["continueIfNoRefund"] = True
-    response = requests.post(url, json=body)
+    response = transport.post(url, json=body)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json() if response.content else {"success": True}
@@ -298,7 +299,7 @@ def stop_training_v2(api_key: str, workspace_url: str, project_url: str, version
     body: Dict[str, str] = {}
     if training_id:
         body["trainingId"] = training_id
-    response = requests.post(url, json=body)
+    response = transport.post(url, json=body)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json() if response.content else {"success": True}
@@ -315,7 +316,7 @@ def get_model_weights_url(api_key: str, workspace_url: str, project_url: str, mo
         raise RoboflowError(f"Unsupported weights format '{model_format}'. Only 'pt' is supported.")
     encoded = quote(str(model_id), safe="")
     url = f"{API_URL}/{workspace_url}/{project_url}/{encoded}/ptFile?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()["weightsUrl"]
@@ -332,7 +333,7 @@ def list_project_models(
     url = f"{API_URL}/{workspace_url}/{project_url}/models?api_key={api_key}"
     if group:
         url += f"&group={urllib.parse.quote(group, safe='')}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -342,7 +343,7 @@ def get_model_by_url(api_key: str, workspace_url: str, model_url: str):
     """Fetch a single model by its URL slug."""
     encoded = urllib.parse.quote(model_url, safe="/")
     url = f"{API_URL}/models/{workspace_url}/{encoded}?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -358,7 +359,7 @@ def favorite_nas_model(api_key: str, workspace_url: str, model_id: str, *, starr
     """
     encoded = urllib.parse.quote(model_id, safe="")
     url = f"{API_URL}/{workspace_url}/models/{encoded}/favorite?api_key={api_key}"
-    response = requests.post(url, json={"starred": bool(starred)})
+    response = transport.post(url, json={"starred": bool(starred)})
     if not response.ok:
         raise RoboflowError(response.text)
     return response.json()
@@ -385,7 +386,7 @@ def get_version(api_key: str, workspace_url: str, project_url: str, version: str
     if nocache:
         url += "&nocache=true"
 
-    response = requests.get(url)
+    response = transport.get(url)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -408,8 +409,11 @@ def get_version_export(
     Raises RoboflowError on non-200/202 statuses or invalid/missing JSON when 200/202.
     """
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}/{format}?api_key={api_key}&nocache=true"
-    response = requests.get(url)
+    response = transport.get(url)
+    return _version_export_result(response)
 
+
+def _version_export_result(response):
     # Non-success codes other than 202 are errors
     if response.status_code not in (200, 202):
         raise RoboflowError(response.text)
@@ -513,7 +517,7 @@ def workspace_search(
     if continuation_token is not None:
         payload["continuationToken"] = continuation_token
 
-    response = requests.post(url, json=payload)
+    response = transport.post(url, json=payload)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -538,7 +542,7 @@ def workspace_delete_images(
         RoboflowError: On non-200 response status codes.
     """
     url = f"{API_URL}/{workspace_url}/images?api_key={api_key}"
-    response = requests.delete(url, json={"images": image_ids})
+    response = transport.delete(url, json={"images": image_ids})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -582,7 +586,7 @@ def update_image_metadata(
     if remove_tags is not None:
         body["removeTags"] = remove_tags
 
-    response = requests.post(url, params={"api_key": api_key}, json=body)
+    response = transport.post(url, params={"api_key": api_key}, json=body)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -608,7 +612,7 @@ def batch_update_image_metadata(
         RoboflowError: On non-202 response.
     """
     url = f"{API_URL}/{workspace_url}/images/metadata"
-    response = requests.post(url, params={"api_key": api_key}, json={"updates": updates})
+    response = transport.post(url, params={"api_key": api_key}, json={"updates": updates})
     if response.status_code != 202:
         raise RoboflowError(response.text)
     return response.json()
@@ -645,26 +649,29 @@ def upload_image(
     # If image is not a hosted image
     if not hosted_image:
         image_name = os.path.basename(image_path)
-        with open(image_path, "rb") as fh:
-            image_bytes = fh.read()
         content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
 
         upload_url = _local_upload_url(
             api_key, project_url, coalesced_batch_name, tag_names, sequence_number, sequence_size, kwargs
         )
-        fields = {
-            "name": image_name,
-            "split": split,
-            "file": (image_name, image_bytes, content_type),
-        }
-        if metadata is not None:
-            fields["metadata"] = json.dumps(metadata)
-        m = MultipartEncoder(fields=fields)
-
-        try:
-            response = requests.post(upload_url, data=m, headers={"Content-Type": m.content_type}, timeout=(300, 300))
-        except RequestException as e:
-            raise ImageUploadError(str(e)) from e
+        # Hand the open file to the encoder so the body is streamed from disk in
+        # blocks rather than holding a full copy of the image per worker thread.
+        with open(image_path, "rb") as fh:
+            fields = {
+                "name": image_name,
+                "split": split,
+                "file": (image_name, fh, content_type),
+            }
+            if metadata is not None:
+                fields["metadata"] = json.dumps(metadata)
+            m = MultipartEncoder(fields=fields)
+
+            try:
+                response = transport.post(
+                    upload_url, data=m, headers={"Content-Type": m.content_type}, timeout=(300, 300)
+                )
+            except RequestException as e:
+                raise ImageUploadError(str(e)) from e
 
     else:
         # Hosted image upload url
@@ -677,10 +684,14 @@ def upload_image(
 
         try:
             # Get response
-            response = requests.post(upload_url, timeout=(300, 300))
+            response = transport.post(upload_url, timeout=(300, 300))
         except RequestException as e:
             raise ImageUploadError(str(e)) from e
 
+    return _upload_image_result(response)
+
+
+def _upload_image_result(response):
     responsejson = None
     try:
         responsejson = response.json()
@@ -735,7 +746,7 @@ def save_annotation(
     )
 
     try:
-        response = requests.post(
+        response = transport.post(
             upload_url,
             data=json.dumps({"annotationFile": annotation_string, "labelmap": annotation_labelmap}),
             headers={"Content-Type": "application/json"},
@@ -744,7 +755,10 @@ def save_annotation(
     except RequestException as e:
         raise AnnotationSaveError(str(e)) from e
 
-    # Handle response
+    return _save_annotation_result(response)
+
+
+def _save_annotation_result(response):
     responsejson = None
     try:
         responsejson = response.json()
@@ -838,17 +852,26 @@ def _save_annotation_error(response):
 # ---------------------------------------------------------------------------
 
 
-def init_zip_upload(api_key, workspace_url, project_url, split=None, tags=None, batch_name=None) -> dict:
-    """POST /{ws}/{proj}/upload/zip — initialize a zip upload and get a signed URL."""
+def init_zip_upload(
+    api_key, workspace_url, project_url, split=None, tags=None, batch_name=None, resumable=False
+) -> dict:
+    """POST /{ws}/{proj}/upload/zip — initialize a zip upload and get a signed URL.
+
+    ``signedUrl`` is signed for a single PUT. With ``resumable=True`` the response may also carry
+    ``resumableUrl``, signed for the POST that opens a resumable session; it is absent when the
+    server does not offer one.
+    """
     url = f"{API_URL}/{workspace_url}/{project_url}/upload/zip"
-    body: Dict[str, Union[str, List[str]]] = {}
+    body: Dict[str, Union[str, List[str], bool]] = {}
+    if resumable:
+        body["resumable"] = True
     if split is not None:
         body["split"] = split
     if tags is not None:
         body["tags"] = tags
     if batch_name is not None:
         body["batchName"] = batch_name
-    response = requests.post(url, params={"api_key": api_key}, json=body)
+    response = transport.post(url, params={"api_key": api_key}, json=body)
     if response.status_code not in (200, 201):
         raise RoboflowError(response.text)
     return response.json()
@@ -857,7 +880,7 @@ def init_zip_upload(api_key, workspace_url, project_url, split=None, tags=None,
 def upload_zip_to_signed_url(signed_url, zip_path) -> None:
     """PUT the zip file to the GCS signed URL returned by init_zip_upload."""
     with open(zip_path, "rb") as fh:
-        response = requests.put(
+        response = transport.put(
             signed_url,
             data=fh,
             headers={"Content-Type": "application/zip"},
@@ -867,10 +890,48 @@ def upload_zip_to_signed_url(signed_url, zip_path) -> None:
         raise RoboflowError(f"Zip upload to signed URL failed ({response.status_code}): {response.text}")
 
 
+def upload_zip_stream_to_signed_url(signed_url, chunks: Iterable[bytes], size: int) -> None:
+    """PUT a zip produced on the fly (e.g. ``zipstream.iter_zip``) to the signed URL.
+
+    Signed-URL object stores reject chunked transfer encoding, so the body is sent with a
+    ``Content-Length`` of ``size`` (see ``zipstream.zip_size``); a stream that ends up
+    shorter or longer aborts the upload with :class:`RoboflowError`.
+    """
+    response = transport.put(
+        signed_url,
+        data=_SizedStream(chunks, size),
+        headers={"Content-Type": "application/zip"},
+        timeout=(60, 3600),
+    )
+    if not response.ok:
+        raise RoboflowError(f"Zip upload to signed URL failed ({response.status_code}): {response.text}")
+
+
+class _SizedStream:
+    """Iterable request body of known length: ``requests`` sends ``Content-Length`` instead of chunking it."""
+
+    def __init__(self, chunks: Iterable[bytes], size: int):
+        self._chunks = chunks
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        sent = 0
+        for chunk in self._chunks:
+            sent += len(chunk)
+            if sent > self._size:
+                raise RoboflowError(f"Zip stream is longer than the announced {self._size} bytes")
+            yield chunk
+        if sent != self._size:
+            raise RoboflowError(f"Zip stream ended after {sent} of the announced {self._size} bytes")
+
+
 def get_zip_upload_status(api_key, workspace_url, task_id) -> dict:
     """GET /{ws}/upload/zip/{task_id} — poll status of an async zip upload."""
     url = f"{API_URL}/{workspace_url}/upload/zip/{task_id}"
-    response = requests.get(url, params={"api_key": api_key})
+    response = transport.get(url, params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -883,7 +944,7 @@ def get_zip_upload_status(api_key, workspace_url, task_id) -> dict:
 
 def list_batches(api_key, workspace_url, project_url):
     """GET /{ws}/{proj}/batches — list annotation batches."""
-    response = requests.get(f"{API_URL}/{workspace_url}/{project_url}/batches", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/{project_url}/batches", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -891,7 +952,7 @@ def list_batches(api_key, workspace_url, project_url):
 
 def get_batch(api_key, workspace_url, project_url, batch_id):
     """GET /{ws}/{proj}/batches/{batch_id} — get batch details."""
-    response = requests.get(f"{API_URL}/{workspace_url}/{project_url}/batches/{batch_id}", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/{project_url}/batches/{batch_id}", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -899,7 +960,7 @@ def get_batch(api_key, workspace_url, project_url, batch_id):
 
 def list_annotation_jobs(api_key, workspace_url, project_url):
     """GET /{ws}/{proj}/jobs — list annotation jobs."""
-    response = requests.get(f"{API_URL}/{workspace_url}/{project_url}/jobs", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/{project_url}/jobs", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -907,7 +968,7 @@ def list_annotation_jobs(api_key, workspace_url, project_url):
 
 def get_annotation_job(api_key, workspace_url, project_url, job_id):
     """GET /{ws}/{proj}/jobs/{job_id} — get annotation job details."""
-    response = requests.get(f"{API_URL}/{workspace_url}/{project_url}/jobs/{job_id}", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/{project_url}/jobs/{job_id}", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -920,7 +981,7 @@ def create_annotation_job(api_key, workspace_url, project_url, *, name, batch_id
         payload["batchId"] = batch_id
     if assignees:
         payload["assignees"] = assignees
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/{project_url}/jobs",
         params={"api_key": api_key},
         json=payload,
@@ -937,7 +998,7 @@ def create_annotation_job(api_key, workspace_url, project_url, *, name, batch_id
 
 def list_folders(api_key, workspace_url):
     """GET /{ws}/groups — list project folders."""
-    response = requests.get(f"{API_URL}/{workspace_url}/groups", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/groups", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -945,7 +1006,7 @@ def list_folders(api_key, workspace_url):
 
 def get_folder(api_key, workspace_url, group_id):
     """GET /{ws}/groups?groupId={id} — get folder details."""
-    response = requests.get(
+    response = transport.get(
         f"{API_URL}/{workspace_url}/groups",
         params={"api_key": api_key, "groupId": group_id},
     )
@@ -961,7 +1022,7 @@ def create_folder(api_key, workspace_url, name, *, parent_id=None, project_ids=N
         payload["parent_id"] = parent_id
     if project_ids:
         payload["projects"] = project_ids
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/groups",
         params={"api_key": api_key},
         json=payload,
@@ -976,7 +1037,7 @@ def update_folder(api_key, workspace_url, group_id, *, name=None):
     payload: Dict[str, Optional[str]] = {}
     if name:
         payload["name"] = name
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/groups/{group_id}",
         params={"api_key": api_key},
         json=payload,
@@ -988,7 +1049,7 @@ def update_folder(api_key, workspace_url, group_id, *, name=None):
 
 def delete_folder(api_key, workspace_url, group_id):
     """DELETE /{ws}/groups/{id} — delete a project folder."""
-    response = requests.delete(
+    response = transport.delete(
         f"{API_URL}/{workspace_url}/groups/{group_id}",
         params={"api_key": api_key},
     )
@@ -1001,7 +1062,7 @@ def delete_folder(api_key, workspace_url, group_id):
 
 def add_projects_to_folder(api_key, workspace_url, group_id, project_ids):
     """PATCH /{ws}/groups/{id}/projects — add projects to a folder."""
-    response = requests.patch(
+    response = transport.patch(
         f"{API_URL}/{workspace_url}/groups/{group_id}/projects",
         params={"api_key": api_key},
         json={"projects": project_ids},
@@ -1012,7 +1073,7 @@ def add_projects_to_folder(api_key, workspace_url, group_id, project_ids):
 
 def remove_projects_from_folder(api_key, workspace_url, group_id, project_ids):
     """DELETE /{ws}/groups/{id}/projects — remove projects from a folder."""
-    response = requests.delete(
+    response = transport.delete(
         f"{API_URL}/{workspace_url}/groups/{group_id}/projects",
         params={"api_key": api_key},
         json={"projects": project_ids},
@@ -1075,7 +1136,7 @@ def _normalize_workflow_config(config):
 
 def list_workflows(api_key, workspace_url):
     """GET /{ws}/workflows — list workflows."""
-    response = requests.get(f"{API_URL}/{workspace_url}/workflows", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/workflows", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1083,7 +1144,7 @@ def list_workflows(api_key, workspace_url):
 
 def get_workflow(api_key, workspace_url, workflow_url):
     """GET /{ws}/workflows/{url} — get workflow details."""
-    response = requests.get(
+    response = transport.get(
         f"{API_URL}/{workspace_url}/workflows/{workflow_url}",
         params={"api_key": api_key},
     )
@@ -1122,7 +1183,7 @@ def create_workflow(api_key, workspace_url, *, name, url=None, config=None, temp
         "template": template,
         "config": config,
     }
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/createWorkflow",
         params=params,
     )
@@ -1153,7 +1214,7 @@ def update_workflow(api_key, workspace_url, *, workflow_id, workflow_name, workf
         "url": workflow_url,
         "config": config,
     }
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/updateWorkflow",
         params={"api_key": api_key},
         json=payload,
@@ -1165,7 +1226,7 @@ def update_workflow(api_key, workspace_url, *, workflow_id, workflow_name, workf
 
 def list_workflow_versions(api_key, workspace_url, workflow_url):
     """GET /{ws}/workflows/{url}/versions — list workflow versions."""
-    response = requests.get(
+    response = transport.get(
         f"{API_URL}/{workspace_url}/workflows/{workflow_url}/versions",
         params={"api_key": api_key},
     )
@@ -1192,7 +1253,7 @@ def fork_project(
         payload["url"] = url
     if source_project_slug:
         payload["source_project"] = source_project_slug
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{dest_workspace}/projects/fork",
         params={"api_key": api_key},
         json=payload,
@@ -1215,7 +1276,7 @@ def get_async_task(api_key, workspace_url, task_id):
     # ``/``, ``?`` or ``#`` cannot mutate the request path (and still send
     # the api_key with it).
     encoded_task_id = quote(task_id, safe="")
-    response = requests.get(
+    response = transport.get(
         f"{API_URL}/{workspace_url}/asynctasks/{encoded_task_id}",
         params={"api_key": api_key},
     )
@@ -1233,7 +1294,7 @@ def get_async_task_at(api_key, polling_url):
     only attach the api_key. Falls back to ``get_async_task`` callers when
     no server-supplied URL is available.
     """
-    response = requests.get(polling_url, params={"api_key": api_key})
+    response = transport.get(polling_url, params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1257,7 +1318,7 @@ def fork_workflow(api_key, workspace_url, *, source_workspace, source_workflow,
         payload["name"] = name
     if url:
         payload["url"] = url
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/forkWorkflow",
         params={"api_key": api_key},
         json=payload,
@@ -1274,7 +1335,7 @@ def fork_workflow(api_key, workspace_url, *, source_workspace, source_workflow,
 
 def get_billing_usage(api_key, workspace_url):
     """POST /{ws}/billing-usage-report — get billing usage report."""
-    response = requests.post(
+    response = transport.post(
         f"{API_URL}/{workspace_url}/billing-usage-report",
         params={"api_key": api_key},
     )
@@ -1285,7 +1346,7 @@ def get_billing_usage(api_key, workspace_url):
 
 def get_plan_info(api_key):
     """GET /usage/plan — get workspace plan info and limits."""
-    response = requests.get(f"{API_URL}/usage/plan", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/usage/plan", params={"api_key": api_key})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1298,7 +1359,7 @@ def get_labeling_stats(api_key, workspace_url, *, start_date=None, end_date=None
         params["startDate"] = start_date
     if end_date:
         params["endDate"] = end_date
-    response = requests.get(f"{API_URL}/{workspace_url}/stats", params=params)
+    response = transport.get(f"{API_URL}/{workspace_url}/stats", params=params)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1311,7 +1372,7 @@ def get_labeling_stats(api_key, workspace_url, *, start_date=None, end_date=None
 
 def get_video_job_status(api_key, job_id):
     """GET /videoinfer?jobId={id} — check video inference job status."""
-    response = requests.get(f"{API_URL}/videoinfer", params={"api_key": api_key, "job_id": job_id})
+    response = transport.get(f"{API_URL}/videoinfer", params={"api_key": api_key, "job_id": job_id})
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1329,7 +1390,7 @@ def search_universe(query, *, api_key=None, project_type=None, limit=12, page=1)
         params["api_key"] = api_key
     if project_type:
         params["type"] = project_type
-    response = requests.get(f"{API_URL}/universe/search", params=params)
+    response = transport.get(f"{API_URL}/universe/search", params=params)
     if response.status_code != 200:
         raise RoboflowError(response.text)
     return response.json()
@@ -1373,7 +1434,7 @@ def delete_project(api_key, workspace_url, project_url):
     window; after 30 days the cleanup cron permanently removes it.
     """
     url = f"{API_URL}/{workspace_url}/{project_url}?api_key={api_key}"
-    response = requests.delete(url)
+    response = transport.delete(url)
     if response.status_code != 200:
         _raise_for_trash_response(response)
     return response.json()
@@ -1385,7 +1446,7 @@ def delete_version(api_key, workspace_url, project_url, version):
     Any in-flight training on the version will be cancelled automatically.
     """
     url = f"{API_URL}/{workspace_url}/{project_url}/{version}?api_key={api_key}"
-    response = requests.delete(url)
+    response = transport.delete(url)
     if response.status_code != 200:
         _raise_for_trash_response(response)
     return response.json()
@@ -1396,7 +1457,7 @@ def delete_workflow(api_key, workspace_url, workflow_url):
     (30-day retention). Restore via `restore_trash_item(..., "workflow", ...)`.
     """
     url = f"{API_URL}/{workspace_url}/workflows/{workflow_url}?api_key={api_key}"
-    response = requests.delete(url)
+    response = transport.delete(url)
     if response.status_code != 200:
         _raise_for_trash_response(response)
     return response.json()
@@ -1410,7 +1471,7 @@ def list_trash(api_key, workspace_url):
     `name`, `deletedAt`, `scheduledCleanupAt`, and (for versions) `parentId`.
     """
     url = f"{API_URL}/{workspace_url}/trash?api_key={api_key}"
-    response = requests.get(url)
+    response = transport.get(url)
     if response.status_code != 200:
         _raise_for_trash_response(response)
     return response.json()
@@ -1426,7 +1487,7 @@ def restore_trash_item(api_key, workspace_url, item_type, item_id, parent_id=Non
     payload = {"type": item_type, "id": item_id}
     if parent_id is not None:
         payload["parentId"] = parent_id
-    response = requests.post(url, json=payload)
+    response = transport.post(url, json=payload)
     if response.status_code != 200:
         _raise_for_trash_response(response)
     return response.json()
@@ -1506,7 +1567,7 @@ def _eval_get(api_key, workspace_url, path, params=None):
             if value is not None:
                 query[key] = value
     url = f"{API_URL}/{workspace_url}/model-evals{path}"
-    response = requests.get(url, params=query)
+    response = transport.get(url, params=query)
     if response.status_code != 200:
         raise _model_eval_error_for(response)
     return response.json()
@@ -1659,7 +1720,7 @@ def list_api_keys(
         params["includeDisabled"] = "true"
     if include_folders:
         params["includeFolders"] = "true"
-    response = requests.get(f"{API_URL}/{workspace_url}/api-keys", params=params)
+    response = transport.get(f"{API_URL}/{workspace_url}/api-keys", params=params)
     if not response.ok:
         raise RoboflowError(response.text, status_code=response.status_code)
     return response.json()
@@ -1668,7 +1729,7 @@ def list_api_keys(
 def get_api_key(api_key: str, workspace_url: str, key_id: str) -> dict:
     """GET /{workspace}/api-keys/{keyId} — get a single API key by ID."""
     encoded = quote(key_id, safe="")
-    response = requests.get(f"{API_URL}/{workspace_url}/api-keys/{encoded}", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/api-keys/{encoded}", params={"api_key": api_key})
     if not response.ok:
         raise RoboflowError(response.text, status_code=response.status_code)
     return response.json()
@@ -1676,7 +1737,7 @@ def get_api_key(api_key: str, workspace_url: str, key_id: str) -> dict:
 
 def get_publishable_key(api_key: str, workspace_url: str) -> dict:
     """GET /{workspace}/api-keys/publishable — get the workspace publishable key."""
-    response = requests.get(f"{API_URL}/{workspace_url}/api-keys/publishable", params={"api_key": api_key})
+    response = transport.get(f"{API_URL}/{workspace_url}/api-keys/publishable", params={"api_key": api_key})
     if not response.ok:
         raise RoboflowError(response.text, status_code=response.status_code)
     return response.json()
@@ -1715,7 +1776,7 @@ def create_api_key(
         body["customMetadata"] = custom_metadata
     if protected:
         body["protected"] = True
-    response = requests.post(f"{API_URL}/{workspace_url}/api-keys", params={"api_key": api_key}, json=body)
+    response = transport.post(f"{API_URL}/{workspace_url}/api-keys", params={"api_key": api_key}, json=body)
     if not response.ok:
         raise RoboflowError(response.text, status_code=response.status_code)
     return response.json()
@@ -1743,7 +1804,7 @@ def update_api_key(api_key: str, workspace_url: str, key_id: str, **fields: Any)
             body[wire_key] = None
         elif v is not None:
             body[wire_key] = v
-    response = requests.patch(
+    response = transport.patch(
         f"{API_URL}/{workspace_url}/api-keys/{encoded}",
         params={"api_key": api_key},
         json=body,
@@ -1759,7 +1820,7 @@ def revoke_api_key(api_key: str, workspace_url: str, key_id: str) -> dict:
     Revoking a protected key returns 409. This action is irreversible.
     """
     encoded = quote(key_id, safe="")
-    response = requests.delete(
+    response = transport.delete(
         f"{API_URL}/{workspace_url}/api-keys/{encoded}",
         params={"api_key": api_key},
     )
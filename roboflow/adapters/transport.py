@@ -0,0 +1,163 @@
+"""Shared, pooled HTTP transport for the API adapters.
+
+Every adapter (``rfapi``, ``vision_events_api``, ``devicesapi`` and
+``deploymentapi``) sends its requests through one process-wide
+:class:`Transport`. The transport owns a ``requests.Session`` whose connection
+pool is shared by all threads, so concurrent callers such as
+``Workspace.upload_dataset(num_workers=...)`` reuse keep-alive TCP/TLS
+connections instead of paying a fresh handshake per request.
+
+The pool can be tuned, or replaced with a caller-provided session::
+
+    from roboflow.adapters import transport
+
+    transport.configure(pool_maxsize=64, timeout=(10, 300))
+
+    session = requests.Session()
+    session.proxies = {"https": "http://proxy:3128"}
+    transport.set_session(session)
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
+Timeout = Union[float, Tuple[float, float], None]
+
+
+class Transport:
+    """Thread-safe wrapper around a pooled ``requests.Session``.
+
+    Args:
+        session: Pre-built session to send requests through. When omitted a
+            session is created lazily with an ``HTTPAdapter`` sized by
+            ``pool_connections`` / ``pool_maxsize``.
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of keep-alive connections kept per host.
+            Should be at least the number of threads issuing requests.
+        max_retries: Connection-level retries passed to ``HTTPAdapter``.
+        timeout: Default ``(connect, read)`` timeout applied to calls that do
+            not pass their own ``timeout=``. ``None`` waits indefinitely,
+            matching ``requests``' own default.
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = 0,
+        timeout: Timeout = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._session = session
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self.max_retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_transport = Transport()
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """Return the transport currently used by the adapters."""
+    return _transport
+
+
+def set_transport(transport: Transport) -> Transport:
+    """Route all adapter requests through ``transport``; returns the previous one.
+
+    The previous transport is not closed, so requests already in flight on it
+    complete normally. Call ``close()`` on the returned object when done.
+    """
+    global _transport
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    return previous
+
+
+def set_session(session: requests.Session) -> Transport:
+    """Inject a caller-owned ``requests.Session`` (proxies, auth, retries, ...)."""
+    return set_transport(Transport(session=session))
+
+
+def configure(
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int = 0,
+    timeout: Timeout = None,
+) -> Transport:
+    """Replace the shared transport with a freshly sized connection pool."""
+    return set_transport(
+        Transport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            timeout=timeout,
+        )
+    )
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return _transport.request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def put(url: str, **kwargs: Any) -> requests.Response:
+    return request("PUT", url, **kwargs)
+
+
+def patch(url: str, **kwargs: Any) -> requests.Response:
+    return request("PATCH", url, **kwargs)
+
+
+def delete(url: str, **kwargs: Any) -> requests.Response:
+    return request("DELETE", url, **kwargs)
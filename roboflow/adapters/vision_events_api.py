@@ -2,9 +2,9 @@ import json
 import os
 from typing import Any, Dict, List, Optional
 
-import requests
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+from roboflow.adapters import transport
 from roboflow.adapters.rfapi import RoboflowError
 from roboflow.config import API_URL
 
@@ -28,7 +28,7 @@ def write_event(api_key: str, event: Dict[str, Any]) -> dict:
     Raises:
         RoboflowError: On non-201 response status codes.
     """
-    response = requests.post(_BASE, json=event, headers=_auth_headers(api_key))
+    response = transport.post(_BASE, json=event, headers=_auth_headers(api_key))
     if response.status_code != 201:
         raise RoboflowError(response.text)
     return response.json()
@@ -47,7 +47,7 @@ def write_batch(api_key: str, events: List[Dict[str, Any]]) -> dict:
     Raises:
         RoboflowError: On non-201 response status codes.
     """
-    response = requests.post(
+    response = transport.post(
         f"{_BASE}/batch",
         json={"events": events},
         headers=_auth_headers(api_key),
@@ -72,7 +72,7 @@ def query(api_key: str, query_params: Dict[str, Any]) -> dict:
     Raises:
         RoboflowError: On non-200 response status codes.
     """
-    response = requests.post(
+    response = transport.post(
         f"{_BASE}/query",
         json=query_params,
         headers=_auth_headers(api_key),
@@ -98,7 +98,7 @@ def list_use_cases(api_key: str, status: Optional[str] = None) -> dict:
     params: Dict[str, str] = {}
     if status is not None:
         params["status"] = status
-    response = requests.get(
+    response = transport.get(
         f"{_BASE}/use-cases",
         params=params,
         headers=_auth_headers(api_key),
@@ -121,7 +121,7 @@ def get_custom_metadata_schema(api_key: str, use_case_id: str) -> dict:
     Raises:
         RoboflowError: On non-200 response status codes.
     """
-    response = requests.get(
+    response = transport.get(
         f"{_BASE}/custom-metadata-schema/{use_case_id}",
         headers=_auth_headers(api_key),
     )
@@ -143,7 +143,7 @@ def create_use_case(api_key: str, name: str) -> dict:
     Raises:
         RoboflowError: On non-201 response status codes.
     """
-    response = requests.post(
+    response = transport.post(
         f"{_BASE}/use-cases",
         json={"name": name},
         headers=_auth_headers(api_key),
@@ -167,7 +167,7 @@ def rename_use_case(api_key: str, use_case_id: str, name: str) -> dict:
     Raises:
         RoboflowError: On non-200 response status codes.
     """
-    response = requests.put(
+    response = transport.put(
         f"{_BASE}/use-cases/{use_case_id}",
         json={"name": name},
         headers=_auth_headers(api_key),
@@ -190,7 +190,7 @@ def archive_use_case(api_key: str, use_case_id: str) -> dict:
     Raises:
         RoboflowError: On non-200 response status codes.
     """
-    response = requests.post(
+    response = transport.post(
         f"{_BASE}/use-cases/{use_case_id}/archive",
         headers=_auth_headers(api_key),
     )
@@ -212,7 +212,7 @@ def unarchive_use_case(api_key: str, use_case_id: str) -> dict:
     Raises:
         RoboflowError: On non-200 response status codes.
     """
-    response = requests.post(
+    response = transport.post(
         f"{_BASE}/use-cases/{use_case_id}/unarchive",
         headers=_auth_headers(api_key),
     )
@@ -253,7 +253,7 @@ def upload_image(
         m = MultipartEncoder(fields=fields)
         headers = _auth_headers(api_key)
         headers["Content-Type"] = m.content_type
-        response = requests.post(f"{_BASE}/upload", data=m, headers=headers)
+        response = transport.post(f"{_BASE}/upload", data=m, headers=headers)
 
     if response.status_code != 201:
         raise RoboflowError(response.text)
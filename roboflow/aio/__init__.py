@@ -0,0 +1,20 @@
+"""Asyncio client for the Roboflow API.
+
+Mirrors ``Workspace`` / ``Project`` / ``Version`` with coroutine methods built
+on ``httpx.AsyncClient``, so many uploads, searches and predictions can be in
+flight on one event loop without a thread per request. Requires the optional
+``httpx`` dependency: ``pip install "roboflow[aio]"``.
+"""
+
+try:
+    import httpx
+except ImportError as exc:
+    raise ImportError(
+        "roboflow.aio requires the 'httpx' package. Install it with: pip install \"roboflow[aio]\""
+    ) from exc
+
+from roboflow.aio.project import AsyncProject
+from roboflow.aio.version import AsyncVersion
+from roboflow.aio.workspace import AsyncWorkspace
+
+__all__ = ["AsyncProject", "AsyncVersion", "AsyncWorkspace"]
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import os
+from random import random
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Optional, Union
+
+from roboflow.adapters.rfapi import AnnotationSaveError, ImageUploadError
+from roboflow.aio import rfapi
+from roboflow.aio.version import AsyncVersion
+from roboflow.util.image_utils import load_labelmap
+
+if TYPE_CHECKING:
+    import httpx
+
+
+async def _retry(max_retries, retry_on, func, *args, **kwargs):
+    """Async twin of ``roboflow.util.general.Retry`` (same jittered exponential backoff).
+
+    Returns ``(result, retries)``; on final failure the exception's ``retries``
+    attribute is set, matching ``Project.upload_image``.
+    """
+    retries = 0
+    while True:
+        try:
+            return await func(*args, **kwargs), retries
+        except retry_on as e:
+            if retries >= max_retries:
+                e.retries = retries
+                raise
+            await asyncio.sleep(int(random() * min(30000, 100 * 2**retries)) / 1000)
+            retries += 1
+
+
+class AsyncProject:
+    """
+    Async counterpart of :class:`roboflow.core.project.Project`.
+
+    Obtain one from :meth:`AsyncWorkspace.project`; it shares the workspace's
+    HTTP client.
+    """
+
+    def __init__(self, api_key: str, a_project: dict, client: httpx.AsyncClient):
+        self.__api_key = api_key
+        self._client = client
+        self.annotation = a_project["annotation"]
+        self.classes = a_project["classes"]
+        self.colors = a_project["colors"]
+        self.created = dt.datetime.fromtimestamp(a_project["created"])
+        self.id = a_project["id"]
+        self.images = a_project["images"]
+        self.name = a_project["name"]
+        self.public = a_project["public"]
+        self.splits = a_project["splits"]
+        self.type = a_project["type"]
+        self.multilabel = a_project.get("multilabel", False)
+        self.unannotated = a_project["unannotated"]
+        self.updated = dt.datetime.fromtimestamp(a_project["updated"])
+
+        self.__workspace, self.__project_name = self.id.rsplit("/")
+
+    async def get_version_information(self) -> List[dict]:
+        info = await rfapi.get_project(self._client, self.__api_key, self.__workspace, self.__project_name)
+        return info["versions"]
+
+    async def versions(self) -> List[AsyncVersion]:
+        return [self._version(v) for v in await self.get_version_information()]
+
+    async def version(self, version_number: Union[int, str]) -> AsyncVersion:
+        for version_info in await self.get_version_information():
+            if os.path.basename(version_info["id"]) == str(version_number):
+                return self._version(version_info)
+        raise RuntimeError(f"Version number {version_number} is not found.")
+
+    def _version(self, version_info: dict) -> AsyncVersion:
+        return AsyncVersion(
+            version_info,
+            self.type,
+            self.__api_key,
+            self.name,
+            os.path.basename(version_info["id"]),
+            workspace=self.__workspace,
+            project=self.__project_name,
+            client=self._client,
+            colors=self.colors,
+        )
+
+    async def upload_image(
+        self,
+        image_path: str,
+        hosted_image: bool = False,
+        split: str = "train",
+        num_retry_uploads: int = 0,
+        batch_name: Optional[str] = None,
+        tag_names: Optional[List[str]] = None,
+        sequence_number: Optional[int] = None,
+        sequence_size: Optional[int] = None,
+        metadata: Optional[Dict] = None,
+        **kwargs,
+    ):
+        """
+        Upload an image; see :meth:`roboflow.core.project.Project.upload_image`.
+
+        Returns:
+            Tuple of ``(response_json, upload_time, retry_attempts)``.
+        """
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        image, retries = await _retry(
+            num_retry_uploads,
+            ImageUploadError,
+            rfapi.upload_image,
+            self._client,
+            self.__api_key,
+            self.__project_name,
+            image_path,
+            hosted_image=hosted_image,
+            split=split,
+            batch_name=batch_name,
+            tag_names=tag_names or [],
+            sequence_number=sequence_number,
+            sequence_size=sequence_size,
+            metadata=metadata,
+            **kwargs,
+        )
+        return image, loop.time() - t0, retries
+
+    async def save_annotation(
+        self,
+        annotation_path=None,
+        annotation_labelmap=None,
+        image_id=None,
+        job_name=None,
+        is_prediction: bool = False,
+        annotation_overwrite=False,
+        num_retry_uploads=0,
+    ):
+        """
+        Save an annotation; see :meth:`roboflow.core.project.Project.save_annotation`.
+
+        Returns:
+            Tuple of ``(response_json, upload_time, retry_attempts)``.
+        """
+        annotation_name, annotation_str = self._annotation_params(annotation_path)
+        loop = asyncio.get_running_loop()
+        t0 = loop.time()
+        annotation, retries = await _retry(
+            num_retry_uploads,
+            AnnotationSaveError,
+            rfapi.save_annotation,
+            self._client,
+            self.__api_key,
+            self.__project_name,
+            annotation_name,
+            annotation_str,
+            image_id,
+            job_name=job_name,
+            is_prediction=is_prediction,
+            annotation_labelmap=annotation_labelmap,
+            overwrite=annotation_overwrite,
+        )
+        return annotation, loop.time() - t0, retries
+
+    async def single_upload(
+        self,
+        image_path=None,
+        annotation_path=None,
+        annotation_labelmap=None,
+        hosted_image=False,
+        image_id=None,
+        split="train",
+        num_retry_uploads=0,
+        batch_name=None,
+        tag_names: Optional[List[str]] = None,
+        is_prediction: bool = False,
+        annotation_overwrite=False,
+        sequence_number=None,
+        sequence_size=None,
+        metadata: Optional[Dict] = None,
+        **kwargs,
+    ):
+        """Upload an image and/or its annotation; same contract as ``Project.single_upload``."""
+        if image_path and image_id:
+            raise Exception("You can't pass both image_id and image_path")
+        if not (image_path or image_id):
+            raise Exception("You need to pass image_path or image_id")
+        if isinstance(annotation_labelmap, str):
+            annotation_labelmap = load_labelmap(annotation_labelmap)
+
+        uploaded_image, uploaded_annotation = None, None
+        upload_time, annotation_time = None, None
+        upload_retry_attempts = 0
+        annotation_upload_retry_attempts = 0
+
+        if image_path:
+            uploaded_image, upload_time, upload_retry_attempts = await self.upload_image(
+                image_path,
+                hosted_image,
+                split,
+                num_retry_uploads,
+                batch_name,
+                tag_names,
+                sequence_number,
+                sequence_size,
+                metadata=metadata,
+                **kwargs,
+            )
+            image_id = uploaded_image["id"]
+
+        if annotation_path and image_id:
+            uploaded_annotation, annotation_time, annotation_upload_retry_attempts = await self.save_annotation(
+                annotation_path,
+                annotation_labelmap,
+                image_id,
+                batch_name,
+                is_prediction,
+                annotation_overwrite,
+                num_retry_uploads=num_retry_uploads,
+            )
+
+        return {
+            "image": uploaded_image,
+            "annotation": uploaded_annotation,
+            "upload_time": upload_time,
+            "annotation_time": annotation_time,
+            "upload_retry_attempts": upload_retry_attempts,
+            "annotation_upload_retry_attempts": annotation_upload_retry_attempts,
+        }
+
+    def _annotation_params(self, annotation_path):
+        if isinstance(annotation_path, dict) and annotation_path.get("rawText"):
+            return annotation_path["name"], annotation_path["rawText"]
+        if os.path.exists(annotation_path):
+            with open(annotation_path) as f:
+                return os.path.basename(annotation_path), f.read()
+        if self.type == "classification":
+            return annotation_path, annotation_path
+        raise Exception(
+            f"File not found or uploading to non-classification type project with invalid string. - {annotation_path}"
+        )
+
+    async def search(
+        self,
+        like_image: Optional[str] = None,
+        prompt: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 100,
+        tag: Optional[str] = None,
+        class_name: Optional[str] = None,
+        in_dataset: Optional[str] = None,
+        batch: bool = False,
+        batch_id: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> List[dict]:
+        """Search for images in the project; see :meth:`roboflow.core.project.Project.search`."""
+        payload: Dict[str, Any] = {
+            "like_image": like_image,
+            "prompt": prompt,
+            "offset": offset,
+            "limit": limit,
+            "tag": tag,
+            "class_name": class_name,
+            "in_dataset": in_dataset,
+            "batch": batch,
+            "batch_id": batch_id,
+        }
+        payload = {k: v for k, v in payload.items() if v is not None}
+        payload["fields"] = fields if fields is not None else ["id", "created", "name", "labels"]
+        return await rfapi.project_search(self._client, self.__api_key, self.__workspace, self.__project_name, payload)
+
+    async def search_all(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        fields: Optional[List[str]] = None,
+        **filters,
+    ) -> AsyncGenerator[List[dict], None]:
+        """Page through :meth:`search` results, yielding one page at a time."""
+        if fields is None:
+            fields = ["id", "created"]
+        while True:
+            data = await self.search(offset=offset, limit=limit, fields=fields, **filters)
+            yield data
+            if len(data) < limit:
+                break
+            offset += limit
+
+    def __repr__(self):
+        return f"<{type(self).__name__} id={self.id}>"
@@ -0,0 +1,239 @@
+"""Async counterparts of the functions in ``roboflow.adapters.rfapi``.
+
+Each function takes the ``httpx.AsyncClient`` to send through as its first
+argument and otherwise mirrors the blocking adapter of the same name: same
+URLs, same payloads, same return values and the same ``RoboflowError``
+subclasses on failure. Response interpretation is shared with the blocking
+adapters so both paths stay in lockstep.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import mimetypes
+import os
+from typing import Any, Dict, List, Optional, Union
+
+import httpx
+
+from roboflow.adapters.rfapi import (
+    AnnotationSaveError,
+    ImageUploadError,
+    RoboflowError,
+    _hosted_upload_url,
+    _local_upload_url,
+    _save_annotation_result,
+    _save_annotation_url,
+    _upload_image_result,
+    _version_export_result,
+)
+from roboflow.config import API_URL, DEFAULT_BATCH_NAME, DEFAULT_JOB_NAME
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+async def check_key(client: httpx.AsyncClient, api_key: str) -> dict:
+    """POST /?api_key= — validate a key and return its workspace binding."""
+    response = await client.post(f"{API_URL}/", params={"api_key": api_key})
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
+
+
+async def get_workspace(client: httpx.AsyncClient, api_key: str, workspace_url: str) -> dict:
+    response = await client.get(f"{API_URL}/{workspace_url}", params={"api_key": api_key})
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
+
+
+async def get_project(client: httpx.AsyncClient, api_key: str, workspace_url: str, project_url: str) -> dict:
+    response = await client.get(f"{API_URL}/{workspace_url}/{project_url}", params={"api_key": api_key})
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
+
+
+async def get_version(
+    client: httpx.AsyncClient,
+    api_key: str,
+    workspace_url: str,
+    project_url: str,
+    version: str,
+    nocache: bool = False,
+) -> dict:
+    params = {"api_key": api_key}
+    if nocache:
+        params["nocache"] = "true"
+    response = await client.get(f"{API_URL}/{workspace_url}/{project_url}/{version}", params=params)
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
+
+
+async def get_version_export(
+    client: httpx.AsyncClient,
+    api_key: str,
+    workspace_url: str,
+    project_url: str,
+    version: str,
+    format: str,
+) -> dict:
+    """See :func:`roboflow.adapters.rfapi.get_version_export`."""
+    response = await client.get(
+        f"{API_URL}/{workspace_url}/{project_url}/{version}/{format}",
+        params={"api_key": api_key, "nocache": "true"},
+    )
+    return _version_export_result(response)
+
+
+async def workspace_search(
+    client: httpx.AsyncClient,
+    api_key: str,
+    workspace_url: str,
+    query: str,
+    page_size: int = 50,
+    fields: Optional[List[str]] = None,
+    continuation_token: Optional[str] = None,
+) -> dict:
+    """See :func:`roboflow.adapters.rfapi.workspace_search`."""
+    payload: Dict[str, Union[str, int, List[str]]] = {
+        "query": query,
+        "pageSize": page_size,
+    }
+    if fields is not None:
+        payload["fields"] = fields
+    if continuation_token is not None:
+        payload["continuationToken"] = continuation_token
+
+    response = await client.post(f"{API_URL}/{workspace_url}/search/v1", params={"api_key": api_key}, json=payload)
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
+
+
+async def project_search(
+    client: httpx.AsyncClient,
+    api_key: str,
+    workspace_url: str,
+    project_url: str,
+    payload: Dict[str, Any],
+) -> List[dict]:
+    """POST /{ws}/{proj}/search — the endpoint behind ``Project.search``."""
+    response = await client.post(
+        f"{API_URL}/{workspace_url}/{project_url}/search", params={"api_key": api_key}, json=payload
+    )
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()["results"]
+
+
+async def upload_image(
+    client: httpx.AsyncClient,
+    api_key: str,
+    project_url: str,
+    image_path: str,
+    hosted_image: bool = False,
+    split: str = "train",
+    batch_name: str = DEFAULT_BATCH_NAME,
+    tag_names: Optional[List[str]] = None,
+    sequence_number: Optional[int] = None,
+    sequence_size: Optional[int] = None,
+    metadata: Optional[Dict] = None,
+    **kwargs,
+) -> dict:
+    """See :func:`roboflow.adapters.rfapi.upload_image`."""
+    coalesced_batch_name = batch_name or DEFAULT_BATCH_NAME
+    if tag_names is None:
+        tag_names = []
+
+    try:
+        if not hosted_image:
+            image_name = os.path.basename(image_path)
+            content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
+            upload_url = _local_upload_url(
+                api_key, project_url, coalesced_batch_name, tag_names, sequence_number, sequence_size, kwargs
+            )
+            data = {"name": image_name, "split": split}
+            if metadata is not None:
+                data["metadata"] = json.dumps(metadata)
+            image_bytes = await asyncio.to_thread(_read_bytes, image_path)
+            response = await client.post(
+                upload_url,
+                data=data,
+                files={"file": (image_name, image_bytes, content_type)},
+                timeout=300,
+            )
+        else:
+            hosted_kwargs = dict(kwargs)
+            if metadata is not None:
+                hosted_kwargs["metadata"] = json.dumps(metadata)
+            upload_url = _hosted_upload_url(
+                api_key, project_url, image_path, split, coalesced_batch_name, tag_names, hosted_kwargs
+            )
+            response = await client.post(upload_url, timeout=300)
+    except httpx.HTTPError as e:
+        raise ImageUploadError(str(e)) from e
+
+    return _upload_image_result(response)
+
+
+async def save_annotation(
+    client: httpx.AsyncClient,
+    api_key: str,
+    project_url: str,
+    annotation_name: str,
+    annotation_string: str,
+    image_id: str,
+    job_name: str = DEFAULT_JOB_NAME,
+    is_prediction: bool = False,
+    annotation_labelmap=None,
+    overwrite: bool = False,
+) -> dict:
+    """See :func:`roboflow.adapters.rfapi.save_annotation`."""
+    upload_url = _save_annotation_url(
+        api_key, project_url, annotation_name, image_id, job_name, is_prediction, overwrite
+    )
+    try:
+        response = await client.post(
+            upload_url,
+            json={"annotationFile": annotation_string, "labelmap": annotation_labelmap},
+            timeout=60,
+        )
+    except httpx.HTTPError as e:
+        raise AnnotationSaveError(str(e)) from e
+
+    return _save_annotation_result(response)
+
+
+async def predict(
+    client: httpx.AsyncClient,
+    api_url: str,
+    api_key: str,
+    image_path: str,
+    **params,
+) -> dict:
+    """POST an image to a hosted model endpoint and return the raw JSON predictions.
+
+    ``image_path`` may be a local file or an ``http(s)`` URL; URLs are passed
+    to the server by reference instead of being uploaded.
+    """
+    query = {"api_key": api_key, **params}
+    if image_path.startswith(("http://", "https://")):
+        query["image"] = image_path
+        response = await client.post(api_url, params=query)
+    else:
+        content_type = mimetypes.guess_type(image_path)[0] or "application/octet-stream"
+        image_bytes = await asyncio.to_thread(_read_bytes, image_path)
+        response = await client.post(
+            api_url,
+            params=query,
+            files={"file": (os.path.basename(image_path), image_bytes, content_type)},
+        )
+    if response.status_code != 200:
+        raise RoboflowError(response.text, status_code=response.status_code)
+    return response.json()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from roboflow.aio import rfapi
+from roboflow.config import (
+    CLASSIFICATION_MODEL,
+    INSTANCE_SEGMENTATION_MODEL,
+    INSTANCE_SEGMENTATION_URL,
+    KEYPOINT_DETECTION_MODEL,
+    OBJECT_DETECTION_MODEL,
+    OBJECT_DETECTION_URL,
+    SEMANTIC_SEGMENTATION_MODEL,
+    TYPE_CLASSICATION,
+    TYPE_INSTANCE_SEGMENTATION,
+    TYPE_KEYPOINT_DETECTION,
+    TYPE_OBJECT_DETECTION,
+    TYPE_SEMANTIC_SEGMENTATION,
+)
+from roboflow.core.version import unwrap_version_id
+
+if TYPE_CHECKING:
+    import httpx
+
+    from roboflow.util.prediction import PredictionGroup
+
+# project type -> the prediction_type PredictionGroup expects
+_PREDICTION_TYPES = {
+    TYPE_OBJECT_DETECTION: OBJECT_DETECTION_MODEL,
+    TYPE_CLASSICATION: CLASSIFICATION_MODEL,
+    TYPE_INSTANCE_SEGMENTATION: INSTANCE_SEGMENTATION_MODEL,
+    TYPE_KEYPOINT_DETECTION: KEYPOINT_DETECTION_MODEL,
+    TYPE_SEMANTIC_SEGMENTATION: SEMANTIC_SEGMENTATION_MODEL,
+}
+
+
+class AsyncVersion:
+    """
+    Async counterpart of :class:`roboflow.core.version.Version`.
+
+    Obtain one from :meth:`AsyncProject.version`; it shares the project's
+    HTTP client.
+    """
+
+    def __init__(
+        self,
+        version_dict: dict,
+        type: str,
+        api_key: str,
+        name: str,
+        version: str,
+        *,
+        workspace: str,
+        project: str,
+        client: httpx.AsyncClient,
+        colors: Optional[dict] = None,
+    ):
+        self.__api_key = api_key
+        self._client = client
+        self.name = name
+        self.version = unwrap_version_id(version_id=version)
+        self.type = type
+        self.augmentation = version_dict["augmentation"]
+        self.created = version_dict["created"]
+        self.id = version_dict["id"]
+        self.images = version_dict["images"]
+        self.preprocessing = version_dict["preprocessing"]
+        self.splits = version_dict["splits"]
+        self.exports = version_dict.get("exports", [])
+        self.workspace = workspace
+        self.project = project
+        self.colors = {} if colors is None else colors
+
+        base_url = INSTANCE_SEGMENTATION_URL if type == TYPE_INSTANCE_SEGMENTATION else OBJECT_DETECTION_URL
+        self.api_url = f"{base_url}/{self.project}/{self.version}"
+
+    async def export(self, model_format: str, poll_interval: float = 1.0) -> dict:
+        """
+        Generate (if needed) and wait for an export in ``model_format``.
+
+        Returns:
+            The ready export payload; ``payload["export"]["link"]`` is the zip URL.
+        """
+        while True:
+            export_info = await rfapi.get_version_export(
+                self._client, self.__api_key, self.workspace, self.project, self.version, model_format
+            )
+            if export_info.get("ready") is not False:
+                break
+            await asyncio.sleep(poll_interval)
+        if "export" not in export_info:
+            raise RuntimeError(f"Unexpected export {export_info}")
+        return export_info
+
+    async def predict(self, image_path: str, prediction_type: Optional[str] = None, **kwargs) -> PredictionGroup:
+        """
+        Run hosted inference on a local image or image URL.
+
+        Args:
+            image_path (str): path or ``http(s)`` URL of the image
+            prediction_type (str): override the prediction type inferred from the project type
+            **kwargs: extra querystring params (``confidence``, ``overlap``, ...)
+
+        Returns:
+            PredictionGroup Object
+        """
+        from roboflow.util.prediction import PredictionGroup
+
+        response = await rfapi.predict(self._client, self.api_url, self.__api_key, image_path, **kwargs)
+        image = response.get("image", {})
+        image_dims = {"width": str(image.get("width", "Undefined")), "height": str(image.get("height", "Undefined"))}
+        return PredictionGroup.create_prediction_group(
+            response,
+            image_path=image_path,
+            prediction_type=prediction_type or _PREDICTION_TYPES.get(self.type),
+            image_dims=image_dims,
+            colors=self.colors,
+        )
+
+    def __repr__(self):
+        return f"<{type(self).__name__} id={self.id}>"
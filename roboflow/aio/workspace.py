@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import AsyncGenerator, List, Optional
+
+import httpx
+
+from roboflow.aio import rfapi
+from roboflow.aio.project import AsyncProject
+from roboflow.config import load_roboflow_api_key
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+DEFAULT_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+class AsyncWorkspace:
+    """
+    Async counterpart of :class:`roboflow.core.workspace.Workspace`.
+
+    All projects and versions obtained from a workspace share its
+    ``httpx.AsyncClient``, so any number of concurrent calls reuse one
+    connection pool on a single event loop.
+
+    Example:
+        >>> from roboflow.aio import AsyncWorkspace
+
+        >>> async with await AsyncWorkspace.load(api_key="") as ws:
+        ...     project = await ws.project("PROJECT_ID")
+        ...     await asyncio.gather(*(project.upload_image(p) for p in paths))
+    """
+
+    def __init__(self, info: dict, api_key: str, client: httpx.AsyncClient, *, owns_client: bool = False):
+        self.__api_key = api_key
+        self._client = client
+        self._owns_client = owns_client
+
+        workspace_info = info["workspace"]
+        self.name = workspace_info["name"]
+        self.project_list = workspace_info["projects"]
+        self.members = workspace_info.get("members")
+        self.url = workspace_info["url"]
+
+    @classmethod
+    async def load(
+        cls,
+        api_key: Optional[str] = None,
+        workspace_url: Optional[str] = None,
+        *,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> "AsyncWorkspace":
+        """
+        Fetch a workspace.
+
+        Args:
+            api_key (str): private roboflow api key; falls back to the configured key
+            workspace_url (str): workspace slug; defaults to the workspace the key belongs to
+            client (httpx.AsyncClient): client to send requests through. When omitted, a
+                pooled client is created and closed by :meth:`aclose` / ``async with``.
+
+        Returns:
+            AsyncWorkspace Object
+        """
+        api_key = api_key or load_roboflow_api_key(workspace_url)
+        if not api_key:
+            raise ValueError("A valid API key must be provided.")
+
+        owns_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(limits=DEFAULT_LIMITS, timeout=DEFAULT_TIMEOUT)
+        try:
+            if workspace_url is None:
+                workspace_url = (await rfapi.check_key(client, api_key))["workspace"]
+            info = await rfapi.get_workspace(client, api_key, workspace_url)
+        except BaseException:
+            if owns_client:
+                await client.aclose()
+            raise
+        return cls(info, api_key, client, owns_client=owns_client)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def project(self, project_id: str) -> AsyncProject:
+        """
+        Retrieve an AsyncProject in this workspace.
+
+        Args:
+            project_id (str): id of the project
+
+        Returns:
+            AsyncProject Object
+        """
+        if "/" in project_id:
+            raise RuntimeError(f"The {project_id} project is not available in this ({self.url}) workspace")
+        info = await rfapi.get_project(self._client, self.__api_key, self.url, project_id)
+        return AsyncProject(self.__api_key, info["project"], self._client)
+
+    async def search(
+        self,
+        query: str,
+        page_size: int = 50,
+        fields: Optional[List[str]] = None,
+        continuation_token: Optional[str] = None,
+    ) -> dict:
+        """Search across all images in the workspace; see :meth:`roboflow.core.workspace.Workspace.search`."""
+        if fields is None:
+            fields = ["tags", "projects", "filename"]
+        return await rfapi.workspace_search(
+            self._client,
+            self.__api_key,
+            self.url,
+            query,
+            page_size=page_size,
+            fields=fields,
+            continuation_token=continuation_token,
+        )
+
+    async def search_all(
+        self,
+        query: str,
+        page_size: int = 50,
+        fields: Optional[List[str]] = None,
+    ) -> AsyncGenerator[List[dict], None]:
+        """Follow ``continuationToken`` through every page of :meth:`search`, yielding one page at a time."""
+        token = None
+        while True:
+            response = await self.search(query, page_size=page_size, fields=fields, continuation_token=token)
+            results = response.get("results", [])
+            if not results:
+                break
+            yield results
+            token = response.get("continuationToken")
+            if not token:
+                break
+
+    def __repr__(self):
+        return f"<{type(self).__name__} url={self.url}>"
@@ -44,6 +44,26 @@ def upload_image(
         bool,
         typer.Option("--no-wait", help="Zip flow: return immediately with task_id instead of polling"),
     ] = False,
+    stream_zip: Annotated[
+        bool,
+        typer.Option("--stream-zip", help="Zip flow: build the archive while uploading instead of a temp zip"),
+    ] = False,
+    chunk_size: Annotated[
+        Optional[int],
+        typer.Option("--chunk-size", help="Zip flow: resumable upload in chunks of this many MiB"),
+    ] = None,
+    journal: Annotated[
+        Optional[str],
+        typer.Option(help="Directory import: SQLite journal file used to resume an interrupted upload"),
+    ] = None,
+    adaptive: Annotated[
+        bool,
+        typer.Option(help="Directory import: adapt concurrency to server latency and errors, up to --concurrency"),
+    ] = False,
+    scan_cache: Annotated[
+        bool,
+        typer.Option(help="Directory import: reuse the folder scan from earlier runs, rereading only what changed"),
+    ] = False,
 ) -> None:
     """Upload an image file or import a directory."""
     args = ctx_to_args(
@@ -61,6 +81,11 @@ def upload_image(
         is_prediction=is_prediction,
         zip_upload=zip_upload,
         no_wait=no_wait,
+        stream_zip=stream_zip,
+        chunk_size=chunk_size,
+        journal=journal,
+        adaptive=adaptive,
+        scan_cache=scan_cache,
     )
     _handle_upload(args)
 
@@ -338,6 +363,7 @@ def _handle_upload_directory(args, api_key: str, path: str) -> None:  # noqa: AN
     tag_raw = getattr(args, "tag", None)
     tags = [t.strip() for t in tag_raw.split(",") if t.strip()] if tag_raw else None
     wait = not getattr(args, "no_wait", False)
+    chunk_size = getattr(args, "chunk_size", None)
 
     try:
         result = workspace.upload_dataset(
@@ -351,6 +377,11 @@ def _handle_upload_directory(args, api_key: str, path: str) -> None:  # noqa: AN
             split=getattr(args, "split", None),
             tags=tags,
             wait=wait,
+            journal_path=getattr(args, "journal", None),
+            adaptive_concurrency=getattr(args, "adaptive", False),
+            stream_zip=getattr(args, "stream_zip", False),
+            zip_chunk_size=chunk_size << 20 if chunk_size else None,
+            scan_manifest=getattr(args, "scan_cache", False),
         )
     except Exception as exc:
         output_error(args, str(exc))
@@ -39,9 +39,13 @@ def download(
     url_or_id: Annotated[str, typer.Argument(help="Dataset URL or shorthand (e.g. ws/project/3)")],
     format: Annotated[str, typer.Option("-f", "--format", help="Export format (default: voc)")] = "voc",
     location: Annotated[Optional[str], typer.Option("-l", "--location", help="Download location")] = None,
+    cache: Annotated[
+        bool,
+        typer.Option(help="Keep exports in a local cache shared across versions and formats; reuse cached exports"),
+    ] = False,
 ) -> None:
     """Download a dataset version."""
-    args = ctx_to_args(ctx, url_or_id=url_or_id, format=format, location=location)
+    args = ctx_to_args(ctx, url_or_id=url_or_id, format=format, location=location, cache=cache)
     _download(args)
 
 
@@ -257,7 +261,7 @@ def _download(args):  # noqa: ANN001
         else:
             version_obj = project.version(int(v))
 
-        version_obj.download(args.format, location=args.location, overwrite=True)
+        version_obj.download(args.format, location=args.location, overwrite=True, cache=getattr(args, "cache", False))
     except SystemExit:
         raise
     except Exception as exc:
@@ -66,6 +66,10 @@ OCR_URL = get_conditional_configuration_variable("OCR_URL", "OCR URL NOT IN ENV"
 
 DEDICATED_DEPLOYMENT_URL = get_conditional_configuration_variable("DEDICATED_DEPLOYMENT_URL", "https://roboflow.cloud")
 
+CACHE_DIR = get_conditional_configuration_variable(
+    "ROBOFLOW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "roboflow")
+)
+
 DEMO_KEYS = ["coco-128-sample", "chess-sample-only-api-key"]
 
 TYPE_CLASSICATION = "classification"
@@ -14,6 +14,7 @@ from roboflow.adapters import rfapi
 from roboflow.adapters.rfapi import AnnotationSaveError, ImageUploadError
 from roboflow.config import API_URL, DEMO_KEYS
 from roboflow.core.version import Version
+from roboflow.util.dedupe_cache import DedupeCache
 from roboflow.util.general import Retry
 from roboflow.util.image_utils import load_labelmap
 
@@ -58,6 +59,8 @@ class Project:
             >>> project = rf.workspace().project("PROJECT_ID")
         """
 
+        self.dedupe_cache: Optional[DedupeCache] = None
+
         if api_key:
             self.__api_key = api_key
             self.annotation = a_project["annotation"]
@@ -501,6 +504,13 @@ class Project:
             tag_names = []
 
         t0 = time.time()
+        digest = None
+        if self.dedupe_cache is not None and not hosted_image:
+            digest = self.dedupe_cache.digest(image_path)
+            cached_id = self.dedupe_cache.get(self.id, digest)
+            if cached_id:
+                return {"id": cached_id, "duplicate": True}, time.time() - t0, 0
+
         upload_retry_attempts = 0
         retry = Retry(num_retry_uploads, ImageUploadError)
 
@@ -524,10 +534,44 @@ class Project:
             e.retries = upload_retry_attempts
             raise e
 
+        if digest and self.dedupe_cache is not None and image.get("id"):
+            self.dedupe_cache.put(self.id, digest, image["id"])
+
         upload_time = time.time() - t0
 
         return image, upload_time, upload_retry_attempts
 
+    def use_dedupe_cache(self, cache: Optional[DedupeCache] = None, warm: bool = False) -> DedupeCache:
+        """
+        Skip uploading images whose content is already known to be in this project.
+
+        Once enabled, :meth:`upload_image` (and so :meth:`single_upload`) hashes each
+        local file and, when the hash was seen before, returns the existing image id
+        as a duplicate without contacting the server.
+
+        Args:
+            cache (DedupeCache): cache to consult; defaults to the shared on-disk cache
+            warm (bool): seed the cache from :meth:`search_all` before returning
+
+        Returns:
+            DedupeCache: the cache now attached to this project
+
+        Example:
+            >>> import roboflow
+
+            >>> rf = roboflow.Roboflow(api_key="")
+
+            >>> project = rf.workspace().project("PROJECT_ID")
+
+            >>> project.use_dedupe_cache(warm=True)
+
+            >>> project.upload_image("image.jpg")
+        """
+        self.dedupe_cache = cache if cache is not None else DedupeCache()
+        if warm:
+            self.dedupe_cache.warm(self)
+        return self.dedupe_cache
+
     def save_annotation(
         self,
         annotation_path=None,
@@ -1087,6 +1131,9 @@ class Project:
             except ValueError:
                 raise RuntimeError(f"Failed to delete images: {response.text}")
 
+        if self.dedupe_cache is not None:
+            self.dedupe_cache.forget(self.id, image_ids)
+
     def delete(self):
         """
         Move this project to Trash (soft delete).
@@ -12,7 +12,7 @@ import requests
 from dotenv import load_dotenv
 from tqdm import tqdm
 
-from roboflow.adapters import rfapi
+from roboflow.adapters import ranged_download, rfapi
 from roboflow.config import (
     API_URL,
     APP_URL,
@@ -34,6 +34,7 @@ from roboflow.models.object_detection import ObjectDetectionModel
 from roboflow.models.semantic_segmentation import SemanticSegmentationModel
 from roboflow.models.vlm import VLMModel
 from roboflow.util.annotations import amend_data_yaml
+from roboflow.util.dataset_cache import DatasetCache
 from roboflow.util.general import extract_zip, write_line
 from roboflow.util.model_processor import package_custom_weights_interactive, validate_model_type_for_project
 from roboflow.util.train_recipe import fold_epochs_into_recipe
@@ -133,7 +134,13 @@ class Version:
             elif self.type == TYPE_SEMANTIC_SEGMENTATION:
                 self.model = SemanticSegmentationModel(self.__api_key, self.id)
             elif self.type == TYPE_KEYPOINT_DETECTION:
-                self.model = KeypointDetectionModel(self.__api_key, self.id, version=version_without_workspace)
+                self.model = KeypointDetectionModel(
+                    self.__api_key,
+                    self.id,
+                    version=version_without_workspace,
+                    colors=self.colors,
+                    preprocessing=self.preprocessing,
+                )
             elif self.type == TYPE_TEXT_IMAGE_PAIRS:
                 self.model = VLMModel(
                     self.__api_key,
@@ -350,18 +357,31 @@ class Version:
                 sys.stdout.flush()
             return
 
-    def download(self, model_format=None, location=None, overwrite: bool = False):
+    def download(
+        self,
+        model_format=None,
+        location=None,
+        overwrite: bool = False,
+        cache: Union[bool, DatasetCache] = False,
+    ):
         """
         Download and extract a ZIP of a version's dataset in a given format
 
         :param model_format: A format to use for downloading
         :param location: An optional path for saving the file
         :param overwrite: An optional flag to prevent dataset overwrite when dataset is already downloaded
+        :param cache: Reuse and populate the local content-addressed dataset cache
 
         Args:
             model_format (str): A format to use for downloading
             location (str): An optional path for saving the file
             overwrite (bool): An optional flag to overwrite an existing dataset if the dataset has already downloaded
+                (a location still holding ``roboflow.zip`` or ``roboflow.zip.partial`` was interrupted and is
+                always resumed)
+            cache (bool | DatasetCache): keep the export in a local cache shared across versions and formats
+                (``~/.cache/roboflow/datasets`` by default, or the given ``DatasetCache``). Images are
+                hardlinked from the cache, so identical images are stored once, and downloading an
+                export that is already cached makes no request for it.
 
         Returns:
             Dataset Object
@@ -371,9 +391,23 @@ class Version:
             HTTPError: If the Network/Roboflow API fails and does not return JSON
         """  # noqa: E501 // docs
 
-        self.__wait_if_generating()
-
         model_format = self.__get_format_identifier(model_format)
+        if cache is True:
+            cache = DatasetCache()
+        workspace, project, *_ = self.id.rsplit("/")
+        cache_key = (workspace, project, self.version, model_format)
+
+        if cache:
+            if location is None:
+                location = self.__get_download_location()
+            incomplete = _interrupted_download(location)
+            if (overwrite or incomplete or not os.path.exists(location)) and cache.restore(cache_key, location):
+                if incomplete:
+                    _discard_interrupted_download(location)
+                self.__reformat_yaml(location, model_format)
+                return Dataset(self.name, self.version, model_format, os.path.abspath(location))
+
+        self.__wait_if_generating()
 
         if model_format not in self.exports:
             self.export(model_format)
@@ -382,31 +416,39 @@ class Version:
 
         if location is None:
             location = self.__get_download_location()
-        if os.path.exists(location) and not overwrite:
+        # a location left behind by an interrupted download is not a dataset yet
+        incomplete = _interrupted_download(location)
+        if os.path.exists(location) and not overwrite and not incomplete:
             return Dataset(self.name, self.version, model_format, os.path.abspath(location))
 
-        if self.__api_key == "coco-128-sample":
-            link = "https://app.roboflow.com/ds/n9QwXwUK42?key=NnVCe2yMxP"
-        else:
-            workspace, project, *_ = self.id.rsplit("/")
-            try:
-                export_info = rfapi.get_version_export(
-                    api_key=self.__api_key,
-                    workspace_url=workspace,
-                    project_url=project,
-                    version=self.version,
-                    format=model_format,
-                )
-            except rfapi.RoboflowError as e:
-                raise RuntimeError(str(e))
+        # the archive is only renamed into place once verified, so after an
+        # interrupted extraction it can be extracted again as is
+        if overwrite or not os.path.exists(os.path.join(location, "roboflow.zip")):
+            if self.__api_key == "coco-128-sample":
+                link = "https://app.roboflow.com/ds/n9QwXwUK42?key=NnVCe2yMxP"
+            else:
+                try:
+                    export_info = rfapi.get_version_export(
+                        api_key=self.__api_key,
+                        workspace_url=workspace,
+                        project_url=project,
+                        version=self.version,
+                        format=model_format,
+                    )
+                except rfapi.RoboflowError as e:
+                    raise RuntimeError(str(e))
 
-            if "ready" in export_info and export_info.get("ready") is False:
-                raise RuntimeError(export_info)
+                if "ready" in export_info and export_info.get("ready") is False:
+                    raise RuntimeError(export_info)
 
-            link = export_info["export"]["link"]
+                link = export_info["export"]["link"]
 
-        self.__download_zip(link, location, model_format)
-        extract_zip(location, desc=f"Extracting Dataset Version Zip to {location} in {model_format}:")
+            # resumes from roboflow.zip.partial when it belongs to the same export
+            self.__download_zip(link, location, model_format)
+        extracted = extract_zip(location, desc=f"Extracting Dataset Version Zip to {location} in {model_format}:")
+        if cache:
+            # only the export's own files: location may hold anything else the user keeps there
+            cache.store(cache_key, location, extracted)
         self.__reformat_yaml(location, model_format)  # TODO: is roboflow-python a place to be munging yaml files?
 
         return Dataset(self.name, self.version, model_format, os.path.abspath(location))
@@ -636,7 +678,9 @@ class Version:
             elif self.type == TYPE_SEMANTIC_SEGMENTATION:
                 self.model = SemanticSegmentationModel(self.__api_key, self.id)
             elif self.type == TYPE_KEYPOINT_DETECTION:
-                self.model = KeypointDetectionModel(self.__api_key, self.id, version=self.version)
+                self.model = KeypointDetectionModel(
+                    self.__api_key, self.id, version=self.version, colors=self.colors, preprocessing=self.preprocessing
+                )
             else:
                 raise ValueError(f"Unsupported model type: {self.type}")
 
@@ -723,20 +767,15 @@ class Version:
             sys.stdout.flush()
 
         try:
-            response = requests.get(link, stream=True)
-
-            # write the zip file to the desired location
-            with open(location + "/roboflow.zip", "wb") as f:
-                total_length = int(response.headers.get("content-length"))  # type: ignore[arg-type]
-                desc = None if TQDM_DISABLE else f"Downloading Dataset Version Zip in {location} to {format}:"
-                for chunk in tqdm(
-                    response.iter_content(chunk_size=1024),
-                    desc=desc,
-                    total=int(total_length / 1024) + 1,
-                ):
-                    if chunk:
-                        f.write(chunk)
-                        f.flush()
+            desc = None if TQDM_DISABLE else f"Downloading Dataset Version Zip in {location} to {format}:"
+            with tqdm(desc=desc, unit="B", unit_scale=True, unit_divisor=1024) as bar:
+
+                def _progress(done, total):
+                    bar.total = total
+                    bar.update(done - bar.n)
+
+                # parallel range requests when the server supports them, one stream otherwise
+                ranged_download.download(link, location + "/roboflow.zip", progress=_progress)
 
         except Exception as e:
             print(f"Error when trying to download dataset @ {link}")
@@ -893,5 +932,18 @@ class Version:
         return json.dumps(json_value, indent=2)
 
 
+def _interrupted_download(location: str) -> bool:
+    """Whether ``location`` holds an export that was not fully downloaded or extracted."""
+    return any(os.path.exists(os.path.join(location, name)) for name in ("roboflow.zip", "roboflow.zip.partial"))
+
+
+def _discard_interrupted_download(location: str) -> None:
+    for name in ("roboflow.zip", "roboflow.zip.partial", "roboflow.zip.partial.json"):
+        try:
+            os.remove(os.path.join(location, name))
+        except FileNotFoundError:
+            pass
+
+
 def unwrap_version_id(version_id: str) -> str:
     return version_id if "/" not in str(version_id) else version_id.rsplit("/", maxsplit=1)[-1]
@@ -1,26 +1,30 @@
 from __future__ import annotations
 
 import concurrent.futures
+import contextlib
 import glob
 import json
 import os
 import sys
 import tempfile
+import threading
 import time
-import zipfile
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional
+import warnings
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Sized, Union
 
 import requests
-from requests.exceptions import HTTPError
 from tqdm import tqdm
 
-from roboflow.adapters import rfapi, vision_events_api
+from roboflow.adapters import ranged_download, rfapi, vision_events_api
 from roboflow.adapters.rfapi import AnnotationSaveError, ImageUploadError, RoboflowError
 from roboflow.config import API_URL, APP_URL, DEMO_KEYS
 
 if TYPE_CHECKING:
     from roboflow.core.device import Device
     from roboflow.core.model_eval import ModelEval
+    from roboflow.util.adaptive_concurrency import AdaptiveConcurrency
+    from roboflow.util.scan_manifest import ScanManifest
 
 
 class Workspace:
@@ -519,6 +523,13 @@ class Workspace:
         wait: bool = True,
         poll_interval: float = 5.0,
         poll_timeout: float = 3600.0,
+        journal_path: Optional[str] = None,
+        dedupe: bool = False,
+        adaptive_concurrency: Union[bool, AdaptiveConcurrency] = False,
+        num_annotation_workers: Optional[int] = None,
+        stream_zip: bool = False,
+        zip_chunk_size: Optional[int] = None,
+        scan_manifest: Union[bool, ScanManifest] = False,
     ) -> Optional[dict]:
         """
         Upload a dataset to Roboflow.
@@ -544,6 +555,33 @@ class Workspace:
             wait (bool, optional): zip flow only — poll for processing completion. Defaults to True.
             poll_interval (float, optional): zip flow only — seconds between status polls.
             poll_timeout (float, optional): zip flow only — total seconds to wait before timing out.
+            journal_path (str, optional): per-image flow only — SQLite file recording each image's upload and
+                annotation status. Rerunning with the same journal skips images that already completed and
+                retries only the failures, so an interrupted upload can resume where it stopped.
+            dedupe (bool, optional): per-image flow only — consult the local content-hash cache (see
+                ``Project.use_dedupe_cache``) and skip sending images already known to be in the project.
+                The cache only knows what this machine uploaded (or what ``DedupeCache.warm`` found): images
+                deleted on the server are still reported as duplicates until ``Project.delete_images`` from this
+                client forgets them or the cache file is removed.
+            adaptive_concurrency (bool | AdaptiveConcurrency, optional): per-image flow only — instead of always
+                running ``num_workers`` uploads at once, start low and grow while latency stays healthy, backing
+                off on 429/5xx responses, timeouts or rising latency. ``True`` uses ``num_workers`` as the ceiling
+                and prints each change; pass an ``AdaptiveConcurrency`` to tune it and read its ``concurrency`` and
+                ``throughput`` while the upload runs.
+            num_annotation_workers (int, optional): per-image flow only — size of the separate pool that saves
+                annotations while the upload workers move on to the next images. Defaults to ``num_workers``.
+            stream_zip (bool, optional): zip flow, directory input only — build the archive while it is being
+                uploaded instead of writing a temporary zip first. The archive's exact size is computed beforehand
+                (deflating the annotation files once, without reading images) so it is sent with a Content-Length;
+                the directory must not change during the upload.
+            zip_chunk_size (int, optional): zip flow only — send the archive through a resumable upload session in
+                chunks of this many bytes (rounded to 256 KiB). A failed chunk is retried on its own instead of
+                restarting the whole upload. The server is asked for a URL that can open a session; when it
+                provides none, or the session cannot be started, a warning is issued and the zip is sent in a
+                single request.
+            scan_manifest (bool | ScanManifest, optional): per-image flow only — remember directory listings and
+                parsed annotation files between runs so rescanning a large, growing folder only reads what changed.
+                ``True`` uses the shared manifest under ``ROBOFLOW_CACHE_DIR``.
 
         Returns:
             dict | None: zip flow returns the final/pending status dict; per-image flow returns None.
@@ -570,9 +608,10 @@ class Workspace:
             project_slug = project.id.rsplit("/")[1]
             temp_zip = None
             try:
-                if dataset_path.lower().endswith(".zip") and os.path.isfile(dataset_path):
+                zip_path = None
+                if is_zip_file:
                     zip_path = dataset_path
-                else:
+                elif not stream_zip:
                     zip_path = temp_zip = _zip_directory(dataset_path)
                     print(f"Zipped {dataset_path} -> {zip_path}")
 
@@ -583,9 +622,21 @@ class Workspace:
                     split=split,
                     tags=tags,
                     batch_name=batch_name,
+                    resumable=bool(zip_chunk_size),
                 )
                 print(f"Uploading zip to Roboflow (task_id={init['taskId']})...")
-                rfapi.upload_zip_to_signed_url(init["signedUrl"], zip_path)
+                from roboflow.util import zipstream
+
+                if zip_chunk_size and _upload_zip_resumable(
+                    init.get("resumableUrl"), zip_path or zipstream.iter_zip(dataset_path), zip_chunk_size
+                ):
+                    print("Zip uploaded.")
+                elif zip_path is None:
+                    rfapi.upload_zip_stream_to_signed_url(
+                        init["signedUrl"], zipstream.iter_zip(dataset_path), zipstream.zip_size(dataset_path)
+                    )
+                else:
+                    rfapi.upload_zip_to_signed_url(init["signedUrl"], zip_path)
 
                 if not wait:
                     print(f"Zip uploaded; not waiting for processing. task_id={init['taskId']}")
@@ -596,17 +647,27 @@ class Workspace:
                 if temp_zip and os.path.exists(temp_zip):
                     os.unlink(temp_zip)
 
-        from roboflow.util import folderparser
+        from roboflow.util import adaptive_concurrency as aimd
+        from roboflow.util import dispatch, folderparser, upload_journal
+        from roboflow.util import scan_manifest as manifests
         from roboflow.util.image_utils import load_labelmap
 
         is_classification = project.type == "classification"
-        parsed_dataset = folderparser.parsefolder(dataset_path, is_classification=is_classification)
+        manifest = manifests.ScanManifest() if scan_manifest is True else scan_manifest or None
+        parsed_dataset = folderparser.parsefolder(
+            dataset_path, is_classification=is_classification, lazy=True, manifest=manifest
+        )
+        # ``images`` may be a list or a lazy iterator; it is consumed only as workers free up,
+        # so each image's annotation payload is built just before it is needed.
         images = parsed_dataset["images"]
+        sequence_size = len(images) if isinstance(images, Sized) else None
         if split is not None:
-            for image in images:
-                image["split"] = split
+            images = (dict(image, split=split) for image in images)
 
         location = parsed_dataset["location"]
+        opened_dedupe_cache = dedupe and project.dedupe_cache is None
+        if opened_dedupe_cache:
+            project.use_dedupe_cache()
 
         def _log_img_upload(
             image_path, image, annotation, image_upload_time, image_upload_retry_attempts, annotation_time
@@ -619,7 +680,9 @@ class Workspace:
             annotation_time_str = f"[{annotation_time:.1f}s]" if annotation_time else ""
             retry_attempts = f" (with {image_upload_retry_attempts} retries)" if image_upload_retry_attempts > 0 else ""
 
-            if img_duplicate:
+            if image.get("resumed"):
+                msg = f"[RESUMED] {image_path} ({image_id})"
+            elif img_duplicate:
                 msg = f"[DUPLICATE]{retry_attempts} {image_path} ({image_id}) {upload_time_str}"
             elif img_success:
                 msg = f"[UPLOADED]{retry_attempts} {image_path} ({image_id}) {upload_time_str}"
@@ -635,27 +698,43 @@ class Workspace:
 
             print(msg)
 
+        if adaptive_concurrency is True:
+            limiter: Optional[AdaptiveConcurrency] = aimd.AdaptiveConcurrency(
+                max_concurrency=num_workers,
+                on_change=lambda n, rate: print(f"[CONCURRENCY] {n} workers ({rate:.1f} images/s)"),
+            )
+        else:
+            limiter = adaptive_concurrency or None
+
         def _upload_image(imagedesc):
             image_path = f"{location}{imagedesc['file']}"
             split = imagedesc["split"]
 
-            image, upload_time, upload_retry_attempts = project.upload_image(
-                image_path=image_path,
-                split=split,
-                batch_name=batch_name,
-                sequence_number=imagedesc.get("index"),
-                sequence_size=len(images),
-                num_retry_uploads=num_retries,
-            )
+            # answer dedupe hits before taking a slot: their near-zero latency is
+            # not a network round trip and would skew the limiter's baseline
+            if limiter is not None and project.dedupe_cache is not None:
+                cached_id = project.dedupe_cache.get(project.id, project.dedupe_cache.digest(image_path))
+                if cached_id:
+                    return {"id": cached_id, "duplicate": True}, 0.0, 0
+
+            with limiter.slot() if limiter is not None else contextlib.nullcontext():
+                image, upload_time, upload_retry_attempts = project.upload_image(
+                    image_path=image_path,
+                    split=split,
+                    batch_name=batch_name,
+                    sequence_number=imagedesc.get("index"),
+                    sequence_size=sequence_size,
+                    num_retry_uploads=num_retries,
+                )
 
             return image, upload_time, upload_retry_attempts
 
-        def _save_annotation(image_id, imagedesc):
+        def _annotation_target(imagedesc):
             labelmap = None
             annotation_path = None
 
             annotationdesc = imagedesc.get("annotationfile")
-            if isinstance(annotationdesc, dict):
+            if isinstance(annotationdesc, Mapping):
                 if annotationdesc.get("type") == "classification_folder":
                     annotation_path = annotationdesc.get("classification_label")
                 elif annotationdesc.get("type") == "classification_multilabel":
@@ -666,12 +745,11 @@ class Workspace:
                     annotation_path = f"{location}{annotationdesc['file']}"
                     labelmap = annotationdesc.get("labelmap")
 
-                if isinstance(labelmap, str):
-                    labelmap = load_labelmap(labelmap)
+            return annotation_path, labelmap
 
-            # If annotation_path is still None at this point, then no annotation will be saved.
-            if annotation_path is None:
-                return None, None
+        def _save_annotation(image_id, annotation_path, labelmap):
+            if isinstance(labelmap, str):
+                labelmap = load_labelmap(labelmap)
 
             annotation, upload_time, _retry_attempts = project.save_annotation(
                 annotation_path=annotation_path,
@@ -684,32 +762,96 @@ class Workspace:
 
             return annotation, upload_time
 
+        journal = upload_journal.UploadJournal(journal_path) if journal_path else None
+
+        # Image uploads and annotation saves run in separate pools so a slow
+        # annotation POST never holds an upload slot. The semaphore bounds the
+        # annotation backlog: when it is full, image workers wait for it to drain.
+        annotation_workers = num_annotation_workers or num_workers
+        annotation_slots = threading.BoundedSemaphore(2 * annotation_workers)
+
         def _upload(imagedesc):
             image_path = f"{location}{imagedesc['file']}"
 
-            image_id = None
-            image_upload_time = None
-            image_retry_attempts = None
+            journal_key = None
+            entry = None
 
             try:
-                image, image_upload_time, image_retry_attempts = _upload_image(imagedesc)
-                image_id = image["id"]
-                annotation, annotation_time = _save_annotation(image_id, imagedesc)
-                _log_img_upload(image_path, image, annotation, image_upload_time, image_retry_attempts, annotation_time)
+                if journal is not None:
+                    journal_key = journal.key(project.id, image_path)
+                    entry = journal.lookup(journal_key)
+                    if entry and journal.is_complete(entry):
+                        print(f"[SKIPPED] {image_path} ({entry['image_id']}) already uploaded")
+                        return
+
+                if entry and entry["image_status"] == upload_journal.IMAGE_UPLOADED:
+                    image, image_upload_time, image_retry_attempts = {"id": entry["image_id"], "resumed": True}, 0.0, 0
+                else:
+                    image, image_upload_time, image_retry_attempts = _upload_image(imagedesc)
+                    if journal is not None and journal_key:
+                        journal.record_image(journal_key, image["id"])
             except ImageUploadError as e:
                 retry_attempts = f" (with {e.retries} retries)" if e.retries > 0 else ""
                 print(f"[ERR]{retry_attempts} {image_path} ({e.message})")
+                if journal is not None and journal_key:
+                    journal.record_image_failure(journal_key, str(e.message))
+                return
+            except Exception as e:
+                print(f"[ERR] {image_path} ({e})")
+                if journal is not None and journal_key:
+                    journal.record_image_failure(journal_key, str(e))
+                return
+
+            upload = (image_path, image, image_upload_time, image_retry_attempts, journal_key)
+            annotation_path, labelmap = _annotation_target(imagedesc)
+            if annotation_path is None:
+                # No annotation for this image: it is done once the upload is.
+                if journal is not None and journal_key:
+                    journal.record_annotation(journal_key, upload_journal.ANNOTATION_NONE)
+                _log_img_upload(image_path, image, None, image_upload_time, image_retry_attempts, None)
+                return
+
+            annotation_slots.acquire()
+            try:
+                annotation_executor.submit(_annotate, upload, annotation_path, labelmap)
+            except BaseException:
+                annotation_slots.release()
+                raise
+
+        def _annotate(upload, annotation_path, labelmap):
+            image_path, image, image_upload_time, image_retry_attempts, journal_key = upload
+            try:
+                annotation, annotation_time = _save_annotation(image["id"], annotation_path, labelmap)
+                if journal is not None and journal_key:
+                    status = upload_journal.ANNOTATION_SAVED if annotation else upload_journal.ANNOTATION_NONE
+                    journal.record_annotation(journal_key, status)
+                _log_img_upload(image_path, image, annotation, image_upload_time, image_retry_attempts, annotation_time)
             except AnnotationSaveError as e:
                 upload_time_str = f"[{image_upload_time:.1f}s]"
                 retry_attempts = f" (with {image_retry_attempts} retries)" if image_retry_attempts > 0 else ""
-                image_msg = f"[UPLOADED]{retry_attempts} {image_path} ({image_id}) {upload_time_str}"
+                image_msg = f"[UPLOADED]{retry_attempts} {image_path} ({image['id']}) {upload_time_str}"
                 annotation_msg = f"annotations = ERR: {e.message}"
                 print(f"{image_msg} / {annotation_msg}")
+                if journal is not None and journal_key:
+                    journal.record_annotation(journal_key, upload_journal.ANNOTATION_FAILED, str(e.message))
             except Exception as e:
                 print(f"[ERR] {image_path} ({e})")
+                if journal is not None and journal_key:
+                    journal.record_annotation(journal_key, upload_journal.ANNOTATION_FAILED, str(e))
+            finally:
+                annotation_slots.release()
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
-            list(executor.map(_upload, images))
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=annotation_workers) as annotation_executor:
+                dispatch.run_bounded(_upload, images, max_workers=num_workers)
+        finally:
+            if journal is not None:
+                journal.close()
+            if scan_manifest is True and manifest is not None:
+                manifest.close()
+            if opened_dedupe_cache and project.dedupe_cache is not None:
+                project.dedupe_cache.close()
+                project.dedupe_cache = None
 
         return None
 
@@ -1153,26 +1295,17 @@ class Workspace:
             os.makedirs(location)
 
         zip_path = os.path.join(location, "roboflow.zip")
-        response = session.get(download_url, stream=True)
-        try:
-            response.raise_for_status()
-        except HTTPError as e:
-            raise RoboflowError(f"Failed to download search export: {e}")
+        with tqdm(desc=f"Downloading search export to {location}", unit="B", unit_scale=True, unit_divisor=1024) as bar:
 
-        total_length = response.headers.get("content-length")
-        try:
-            total_kib = int(total_length) // 1024 + 1 if total_length is not None else None
-        except (TypeError, ValueError):
-            total_kib = None
-        with open(zip_path, "wb") as f:
-            for chunk in tqdm(
-                response.iter_content(chunk_size=1024),
-                desc=f"Downloading search export to {location}",
-                total=total_kib,
-            ):
-                if chunk:
-                    f.write(chunk)
-                    f.flush()
+            def _progress(done, total):
+                bar.total = total
+                bar.update(done - bar.n)
+
+            # resumes an interrupted download and verifies size/checksum before extraction
+            try:
+                ranged_download.download(download_url, zip_path, progress=_progress)
+            except ranged_download.DownloadError as e:
+                raise RoboflowError(f"Failed to download search export: {e}") from e
 
         if extract_zip:
             _extract_zip(location, desc=f"Extracting search export to {location}")
@@ -1676,21 +1809,46 @@ class Workspace:
 
 
 def _zip_directory(src_dir: str) -> str:
-    """Zip src_dir into a temp file, skipping hidden and macOS-junk entries."""
+    """Zip src_dir into a temp file, skipping hidden and macOS-junk entries.
+
+    Already-compressed images are stored; other files are deflated in parallel.
+    """
+    from roboflow.util import zipstream
+
     fd, zip_path = tempfile.mkstemp(suffix=".zip", prefix="roboflow-upload-")
-    os.close(fd)
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        for root, dirs, files in os.walk(src_dir):
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__MACOSX"]
-            for name in files:
-                if name.startswith(".") or name == "Thumbs.db":
-                    continue
-                abs_path = os.path.join(root, name)
-                rel = os.path.relpath(abs_path, src_dir)
-                zf.write(abs_path, arcname=rel)
+    with os.fdopen(fd, "wb") as fh:
+        zipstream.write_zip(src_dir, fh)
     return zip_path
 
 
+def _upload_zip_resumable(resumable_url: Optional[str], source, chunk_size: int) -> bool:
+    """Upload through a resumable session; return False (with a warning) if none can be started."""
+    from roboflow.adapters import resumable_upload
+
+    # the PUT ``signedUrl`` cannot open a session: its signature does not cover the starting POST
+    if not resumable_url:
+        warnings.warn(
+            "The server did not provide a resumable upload URL; sending the zip in a single request",
+            stacklevel=3,
+        )
+        return False
+    try:
+        session_url = resumable_upload.start_session(resumable_url)
+    except resumable_upload.ResumableUploadError as e:
+        warnings.warn(f"Resumable upload unavailable ({e}); sending the zip in a single request", stacklevel=3)
+        return False
+
+    total = os.path.getsize(source) if isinstance(source, str) else None
+    with tqdm(total=total, unit="B", unit_scale=True, desc="Uploading zip") as bar:
+
+        def _progress(sent: int, _total: Optional[int]) -> None:
+            bar.total = _total
+            bar.update(sent - bar.n)
+
+        resumable_upload.upload(session_url, source, chunk_size=chunk_size, progress=_progress)
+    return True
+
+
 def _poll_zip_status(
     api_key: str,
     workspace_url: str,
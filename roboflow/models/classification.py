@@ -5,13 +5,14 @@ import os
 import urllib
 from typing import Optional
 
-import requests
 from PIL import Image
 
+from roboflow.adapters import transport
 from roboflow.config import CLASSIFICATION_MODEL
 from roboflow.models.inference import InferenceModel
 from roboflow.util.image_utils import check_image_url
 from roboflow.util.prediction import PredictionGroup
+from roboflow.util.preprocessing import DISABLE_STATIC_CROP_PARAM, Preprocessor
 
 
 class ClassificationModel(InferenceModel):
@@ -91,24 +92,30 @@ class ClassificationModel(InferenceModel):
         if not hosted:
             # Open Image in RGB Format
             image = Image.open(image_path).convert("RGB")
+            img_dims = image.size
+            # Crop and shrink to the preprocessing settings before sending
+            preprocessor = Preprocessor(self.preprocessing)
+            crop, _ = preprocessor.plan(image.size)
+            # (labels have no coordinates, so nothing needs mapping back)
+            image, _ = preprocessor.apply(image)
             # Create buffer
             buffered = io.BytesIO()
             image.save(buffered, quality=90, format="JPEG")
-            img_dims = image.size
             # Base64 encode image
             img_str = base64.b64encode(buffered.getvalue())
             img_str = img_str.decode("ascii")
             # Post to API and return response
-            resp = requests.post(
-                self.api_url,
+            resp = transport.post(
+                self.api_url + (f"&{DISABLE_STATIC_CROP_PARAM}=true" if crop is not None else ""),
                 data=img_str,
                 headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
         else:
             # Create API URL for hosted image (slightly different)
-            self.api_url += "&image=" + urllib.parse.quote_plus(image_path)
+            # not stored on self: predict_batch may call predict from several threads
+            hosted_url = self.api_url + "&image=" + urllib.parse.quote_plus(image_path)
             # POST to the API
-            resp = requests.post(self.api_url)
+            resp = transport.post(hosted_url)
             img_dims = {"width": "0", "height": "0"}
 
         if resp.status_code != 200:
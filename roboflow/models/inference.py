@@ -3,7 +3,7 @@ import json
 import os
 import time
 import urllib
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -11,9 +11,12 @@ from PIL import Image
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 from tqdm import tqdm
 
+from roboflow.adapters import transport
 from roboflow.config import API_URL
-from roboflow.util.image_utils import validate_image_path
+from roboflow.util import dispatch
+from roboflow.util.image_utils import encode_frame, validate_image_path
 from roboflow.util.prediction import PredictionGroup
+from roboflow.util.preprocessing import DISABLE_STATIC_CROP_PARAM, Preprocessor, Transform
 
 SUPPORTED_ROBOFLOW_MODELS = ["batch-video"]
 
@@ -31,6 +34,22 @@ SUPPORTED_ADDITIONAL_MODELS = {
 }
 
 
+class PredictionError(Exception):
+    """
+    A failed prediction from :meth:`InferenceModel.predict_batch`.
+
+    The original exception is available as ``__cause__``.
+
+    Args:
+        image_path: the image that could not be predicted
+        message (str): description of the failure
+    """
+
+    def __init__(self, image_path, message: str):
+        super().__init__(message)
+        self.image_path = image_path
+
+
 class InferenceModel:
     def __init__(
         self,
@@ -61,26 +80,32 @@ class InferenceModel:
         """
         Get parameters about an image (i.e. dimensions) for use in an inference request.
 
+        Local images are cropped and shrunk to the model's preprocessing settings first.
+
         Args:
             image_path (Union[str, np.ndarray]): path to image or numpy array
 
         Returns:
-            Tuple containing a dict of querystring params and a dict of requests kwargs
+            Tuple containing a dict of querystring params, a dict of requests kwargs,
+            the image dimensions and the Transform mapping predictions back to them
 
         Raises:
             Exception: Image path is not valid
         """
         import numpy as np
 
+        preprocessor = Preprocessor(getattr(self, "preprocessing", None))
         if isinstance(image_path, np.ndarray):
-            # Convert numpy array to PIL Image
-            image = Image.fromarray(image_path)
-            dimensions = image.size
-            image_dims = {"width": str(dimensions[0]), "height": str(dimensions[1])}
-            buffered = io.BytesIO()
-            image.save(buffered, quality=90, format="JPEG")
-            data = MultipartEncoder(fields={"file": ("imageToUpload", buffered.getvalue(), "image/jpeg")})
-            return {}, {"data": data, "headers": {"Content-Type": data.content_type}}, image_dims
+            # RGB(A) array: a single JPEG encoder call, no PIL round trip
+            crop, _ = preprocessor.plan((image_path.shape[1], image_path.shape[0]))
+            payload, image_dims, transform = encode_frame(image_path, bgr=False, quality=90, preprocessor=preprocessor)
+            data = MultipartEncoder(fields={"file": ("imageToUpload", payload, "image/jpeg")})
+            return (
+                {DISABLE_STATIC_CROP_PARAM: "true"} if crop is not None else {},
+                {"data": data, "headers": {"Content-Type": data.content_type}},
+                image_dims,
+                transform,
+            )
 
         validate_image_path(image_path)
 
@@ -88,18 +113,21 @@ class InferenceModel:
 
         if hosted_image:
             image_dims = {"width": "Undefined", "height": "Undefined"}
-            return {"image": image_path}, {}, image_dims
+            return {"image": image_path}, {}, image_dims, Transform()
 
         image = Image.open(image_path)
         dimensions = image.size
         image_dims = {"width": str(dimensions[0]), "height": str(dimensions[1])}
+        crop, _ = preprocessor.plan(image.size)
+        image, transform = preprocessor.apply(image)
         buffered = io.BytesIO()
         image.save(buffered, quality=90, format="JPEG")
         data = MultipartEncoder(fields={"file": ("imageToUpload", buffered.getvalue(), "image/jpeg")})
         return (
-            {},
+            {DISABLE_STATIC_CROP_PARAM: "true"} if crop is not None else {},
             {"data": data, "headers": {"Content-Type": data.content_type}},
             image_dims,
+            transform,
         )
 
     def predict(self, image_path, prediction_type=None, **kwargs):
@@ -128,23 +156,72 @@ class InferenceModel:
 
             >>> prediction = model.predict("YOUR_IMAGE.jpg")
         """
-        params, request_kwargs, image_dims = self.__get_image_params(image_path)
+        params, request_kwargs, image_dims, transform = self.__get_image_params(image_path)
 
         params["api_key"] = self.__api_key
 
         params.update(**kwargs)
         url = f"{self.api_url}?{urllib.parse.urlencode(params)}"  # type: ignore[attr-defined]
-        response = requests.post(url, **request_kwargs)
+        response = transport.post(url, **request_kwargs)
         response.raise_for_status()
+        response_json = response.json()
+        if isinstance(response_json, dict) and isinstance(response_json.get("predictions"), list):
+            transform.rescale_predictions(response_json["predictions"])
 
         return PredictionGroup.create_prediction_group(
-            response.json(),
+            response_json,
             image_path=image_path,
             prediction_type=prediction_type,
             image_dims=image_dims,
             colors=self.colors,
         )
 
+    def predict_batch(
+        self, images: Iterable, concurrency: int = 8, ordered: bool = True, **kwargs
+    ) -> Iterator[Union[PredictionGroup, PredictionError]]:
+        """
+        Run ``predict`` on many images with several requests in flight.
+
+        Images are read from ``images`` lazily and at most ``2 * concurrency``
+        are loaded or waiting at any time, so a generator over a large folder
+        is fine. Requests share the pooled connections of
+        ``roboflow.adapters.transport``; for ``concurrency`` above its pool size
+        (32) raise it with ``transport.configure(pool_maxsize=...)``.
+
+        A failing image does not stop the batch: it is yielded as a
+        :class:`PredictionError` (carrying ``image_path``) in place of its
+        ``PredictionGroup``.
+
+        Args:
+            images (Iterable): image paths, URLs or arrays accepted by ``predict``
+            concurrency (int): number of requests in flight
+            ordered (bool): yield results in the order of ``images``; otherwise as they complete
+            **kwargs: passed to ``predict`` for every image
+
+        Returns:
+            Iterator of PredictionGroup (or PredictionError) objects
+
+        Example:
+            >>> import glob
+
+            >>> for result in model.predict_batch(glob.glob("images/*.jpg"), concurrency=16):
+            ...     if isinstance(result, PredictionError):
+            ...         print(result.image_path, result)
+            ...     else:
+            ...         print(result.json())
+        """
+        for image, future in dispatch.imap_bounded(
+            lambda image: self.predict(image, **kwargs), images, max_workers=concurrency, ordered=ordered
+        ):
+            error = future.exception()
+            if error is None:
+                yield future.result()
+                continue
+            name = image if isinstance(image, str) else type(image).__name__
+            failure = PredictionError(image, f"Prediction failed for {name}: {error}")
+            failure.__cause__ = error
+            yield failure
+
     def predict_video(
         self,
         video_path: str,
@@ -1,5 +1,4 @@
 import base64
-import copy
 import io
 import json
 import os
@@ -8,13 +7,21 @@ import urllib
 
 import requests
 from PIL import Image
+from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+from roboflow.adapters import transport
 from roboflow.config import OBJECT_DETECTION_MODEL, OBJECT_DETECTION_URL
 from roboflow.models.inference import InferenceModel
-from roboflow.util.image_utils import check_image_url
+from roboflow.util.image_utils import check_image_url, encode_frame
 from roboflow.util.prediction import PredictionGroup
+from roboflow.util.preprocessing import DISABLE_STATIC_CROP_PARAM, Preprocessor, Transform
 from roboflow.util.versions import print_warn_for_wrong_dependencies_versions
 
+ENCODINGS = ("png", "jpeg", "passthrough")
+
+# EXIF orientation tag; servers may apply it when decoding an untouched JPEG
+_EXIF_ORIENTATION = 0x0112
+
 
 class ObjectDetectionModel(InferenceModel):
     """
@@ -36,6 +43,9 @@ class ObjectDetectionModel(InferenceModel):
         format="json",
         colors=None,
         preprocessing=None,
+        encoding="png",
+        jpeg_quality=90,
+        multipart=False,
     ):
         """
         Create a ObjectDetectionModel object through which you can run inference.
@@ -61,6 +71,14 @@ class ObjectDetectionModel(InferenceModel):
                         - 'json': returns an array of JSON predictions (See response format tab).
                         - 'image': returns an image with annotated predictions as a binary blob with a Content-Type
                                     of image/jpeg.
+            encoding (str): How local image files are encoded for the request.
+                        - 'png': decode and re-encode losslessly as PNG (largest payload, slowest).
+                        - 'jpeg': decode and re-encode as JPEG at `jpeg_quality`.
+                        - 'passthrough': send JPEG files as they are, without decoding them; other files
+                                    (and JPEGs that must be resized or rotated) are re-encoded as JPEG.
+            jpeg_quality (int): JPEG quality (1-95) for the 'jpeg' and 'passthrough' encodings.
+            multipart (bool): Send the image bytes as multipart/form-data instead of a base64 string, which is
+                        a third larger.
         """  # noqa: E501 // docs
         # Instantiate different API URL parameters
         # To be moved to predict
@@ -77,6 +95,9 @@ class ObjectDetectionModel(InferenceModel):
         self.format = format
         self.colors = {} if colors is None else colors
         self.preprocessing = {} if preprocessing is None else preprocessing
+        self.encoding = _check_encoding(encoding)
+        self.jpeg_quality = jpeg_quality
+        self.multipart = multipart
 
         # local needs to be passed from Project
         if local is None:
@@ -133,6 +154,9 @@ class ObjectDetectionModel(InferenceModel):
         confidence=40,
         stroke=1,
         labels=False,
+        encoding=None,
+        jpeg_quality=None,
+        multipart=None,
     ):
         """
         Infers detections based on image from specified model and image path.
@@ -141,6 +165,9 @@ class ObjectDetectionModel(InferenceModel):
             image_path (str): path to the image you'd like to perform prediction on
             hosted (bool): whether the image you're providing is hosted on Roboflow
             format (str): The format of the output.
+            encoding (str): 'png', 'jpeg' or 'passthrough'; overrides the model's `encoding` for this call
+            jpeg_quality (int): overrides the model's `jpeg_quality` for this call
+            multipart (bool): overrides the model's `multipart` for this call
 
         Returns:
             PredictionGroup Object
@@ -172,97 +199,69 @@ class ObjectDetectionModel(InferenceModel):
         else:
             self.__exception_check(image_path_check=image_path)
 
-        original_dimensions = None
-        should_resize = False
+        transform = Transform()
         # If image is local image
         if not hosted:
-            import cv2
             import numpy as np
 
-            should_resize = (
-                "resize" in self.preprocessing.keys() and "Stretch" in self.preprocessing["resize"]["format"]
-            )
-
             if isinstance(image_path, str):
-                image = Image.open(image_path).convert("RGB")
-                dimensions = image.size
-                original_dimensions = copy.deepcopy(dimensions)
+                encoding = _check_encoding(encoding or self.encoding)
+                quality = jpeg_quality or self.jpeg_quality
+                image = Image.open(image_path)
+                original_dimensions = image.size
 
-                # Here we resize the image to the preprocessing settings
+                # Crop and shrink the image to the preprocessing settings
                 # before sending it over the wire
-                if should_resize:
-                    if dimensions[0] > int(self.preprocessing["resize"]["width"]) or dimensions[1] > int(
-                        self.preprocessing["resize"]["height"]
-                    ):
-                        image = image.resize(
-                            (
-                                int(self.preprocessing["resize"]["width"]),
-                                int(self.preprocessing["resize"]["height"]),
-                            )
-                        )
-                        dimensions = image.size
-
-                # Create buffer
-                buffered = io.BytesIO()
-                image.save(buffered, format="PNG")
-                # Base64 encode image
-                img_str = base64.b64encode(buffered.getvalue())
-                img_str = img_str.decode("ascii")
-                # Post to API and return response
-                resp = requests.post(
-                    self.api_url,
-                    data=img_str,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
+                preprocessor = Preprocessor(self.preprocessing)
+                crop, size = preprocessor.plan(image.size)
+                api_url = self.api_url
+                if crop is not None:
+                    api_url += f"&{DISABLE_STATIC_CROP_PARAM}=true"
+
+                if encoding == "passthrough" and crop is None and size == image.size and _is_plain_jpeg(image):
+                    # the file is already what we would send: skip decoding and re-encoding it
+                    image.close()
+                    with open(image_path, "rb") as f:
+                        payload, mime = f.read(), "image/jpeg"
+                else:
+                    image, transform = preprocessor.apply(image.convert("RGB"))
+                    payload, mime = _encode_image(image, encoding, quality)
+
+                resp = self.__post_image(payload, mime, self.multipart if multipart is None else multipart, api_url)
 
                 image_dims = {
                     "width": str(original_dimensions[0]),
                     "height": str(original_dimensions[1]),
                 }
             elif isinstance(image_path, np.ndarray):
-                # Performing inference on a OpenCV2 frame
-                retval, buffer = cv2.imencode(".jpg", image_path)
-                # Currently cv2.imencode does not properly return shape
-                dimensions = buffer.shape
-                img_str = base64.b64encode(buffer)  # type: ignore[arg-type]
-                img_str = img_str.decode("ascii")
-                resp = requests.post(
-                    self.api_url,
-                    data=img_str,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                # Performing inference on a OpenCV2 (BGR) frame
+                preprocessor = Preprocessor(self.preprocessing)
+                crop, _ = preprocessor.plan((image_path.shape[1], image_path.shape[0]))
+                payload, image_dims, transform = encode_frame(
+                    image_path, bgr=True, quality=jpeg_quality or self.jpeg_quality, preprocessor=preprocessor
+                )
+                api_url = self.api_url
+                if crop is not None:
+                    api_url += f"&{DISABLE_STATIC_CROP_PARAM}=true"
+                resp = self.__post_image(
+                    payload, "image/jpeg", self.multipart if multipart is None else multipart, api_url
                 )
-                # Replace with dimensions variable once
-                # cv2.imencode shape solution is found
-                image_dims = {"width": "0", "height": "0"}
             else:
                 raise ValueError("image_path must be a string or a numpy array.")
         else:
             # Create API URL for hosted image (slightly different)
-            self.api_url += "&image=" + urllib.parse.quote_plus(image_path)
+            # not stored on self: predict_batch may call predict from several threads
+            hosted_url = self.api_url + "&image=" + urllib.parse.quote_plus(image_path)
             image_dims = {"width": "0", "height": "0"}
             # POST to the API
-            resp = requests.post(self.api_url)
+            resp = transport.post(hosted_url)
 
         resp.raise_for_status()
         # Return a prediction group if JSON data
         if self.format == "json":
             resp_json = resp.json()
 
-            if should_resize and original_dimensions is not None:
-                new_preds = []
-                for p in resp_json["predictions"]:
-                    p["x"] = int(p["x"] * (int(original_dimensions[0]) / int(self.preprocessing["resize"]["width"])))
-                    p["y"] = int(p["y"] * (int(original_dimensions[1]) / int(self.preprocessing["resize"]["height"])))
-                    p["width"] = int(
-                        p["width"] * (int(original_dimensions[0]) / int(self.preprocessing["resize"]["width"]))
-                    )
-                    p["height"] = int(
-                        p["height"] * (int(original_dimensions[1]) / int(self.preprocessing["resize"]["height"]))
-                    )
-
-                    new_preds.append(p)
-
-                resp_json["predictions"] = new_preds
+            transform.rescale_predictions(resp_json["predictions"])
 
             return PredictionGroup.create_prediction_group(
                 resp_json,
@@ -465,6 +464,25 @@ class ObjectDetectionModel(InferenceModel):
         else:
             view(stopButton)
 
+    def __post_image(self, payload, mime, multipart, api_url):
+        """
+        Send encoded image bytes to the model endpoint.
+
+        Args:
+            payload (bytes): the encoded image
+            mime (str): its content type
+            multipart (bool): send raw bytes as multipart/form-data rather than base64 form data
+            api_url (str): the endpoint, with its query string
+        """
+        if multipart:
+            data = MultipartEncoder(fields={"file": ("imageToUpload", payload, mime)})
+            return transport.post(api_url, data=data, headers={"Content-Type": data.content_type})
+        return transport.post(
+            api_url,
+            data=base64.b64encode(payload).decode("ascii"),
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
     def __exception_check(self, image_path_check=None):
         # Check if Image path exists exception check
         # (for both hosted URL and local image)
@@ -549,3 +567,24 @@ class ObjectDetectionModel(InferenceModel):
         }
 
         return json.dumps(json_value, indent=2)
+
+
+def _check_encoding(encoding):
+    if encoding not in ENCODINGS:
+        raise ValueError(f"encoding must be one of {', '.join(ENCODINGS)}, not {encoding!r}")
+    return encoding
+
+
+def _is_plain_jpeg(image):
+    """Whether the file behind ``image`` decodes to the same pixels as ``image.convert("RGB")`` would send."""
+    return image.format == "JPEG" and image.mode in ("RGB", "L") and image.getexif().get(_EXIF_ORIENTATION, 1) == 1
+
+
+def _encode_image(image, encoding, quality):
+    """Encode a decoded RGB image as PNG (``encoding="png"``) or JPEG; returns ``(bytes, content type)``."""
+    buffered = io.BytesIO()
+    if encoding == "png":
+        image.save(buffered, format="PNG")
+        return buffered.getvalue(), "image/png"
+    image.save(buffered, format="JPEG", quality=quality)
+    return buffered.getvalue(), "image/jpeg"
@@ -20,6 +20,7 @@ from PIL import Image
 
 from roboflow.models.inference import InferenceModel
 from roboflow.util.image_utils import check_image_url
+from roboflow.util.preprocessing import Preprocessor
 
 
 class VLMModel(InferenceModel):
@@ -79,6 +80,10 @@ class VLMModel(InferenceModel):
             if not os.path.exists(image_path):
                 raise Exception(f"Image does not exist at {image_path}!")
             image = Image.open(image_path).convert("RGB")
+            # shrink to the model's input size; free-form output cannot be mapped back
+            # through a crop, so the server keeps doing the static crop itself (and
+            # with it the resize, so the crop is cut from the full-resolution image)
+            image, _ = Preprocessor(self.preprocessing, static_crop=False).apply(image)
             buffered = io.BytesIO()
             image.save(buffered, quality=90, format="JPEG")
             img_b64 = base64.b64encode(buffered.getvalue()).decode("ascii")
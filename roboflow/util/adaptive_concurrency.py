@@ -0,0 +1,182 @@
+"""AIMD concurrency limit for upload workers.
+
+:class:`AdaptiveConcurrency` gates how many requests may be in flight at once.
+The limit grows by ``increase`` after each round of healthy completions (one
+round = as many completions as the current limit) and is multiplied by
+``decrease`` when a request is throttled (HTTP 429), fails server side (5xx),
+times out, or when the smoothed latency rises above ``latency_tolerance``
+times the baseline: the lowest smoothed latency of the last
+``_BASELINE_WINDOW`` requests. A windowed baseline forgets an unusually fast
+stretch, so the limit can recover once latency settles at a new normal. At
+most one decrease is applied per round trip so a burst of failures from the
+same window only halves once.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import threading
+import time
+from typing import Callable, Deque, Iterator, Optional
+
+import requests
+
+_THROUGHPUT_WINDOW = 10.0
+_LATENCY_SMOOTHING = 0.2
+_BASELINE_WINDOW = 100
+
+
+def is_overload_error(exc: BaseException) -> bool:
+    """Whether ``exc`` signals that the server or network is saturated."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code:
+        return status_code == 429 or status_code >= 500
+    cause = exc.__cause__ or exc
+    return isinstance(cause, (requests.Timeout, requests.ConnectionError))
+
+
+class AdaptiveConcurrency:
+    """
+    Thread-safe additive-increase / multiplicative-decrease concurrency limit.
+
+    Args:
+        max_concurrency (int): upper bound for the limit (e.g. the worker pool size)
+        min_concurrency (int): lower bound for the limit
+        initial (int): starting limit; defaults to ``min_concurrency``
+        increase (int): amount added after a healthy round
+        decrease (float): factor applied on overload
+        latency_tolerance (float): smoothed latency above this multiple of the
+            baseline counts as overload
+        on_change (callable): called as ``on_change(concurrency, throughput)``
+            whenever the limit changes
+
+    Example:
+        >>> limiter = AdaptiveConcurrency(max_concurrency=32)
+
+        >>> with limiter.slot():
+        ...     project.upload_image("image.jpg")
+
+        >>> limiter.concurrency, limiter.throughput
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        initial: Optional[int] = None,
+        increase: int = 1,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        on_change: Optional[Callable[[int, float], None]] = None,
+    ):
+        if not 1 <= min_concurrency <= max_concurrency:
+            raise ValueError("Expected 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.on_change = on_change
+
+        self._limit = float(min(max(initial or min_concurrency, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._healthy = 0
+        self._latency: Optional[float] = None
+        self._recent: Deque[float] = collections.deque(maxlen=_BASELINE_WINDOW)
+        self._last_decrease = 0.0
+        self._completed: Deque[float] = collections.deque()
+        self._cond = threading.Condition()
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Smoothed latency of healthy requests, in seconds."""
+        return self._latency
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second over the last few seconds."""
+        with self._cond:
+            self._trim(time.monotonic())
+            return len(self._completed) / _THROUGHPUT_WINDOW
+
+    def acquire(self) -> None:
+        """Block until a slot is free under the current limit."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, latency: Optional[float] = None, overloaded: bool = False) -> None:
+        """
+        Free a slot and feed the outcome back into the limit.
+
+        Args:
+            latency (float): duration of a request that succeeded; ``None`` for
+                a failure that says nothing about load (e.g. a rejected image)
+            overloaded (bool): the request was throttled, failed server side or timed out
+        """
+        now = time.monotonic()
+        with self._cond:
+            before = int(self._limit)
+            self._in_flight -= 1
+            self._completed.append(now)
+            self._trim(now)
+            if overloaded:
+                self._back_off(now)
+            elif latency is not None:
+                self._observe(latency, now)
+            after = int(self._limit)
+            self._cond.notify_all()
+        if after != before and self.on_change is not None:
+            self.on_change(after, self.throughput)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of the block, classifying any exception it raises."""
+        self.acquire()
+        t0 = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(None, overloaded=is_overload_error(e))
+            raise
+        self.release(time.monotonic() - t0)
+
+    def _observe(self, latency: float, now: float) -> None:
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += _LATENCY_SMOOTHING * (latency - self._latency)
+        self._recent.append(self._latency)
+
+        if self._latency > min(self._recent) * self.latency_tolerance:
+            self._back_off(now)
+            return
+
+        self._healthy += 1
+        if self._healthy >= int(self._limit):
+            self._healthy = 0
+            self._limit = min(self._limit + self.increase, float(self.max_concurrency))
+
+    def _back_off(self, now: float) -> None:
+        self._healthy = 0
+        if now - self._last_decrease < (self._latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(self._limit * self.decrease, float(self.min_concurrency))
+
+    def _trim(self, now: float) -> None:
+        while self._completed and now - self._completed[0] > _THROUGHPUT_WINDOW:
+            self._completed.popleft()
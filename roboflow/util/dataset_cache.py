@@ -0,0 +1,204 @@
+"""Local content-addressed cache of downloaded dataset exports.
+
+Consecutive versions of a project, and different formats of the same version,
+mostly contain the same images. The cache keeps a single copy of each file
+under its SHA-256 (``blobs/ab/abcdef...``) and records, per
+``workspace/project/version/format``, which blob belongs at which path of the
+export (``exports/<workspace>/<project>/<version>/<format>.json``).
+
+Images are hardlinked between the blob store and export directories, so each
+distinct image takes disk space once however many exports contain it. Other
+files (annotations, ``data.yaml``, READMEs) are small and are often rewritten
+after extraction, so they are copied instead. When the cache and the export
+directory are on different filesystems, images are copied as well.
+
+Exported images share their inode with the cache, so editing one in place
+also changes its blob. Each manifest records the modification time of its
+blobs: a blob touched since is re-hashed before it is trusted, and a blob
+whose content no longer matches its name is replaced on the next store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from typing import Dict, Iterable, Optional
+
+from roboflow.config import CACHE_DIR
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "datasets")
+
+_LINKED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tiff", ".tif", ".avif", ".heic"}
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the hex SHA-256 of the file at ``path``, read in ``chunk_size`` blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    Content-addressed store of dataset exports, shared across versions and formats.
+
+    Args:
+        path (str): cache directory; defaults to ``datasets`` under ``ROBOFLOW_CACHE_DIR``.
+
+    Example:
+        >>> from roboflow.util.dataset_cache import DatasetCache
+
+        >>> cache = DatasetCache()
+        >>> if not cache.restore(("my-workspace", "my-project", 3, "coco"), "dataset/"):
+        ...     ...  # download and extract the export into dataset/, then
+        ...     cache.store(("my-workspace", "my-project", 3, "coco"), "dataset/")
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.abspath(path or DEFAULT_PATH)
+
+    def _manifest_path(self, key) -> str:
+        workspace, project, version, model_format = (str(part) for part in key)
+        return os.path.join(self.path, "exports", workspace, project, version, f"{model_format}.json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, "blobs", digest[:2], digest)
+
+    def manifest(self, key) -> Optional[Dict[str, Dict]]:
+        """``{relative path: {"digest", "size", "mtime_ns"}}`` recorded for ``key``, or ``None``."""
+        try:
+            with open(self._manifest_path(key)) as f:
+                return json.load(f)["files"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def restore(self, key, location: str) -> bool:
+        """
+        Recreate the export recorded for ``key`` in ``location`` from cached blobs.
+
+        Returns ``False`` without touching ``location`` when the export is not
+        cached or any of its blobs is missing or damaged.
+
+        Args:
+            key (tuple): ``(workspace, project, version, format)``
+            location (str): directory to write the export to; existing files are replaced
+
+        Returns:
+            bool: whether the export was restored
+        """
+        files = self.manifest(key)
+        if files is None:
+            return False
+        for entry in files.values():
+            if not _blob_intact(self._blob_path(entry["digest"]), entry):
+                return False
+
+        for relpath, entry in files.items():
+            target = os.path.join(location, relpath)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if os.path.lexists(target):
+                os.remove(target)
+            blob = self._blob_path(entry["digest"])
+            if _is_linked(relpath):
+                _link_or_copy(blob, target)
+            else:
+                shutil.copyfile(blob, target)
+        return True
+
+    def store(self, key, location: str, files: Optional[Iterable[str]] = None) -> int:
+        """
+        Record the export extracted in ``location`` under ``key``.
+
+        Only ``files`` are recorded, so anything else kept in ``location``
+        (older exports, scripts, weights) stays out of the cache; pass the
+        paths :func:`roboflow.util.general.extract_zip` returns. Without
+        ``files``, everything under ``location`` is recorded.
+
+        Each file is hashed into the blob store. Images already cached (from
+        another version or format) replace their copy in ``location`` with a
+        hardlink to the blob, so the duplicate's disk space is reclaimed.
+
+        Args:
+            key (tuple): ``(workspace, project, version, format)``
+            location (str): directory holding the extracted export
+            files (list): paths of the export's files, relative to ``location``
+
+        Returns:
+            int: number of files recorded
+        """
+        if files is None:
+            files = [
+                os.path.relpath(os.path.join(dirpath, name), location)
+                for dirpath, _, filenames in os.walk(location)
+                for name in filenames
+            ]
+        recorded = {}
+        for path in files:
+            source = os.path.join(location, path)
+            relpath = os.path.relpath(source, location).replace(os.sep, "/")
+            digest = hash_file(source)
+            blob = self._add_blob(source, digest, _is_linked(relpath))
+            stat = os.stat(blob)
+            recorded[relpath] = {"digest": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+        manifest_path = self._manifest_path(key)
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        tmp = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"files": recorded}, f)
+        os.replace(tmp, manifest_path)
+        return len(recorded)
+
+    def _add_blob(self, source: str, digest: str, link: bool) -> str:
+        blob = self._blob_path(digest)
+        if os.path.exists(blob):
+            if os.path.samefile(blob, source):
+                return blob
+            # an image edited in place through an exported hardlink changes its blob
+            # too, so check the cached bytes before sharing them
+            if os.path.getsize(blob) == os.path.getsize(source) and hash_file(blob) == digest:
+                if link:
+                    # share the cached copy instead of keeping a duplicate
+                    tmp = f"{source}.{uuid.uuid4().hex}.tmp"
+                    _link_or_copy(blob, tmp)
+                    os.replace(tmp, source)
+                return blob
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        # write under a temporary name so a concurrent reader never sees a partial blob
+        tmp = f"{blob}.{uuid.uuid4().hex}.tmp"
+        if link:
+            _link_or_copy(source, tmp)
+        else:
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, blob)
+        return blob
+
+
+def _blob_intact(blob: str, entry: Dict) -> bool:
+    try:
+        stat = os.stat(blob)
+    except OSError:
+        return False
+    if stat.st_size != entry["size"]:
+        return False
+    if stat.st_mtime_ns == entry.get("mtime_ns"):
+        return True
+    # modified since the manifest was written, e.g. an exported image edited in place
+    return hash_file(blob) == entry["digest"]
+
+
+def _is_linked(relpath: str) -> bool:
+    return os.path.splitext(relpath)[1].lower() in _LINKED_EXTENSIONS
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        # different filesystems, or links unsupported
+        shutil.copyfile(source, target)
@@ -0,0 +1,143 @@
+"""Local content-addressed cache of images already present in a project.
+
+Maps ``(project, md5 of the file bytes)`` to the image id the server assigned,
+so ``Project.upload_image`` can recognise a duplicate without sending the
+file. The digest of each local file is memoised under its absolute path,
+size and mtime, so an unchanged file is only read once across runs.
+
+Entries are learnt from successful (and duplicate) upload responses. An
+existing project can be seeded once with :meth:`DedupeCache.warm`, which pages
+through ``Project.search_all`` and records every result that carries a hash.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from roboflow.config import CACHE_DIR
+
+if TYPE_CHECKING:
+    from roboflow.core.project import Project
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "dedupe.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    project TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    image_id TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project, digest)
+);
+CREATE INDEX IF NOT EXISTS images_by_id ON images (project, image_id);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    digest TEXT NOT NULL
+);
+"""
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """Return the hex md5 of the file at ``path``, read in ``chunk_size`` blocks."""
+    digest = hashlib.md5(usedforsecurity=False)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DedupeCache:
+    """
+    Thread-safe SQLite map of ``(project, content hash) -> image id``.
+
+    Args:
+        path (str): location of the SQLite file; defaults to ``dedupe.sqlite`` under
+            ``ROBOFLOW_CACHE_DIR``. Parent directories are created.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or DEFAULT_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def digest(self, path: str) -> str:
+        """Content hash of ``path``, reusing the memoised value while its size and mtime are unchanged."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._conn.execute("SELECT size, mtime, digest FROM files WHERE path = ?", (path,)).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime:
+            return row[2]
+        digest = hash_file(path)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO files (path, size, mtime, digest) VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime, digest),
+            )
+        return digest
+
+    def get(self, project: str, digest: str) -> Optional[str]:
+        """Image id recorded for ``digest`` in ``project``, or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT image_id FROM images WHERE project = ? AND digest = ?", (project, digest)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, project: str, digest: str, image_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO images (project, digest, image_id, updated) VALUES (?, ?, ?, ?)",
+                (project, digest, image_id, time.time()),
+            )
+
+    def forget(self, project: str, image_ids: Iterable[str]) -> None:
+        """Drop the entries of deleted images so they are uploaded again next time."""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM images WHERE project = ? AND image_id = ?", [(project, i) for i in image_ids]
+            )
+
+    def warm(self, project: Project, hash_field: str = "hash", page_size: int = 250) -> int:
+        """
+        Seed the cache with the images already in ``project``.
+
+        Pages through ``project.search_all`` requesting ``id`` and ``hash_field``;
+        results without a hash are skipped. Only useful when ``hash_field`` holds
+        the md5 of the original file bytes; a different hash simply never matches.
+
+        Returns:
+            int: number of entries recorded
+        """
+        count = 0
+        for page in project.search_all(limit=page_size, fields=["id", hash_field]):
+            rows = [
+                (project.id, r[hash_field], r["id"], time.time()) for r in page if r.get(hash_field) and r.get("id")
+            ]
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO images (project, digest, image_id, updated) VALUES (?, ?, ?, ?)", rows
+                )
+            count += len(rows)
+        return count
@@ -0,0 +1,246 @@
+"""Columnar, NumPy-backed view of detection-style predictions.
+
+``PredictionGroup`` keeps one dict-backed ``Prediction`` per object, which is
+convenient for plotting a single image but slow to filter or post-process in
+bulk. :class:`Detections` stores the same predictions column by column:
+
+* ``xyxy``: ``(N, 4)`` float boxes as ``x_min, y_min, x_max, y_max``;
+* ``confidence``: ``(N,)`` floats;
+* ``class_id``: ``(N,)`` ints, and ``class_name``: ``(N,)`` strings;
+* ``polygons``: instance segmentation outlines, one ``(K, 2)`` array each
+  (rasterise them with :meth:`Detections.masks`);
+* ``keypoints``: ``(N, K, 3)`` ``x, y, confidence``, padded with NaN.
+
+Indexing with an int array, slice or boolean mask returns a new
+``Detections``, so filtering, :meth:`Detections.nms` and
+:meth:`Detections.iou` are plain array operations. :meth:`Detections.from_json`
+builds the columns straight from an inference response, without creating a
+``Prediction`` per object.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+class Detections:
+    """
+    Boxes, scores, classes, polygons and keypoints of one image as contiguous arrays.
+
+    Args:
+        xyxy (np.ndarray): ``(N, 4)`` boxes
+        confidence (np.ndarray): ``(N,)`` scores between 0 and 1
+        class_id (np.ndarray): ``(N,)`` class ids
+        class_name (np.ndarray): ``(N,)`` class names
+        polygons (list): ``N`` arrays of shape ``(K, 2)``, or ``None``
+        keypoints (np.ndarray): ``(N, K, 3)`` keypoints, or ``None``
+        image_size (tuple): ``(width, height)`` of the image the predictions refer to, if known
+
+    Example:
+        >>> group = model.predict("photo.jpg")
+        >>> detections = group.to_arrays()
+        >>> people = detections[(detections.class_name == "person") & (detections.confidence > 0.5)]
+        >>> people = people.nms(iou_threshold=0.45)
+    """
+
+    __slots__ = ("xyxy", "confidence", "class_id", "class_name", "polygons", "keypoints", "image_size")
+
+    def __init__(
+        self,
+        xyxy,
+        confidence,
+        class_id,
+        class_name,
+        polygons: Optional[List[Any]] = None,
+        keypoints=None,
+        image_size: Optional[Tuple[int, int]] = None,
+    ):
+        self.xyxy = xyxy
+        self.confidence = confidence
+        self.class_id = class_id
+        self.class_name = class_name
+        self.polygons = polygons
+        self.keypoints = keypoints
+        self.image_size = image_size
+
+    @classmethod
+    def empty(cls) -> Detections:
+        import numpy as np
+
+        return cls(np.zeros((0, 4)), np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=str))
+
+    @classmethod
+    def from_json(cls, json_response: dict) -> Detections:
+        """
+        Build from an object detection, instance segmentation or keypoint response.
+
+        Accepts either the response itself (with ``predictions`` and ``image``)
+        or a list of prediction dicts. Boxes are converted from the API's
+        centre/size form to ``xyxy``. Class ids come from ``class_id`` when every
+        prediction has one; otherwise they are assigned by sorted class name.
+        """
+        import numpy as np
+
+        if isinstance(json_response, dict):
+            predictions = json_response.get("predictions") or []
+            image = json_response.get("image") or {}
+        else:
+            predictions, image = list(json_response), {}
+        image_size = None
+        try:
+            image_size = (int(image["width"]), int(image["height"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+        if not predictions:
+            detections = cls.empty()
+            detections.image_size = image_size
+            return detections
+
+        boxes = np.array([(p["x"], p["y"], p["width"], p["height"]) for p in predictions], dtype=np.float64)
+        half = boxes[:, 2:] / 2
+        xyxy = np.concatenate([boxes[:, :2] - half, boxes[:, :2] + half], axis=1)
+        confidence = np.array([p.get("confidence", 1.0) for p in predictions], dtype=np.float64)
+        class_name = np.array([str(p.get("class", "")) for p in predictions])
+        if all("class_id" in p for p in predictions):
+            class_id = np.array([p["class_id"] for p in predictions], dtype=np.int64)
+        else:
+            class_id = np.unique(class_name, return_inverse=True)[1].astype(np.int64)
+
+        polygons = None
+        if any("points" in p for p in predictions):
+            polygons = [
+                np.array([(point["x"], point["y"]) for point in p.get("points") or []], dtype=np.float64).reshape(-1, 2)
+                for p in predictions
+            ]
+
+        keypoints = None
+        if any("keypoints" in p for p in predictions):
+            count = max(len(p.get("keypoints") or []) for p in predictions)
+            keypoints = np.full((len(predictions), count, 3), np.nan)
+            for row, p in enumerate(predictions):
+                points = p.get("keypoints") or []
+                if points:
+                    keypoints[row, : len(points)] = [(k["x"], k["y"], k.get("confidence", np.nan)) for k in points]
+
+        return cls(xyxy, confidence, class_id, class_name, polygons, keypoints, image_size)
+
+    def __len__(self) -> int:
+        return len(self.confidence)
+
+    def __getitem__(self, index) -> Detections:
+        import numpy as np
+
+        if isinstance(index, (int, np.integer)):
+            index = [index]
+        polygons = None
+        if self.polygons is not None:
+            polygons = [self.polygons[i] for i in np.arange(len(self))[index]]
+        return Detections(
+            self.xyxy[index],
+            self.confidence[index],
+            self.class_id[index],
+            self.class_name[index],
+            polygons,
+            None if self.keypoints is None else self.keypoints[index],
+            self.image_size,
+        )
+
+    def __repr__(self) -> str:
+        return f"<Detections n={len(self)} classes={sorted(set(self.class_name.tolist()))}>"
+
+    @property
+    def area(self):
+        """``(N,)`` box areas."""
+        return (self.xyxy[:, 2] - self.xyxy[:, 0]) * (self.xyxy[:, 3] - self.xyxy[:, 1])
+
+    def filter(
+        self,
+        confidence: Optional[float] = None,
+        classes: Optional[Iterable[str]] = None,
+        class_ids: Optional[Iterable[int]] = None,
+    ) -> Detections:
+        """
+        Keep detections with at least ``confidence`` (0-1) whose class is in ``classes`` / ``class_ids``.
+
+        Arguments left as ``None`` do not filter.
+        """
+        import numpy as np
+
+        keep = np.ones(len(self), dtype=bool)
+        if confidence is not None:
+            keep &= self.confidence >= confidence
+        if classes is not None:
+            keep &= np.isin(self.class_name, list(classes))
+        if class_ids is not None:
+            keep &= np.isin(self.class_id, list(class_ids))
+        return self[keep]
+
+    def iou(self, other: Optional[Detections] = None):
+        """``(N, M)`` pairwise IoU of these boxes with ``other``'s (or with themselves)."""
+        return box_iou(self.xyxy, (other if other is not None else self).xyxy)
+
+    def nms(self, iou_threshold: float = 0.5, class_agnostic: bool = False) -> Detections:
+        """
+        Greedy non-maximum suppression, highest confidence first.
+
+        A detection is dropped when it overlaps a kept one of the same class (of
+        any class with ``class_agnostic``) by more than ``iou_threshold``.
+        Returns the kept detections in descending confidence order.
+        """
+        import numpy as np
+
+        if len(self) == 0:
+            return self
+        boxes = self.xyxy
+        if not class_agnostic:
+            # shift each class into its own region so boxes of different classes never overlap
+            span = float(np.max(boxes) - np.min(boxes)) + 1
+            boxes = boxes + (self.class_id * span)[:, None]
+
+        order = np.argsort(-self.confidence, kind="stable")
+        keep = []
+        while order.size:
+            best = order[0]
+            keep.append(best)
+            if order.size == 1:
+                break
+            overlap = box_iou(boxes[best : best + 1], boxes[order[1:]])[0]
+            order = order[1:][overlap <= iou_threshold]
+        return self[np.array(keep, dtype=np.int64)]
+
+    def masks(self, image_size: Optional[Tuple[int, int]] = None):
+        """
+        ``(N, height, width)`` boolean masks rasterised from ``polygons``.
+
+        Args:
+            image_size (tuple): ``(width, height)``; defaults to ``image_size`` from the response
+        """
+        import cv2
+        import numpy as np
+
+        size = image_size or self.image_size
+        if size is None:
+            raise ValueError("image_size is required: the predictions do not record the image size")
+        if self.polygons is None:
+            raise ValueError("These predictions have no polygons")
+        width, height = size
+        masks = np.zeros((len(self), height, width), dtype=np.uint8)
+        for mask, polygon in zip(masks, self.polygons):
+            if len(polygon):
+                cv2.fillPoly(mask, [np.round(polygon).astype(np.int32)], (1,))
+        return masks.astype(bool)
+
+
+def box_iou(boxes_a: Sequence, boxes_b: Sequence):
+    """``(N, M)`` IoU between ``(N, 4)`` and ``(M, 4)`` xyxy boxes."""
+    import numpy as np
+
+    a = np.asarray(boxes_a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(boxes_b, dtype=np.float64).reshape(-1, 4)
+    top_left = np.maximum(a[:, None, :2], b[None, :, :2])
+    bottom_right = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    area_a = np.prod(a[:, 2:] - a[:, :2], axis=1)
+    area_b = np.prod(b[:, 2:] - b[:, :2], axis=1)
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
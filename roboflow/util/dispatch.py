@@ -0,0 +1,116 @@
+"""Bounded fan-out of work items onto a thread pool."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def run_bounded(
+    fn: Callable[[T], object],
+    items: Iterable[T],
+    max_workers: int,
+    max_pending: Optional[int] = None,
+) -> None:
+    """
+    Call ``fn(item)`` for every item on a pool of ``max_workers`` threads.
+
+    Unlike ``list(executor.map(fn, items))``, ``items`` is consumed lazily and at
+    most ``max_pending`` calls (default ``2 * max_workers``) are queued or running
+    at any time, so memory stays proportional to the pool size no matter how
+    many items there are. The first exception raised by ``fn`` stops further
+    submissions and is re-raised once the calls already running have finished.
+
+    Args:
+        fn: callable applied to each item; its return value is discarded
+        items: any iterable, including a generator
+        max_workers (int): number of worker threads
+        max_pending (int): bound on submitted but unfinished calls
+    """
+    slots = threading.BoundedSemaphore(max_pending or 2 * max_workers)
+    failures: List[BaseException] = []
+
+    def _done(future: concurrent.futures.Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            failures.append(future.exception())  # type: ignore[arg-type]
+        slots.release()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in items:
+            slots.acquire()
+            if failures:
+                slots.release()
+                break
+            try:
+                future = executor.submit(fn, item)
+            except BaseException:
+                slots.release()
+                raise
+            future.add_done_callback(_done)
+
+    if failures:
+        raise failures[0]
+
+
+def imap_bounded(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    max_pending: Optional[int] = None,
+    ordered: bool = True,
+) -> Iterator[Tuple[T, concurrent.futures.Future]]:
+    """
+    Yield ``(item, future)`` for every item once ``fn(item)`` has finished on a pool of ``max_workers`` threads.
+
+    ``items`` is consumed lazily with at most ``max_pending`` calls (default
+    ``2 * max_workers``) submitted but not yet yielded. Exceptions raised by
+    ``fn`` are not propagated: each one stays on its own future, so a failing
+    item does not stop the others. Closing the generator early cancels the
+    calls that have not started.
+
+    Args:
+        fn: callable applied to each item
+        items: any iterable, including a generator
+        max_workers (int): number of worker threads
+        max_pending (int): bound on submitted but not yet yielded calls
+        ordered (bool): yield in the order of ``items``; otherwise as calls complete
+    """
+    max_pending = max(max_pending or 2 * max_workers, 1)
+    queue: Deque[Tuple[T, concurrent.futures.Future]] = deque()
+    running: Dict[concurrent.futures.Future, T] = {}
+
+    def _drain(block: bool) -> Iterator[Tuple[T, concurrent.futures.Future]]:
+        if ordered:
+            while queue and (block or queue[0][1].done()):
+                item, future = queue.popleft()
+                concurrent.futures.wait([future])
+                yield item, future
+                block = False
+            return
+        done, _ = concurrent.futures.wait(
+            running, timeout=None if block else 0, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            yield running.pop(future), future
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                future = executor.submit(fn, item)
+                if ordered:
+                    queue.append((item, future))
+                else:
+                    running[future] = item
+                yield from _drain(block=len(queue) + len(running) >= max_pending)
+            while queue or running:
+                yield from _drain(block=True)
+        finally:
+            for _, future in queue:
+                future.cancel()
+            for future in running:
+                future.cancel()
@@ -1,12 +1,30 @@
+import concurrent.futures
 import json
 import os
 import re
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
 
 from tqdm import tqdm
 
 from .image_utils import load_labelmap
 
+# Characters read per refill when streaming large JSON annotation files.
+_JSON_READ_SIZE = 1 << 20
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# workaround to make Annotations.js correctly identify this as coco in the backend
+_FAKE_COCO_ANNOTATION = json.dumps(
+    {
+        "id": 999999999,
+        "image_id": 999999999,
+        "category_id": 0,
+        "area": 1,
+        "segmentation": [],
+        "iscrowd": 0,
+    }
+)
+
 IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".tif", ".avif", ".heic"}
 ANNOTATION_EXTENSIONS = {".txt", ".json", ".xml", ".csv", ".jsonl"}
 LABELMAPS_EXTENSIONS = {".labels", ".yaml", ".yml"}
@@ -21,11 +39,30 @@ def _patch_sep(filename):
     return filename.replace("\\", "/")
 
 
-def parsefolder(folder, is_classification=False):
+def parsefolder(folder, is_classification=False, lazy=False, workers=None, manifest=None):
+    """
+    Describe the images of a dataset folder and the annotation matched to each.
+
+    Args:
+        folder (str): dataset directory
+        is_classification (bool): fall back to the parent folder name as the label
+        lazy (bool): return ``images`` as an iterator (see :func:`iter_parsefolder`)
+            instead of a list
+        workers (int): directories listed concurrently; defaults to a small thread pool.
+            Above 1, annotation files are also parsed in that many processes (scripts
+            on spawn-based platforms then need an ``if __name__ == "__main__":`` guard).
+            ``1`` does everything in the calling thread.
+        manifest (ScanManifest): reuse directory listings and parsed annotation files
+            recorded by an earlier scan when they have not changed since (see
+            :mod:`roboflow.util.scan_manifest`)
+
+    Returns:
+        dict: ``{"location": <normalized folder>, "images": [image descriptor, ...]}``
+    """
     folder = _patch_sep(folder).strip().rstrip("/")
     if not os.path.exists(folder):
         raise Exception(f"folder does not exist. {folder}")
-    files = _list_files(folder)
+    files = _list_files(folder, workers, manifest)
     images = [f for f in files if f["extension"] in IMAGE_EXTENSIONS]
     _add_indices(images)
     _decide_split(images)
@@ -33,17 +70,68 @@ def parsefolder(folder, is_classification=False):
     labelmaps = [f for f in files if f["extension"] in LABELMAPS_EXTENSIONS]
     labelmaps = _load_labelmaps(folder, labelmaps)
     _map_labelmaps_to_annotations(annotations, labelmaps)
-    if not _map_annotations_to_images_1to1(images, annotations):
-        annotations = _loadAnnotations(folder, annotations)
-        _map_annotations_to_images_1tomany(images, annotations)
-    if is_classification:
-        _infer_classification_labels_from_folders(images)
+    described = _describe_images(
+        folder, images, annotations, is_classification, progress=not lazy, workers=workers, manifest=manifest
+    )
     return {
         "location": folder,
-        "images": images,
+        "images": _LazyImages(described, len(images)) if lazy else list(described),
     }
 
 
+def iter_parsefolder(folder, is_classification=False, workers=None, manifest=None):
+    """
+    Lazy counterpart of :func:`parsefolder`: iterate over the image descriptors.
+
+    The folder is listed up front, but each image's annotation payload (the
+    per-image slice of a shared COCO/CreateML/CSV/JSONL file) is only built when
+    the image is reached, and the iterator keeps no reference to descriptors it
+    has already yielded. ``len()`` gives the number of images.
+    """
+    return parsefolder(folder, is_classification=is_classification, lazy=True, workers=workers, manifest=manifest)[
+        "images"
+    ]
+
+
+class _LazyImages:
+    """Single-pass iterator over image descriptors that also knows how many there are."""
+
+    def __init__(self, iterator, size):
+        self._iterator = iterator
+        self._size = size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._iterator)
+
+    def __len__(self):
+        return self._size
+
+
+def _describe_images(folder, images, annotations, is_classification, progress=False, workers=None, manifest=None):
+    match = None
+    if not _map_annotations_to_images_1to1(images, annotations):
+        match = _annotation_matcher(_loadAnnotations(folder, annotations, workers, manifest))
+    bar = tqdm(total=len(images)) if progress and match is not None else None
+    pending = deque(images)
+    del images
+    while pending:
+        image = pending.popleft()
+        if match is not None:
+            annotationfile = match(image)
+            if annotationfile:
+                image["annotationfile"] = annotationfile
+        if is_classification:
+            _infer_classification_label_from_folder(image)
+        if bar is not None:
+            bar.update()
+        yield image
+    if bar is not None:
+        bar.close()
+
+
 def _alphanumkey(s):
     s = os.path.splitext(s)[0]
     # Split the string into two parts: all characters before the last digit sequence, and the last digit sequence
@@ -57,17 +145,68 @@ def _alphanumkey(s):
         return (s, 0)
 
 
-def _list_files(folder):
-    filedescriptors = []
-    for root, dirs, files in os.walk(folder):
-        for file in files:
-            file_path = os.path.join(root, file)
-            rel = os.path.relpath(file_path, folder)
-            filedescriptors.append(_describe_file(f"/{rel}"))
+def _list_files(folder, workers=None, manifest=None):
+    filedescriptors = [_describe_file(f"/{rel}") for rel in _scan_files(folder, workers, manifest)]
     filedescriptors = sorted(filedescriptors, key=lambda x: _alphanumkey(x["file"]))
     return filedescriptors
 
 
+def _scan_files(folder, workers=None, manifest=None):
+    """Relative paths of every file below ``folder``, listing directories concurrently.
+
+    Follows the same rules as ``os.walk``: unreadable directories are skipped and
+    symlinked directories are not descended into.
+    """
+    if workers == 1:
+        files, pending = [], [""]
+        while pending:
+            found, subdirs = _scan_dir(folder, pending.pop(), manifest)
+            files.extend(found)
+            pending.extend(subdirs)
+        return files
+
+    files = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {executor.submit(_scan_dir, folder, "", manifest)}
+        while running:
+            done, running = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                found, subdirs = future.result()
+                files.extend(found)
+                running.update(executor.submit(_scan_dir, folder, subdir, manifest) for subdir in subdirs)
+    return files
+
+
+def _scan_dir(folder, reldir, manifest=None):
+    path = f"{folder}/{reldir}" if reldir else folder
+    try:
+        listing = manifest.listing(path) if manifest is not None else None
+        if listing is None:
+            listing = _list_dir(path)
+            if manifest is not None:
+                manifest.put_listing(path, *listing)
+    except OSError:
+        return [], []
+    prefix = f"{reldir}/" if reldir else ""
+    files, subdirs = listing
+    return [prefix + name for name in files], [prefix + name for name in subdirs]
+
+
+def _list_dir(path):
+    files, subdirs = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry.name)
+            elif not entry.is_symlink():
+                subdirs.append(entry.name)
+    return files, subdirs
+
+
 def _add_indices(files):
     for i, f in enumerate(files):
         f["index"] = i
@@ -75,20 +214,106 @@ def _add_indices(files):
 
 def _describe_file(f):
     f = _patch_sep(f)
-    name = f.split("/")[-1]
-    dirname = os.path.dirname(f)
-    fullkey, extension = os.path.splitext(f)
-    fullkey2 = fullkey.replace("/labels", "").replace("/images", "")
-    key = os.path.splitext(name)[0]
-    return {
-        "file": f,
-        "dirname": dirname,
-        "name": name,
-        "extension": extension.lower(),
-        "key": key.lower(),
-        "fullkey": fullkey.lower(),
-        "fullkey2": fullkey2.lower(),
-    }
+    return FileDescriptor(os.path.dirname(f), f.split("/")[-1])
+
+
+class FileDescriptor(MutableMapping):
+    """
+    Dict-like description of one file found by :func:`parsefolder`.
+
+    Only the directory (interned, so files in the same directory share one
+    string) and the file name are stored. ``file``, ``extension``, ``key``,
+    ``fullkey`` and ``fullkey2`` are derived from them on access. ``index``,
+    ``split``, ``annotationfile``, ``labelmap``, ``parsed`` and ``parsedType``
+    occupy slots that are only present once assigned, and any other key goes
+    to a small overflow dict. This keeps a descriptor at a fraction of the size
+    of the equivalent ``dict`` while reading like one: ``desc["file"]``,
+    ``desc.get("annotationfile")`` and ``dict(desc)`` all work.
+    """
+
+    _DERIVED = ("file", "dirname", "name", "extension", "key", "fullkey", "fullkey2")
+    _OPTIONAL = ("index", "split", "annotationfile", "labelmap", "parsed", "parsedType")
+
+    __slots__ = ("_dirname", "_name", "_extra", *_OPTIONAL)
+
+    def __init__(self, dirname, name):
+        self._dirname = sys.intern(dirname)
+        self._name = name
+        self._extra = None
+
+    @property
+    def file(self):
+        return f"{self._dirname}{self._name}" if self._dirname.endswith("/") else f"{self._dirname}/{self._name}"
+
+    @property
+    def dirname(self):
+        return self._dirname
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def extension(self):
+        return os.path.splitext(self._name)[1].lower()
+
+    @property
+    def key(self):
+        return os.path.splitext(self._name)[0].lower()
+
+    @property
+    def fullkey(self):
+        return os.path.splitext(self.file)[0].lower()
+
+    @property
+    def fullkey2(self):
+        fullkey = os.path.splitext(self.file)[0]
+        return fullkey.replace("/labels", "").replace("/images", "").lower()
+
+    def __getitem__(self, item):
+        if item in self._DERIVED or item in self._OPTIONAL:
+            try:
+                return getattr(self, item)
+            except AttributeError:
+                raise KeyError(item) from None
+        if self._extra and item in self._extra:
+            return self._extra[item]
+        raise KeyError(item)
+
+    def __setitem__(self, item, value):
+        if item in self._OPTIONAL:
+            setattr(self, item, value)
+        elif item in self._DERIVED:
+            raise TypeError(f"'{item}' is derived from the file path")
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[item] = value
+
+    def __delitem__(self, item):
+        if item in self._OPTIONAL:
+            try:
+                delattr(self, item)
+            except AttributeError:
+                raise KeyError(item) from None
+        elif self._extra and item in self._extra:
+            del self._extra[item]
+        else:
+            raise KeyError(item)
+
+    def __iter__(self):
+        yield from self._DERIVED
+        for item in self._OPTIONAL:
+            if hasattr(self, item):
+                yield item
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"FileDescriptor({dict(self)!r})"
 
 
 def _map_annotations_to_images_1to1(images, annotations):
@@ -110,11 +335,12 @@ def _map_annotations_to_images_1to1(images, annotations):
     return countmapped > 0
 
 
-def _map_annotations_to_images_1tomany(images, annotationFiles):
+def _annotation_matcher(annotationFiles):
+    """Index shared annotation files once; return ``match(image)`` building that image's annotation payload."""
     image_path_to_annotation_files = _build_image_to_annotationfile_index(annotationFiles)
     imgRefMap, annotationMap = _build_image_and_annotation_maps(annotationFiles)
 
-    for image in tqdm(images):
+    def match(image):
         # Get candidate annotation files for this image
         rel_path = image["file"].lstrip("/")
         candidate_annotations = (
@@ -128,8 +354,10 @@ def _map_annotations_to_images_1tomany(images, annotationFiles):
             format = annotationFile["parsedType"]
             filtered_annotations = _filterIndividualAnnotations(image, annotationFile, format, imgRefMap, annotationMap)
             if filtered_annotations:
-                image["annotationfile"] = filtered_annotations
-                break
+                return filtered_annotations
+        return None
+
+    return match
 
 
 def _build_image_to_annotationfile_index(annotationFiles):
@@ -188,6 +416,13 @@ def _build_image_to_annotationfile_index(annotationFiles):
 
 
 def _build_image_and_annotation_maps(annotationFiles):
+    """Index every annotation file once so each image can be matched with dict lookups.
+
+    ``imgRefMap`` maps ``"<file>/<image path|basename|stem>"`` to a COCO image entry.
+    ``annotationMap`` maps ``"<file>/<image id>"`` to serialized COCO annotations and, for the
+    row-based formats (createml, csv, multilabel_csv, jsonl), ``"<file>/<image name>"``
+    to that image's rows in file order.
+    """
     imgRefMap = {}
     annotationMap = defaultdict(list)
     for annFile in annotationFiles:
@@ -211,13 +446,23 @@ def _build_image_and_annotation_maps(annotationFiles):
                         f"{filename}/{stem}": imageRef,
                     }
                 )
-            for annotation in parsed["annotations"]:
-                annotationMap[f"{filename}/{annotation['image_id']}"].append(annotation)
+            for image_id, rawAnnotations in parsed["annotationsByImage"].items():
+                annotationMap[f"{filename}/{image_id}"] = rawAnnotations
+        elif parsedType in ("createml", "jsonl"):
+            for entry in parsed:
+                annotationMap[f"{filename}/{entry.get('image')}"].append(entry)
+        elif parsedType == "csv":
+            for ld in parsed["lines"]:
+                annotationMap[f"{filename}/{ld['file_name']}"].append(ld)
+        elif parsedType == "multilabel_csv":
+            for row in parsed["rows"]:
+                annotationMap[f"{filename}/{row['file_name']}"].append(row)
     return imgRefMap, annotationMap
 
 
 def _filterIndividualAnnotations(image, annotation, format, imgRefMap, annotationMap):
     parsed = annotation["parsed"]
+    imageRows = annotationMap.get(f"{annotation['file']}/{image['name']}", [])
     if format == "coco":
         rel_path = image["file"].lstrip("/")
         imgReference = (
@@ -229,29 +474,13 @@ def _filterIndividualAnnotations(image, annotation, format, imgRefMap, annotatio
             or imgRefMap.get(f"{annotation['file']}/{image['key']}")
         )
         if imgReference:
-            # workaround to make Annotations.js correctly identify this as coco in the backend
-            fake_annotation = {
-                "id": 999999999,
-                "image_id": 999999999,
-                "category_id": 0,
-                "area": 1,
-                "segmentation": [],
-                "iscrowd": 0,
-            }
-            _annotation = {"name": "annotation.coco.json"}
-            annotations_for_image = annotationMap.get(f"{annotation['file']}/{imgReference['id']}", [])
-            _annotation["rawText"] = json.dumps(
-                {
-                    "info": parsed["info"],
-                    "licenses": parsed["licenses"],
-                    "categories": parsed["categories"],
-                    "images": [imgReference],
-                    "annotations": annotations_for_image or [fake_annotation],
-                }
-            )
-            return _annotation
+            rawAnnotations = annotationMap.get(f"{annotation['file']}/{imgReference['id']}") or [_FAKE_COCO_ANNOTATION]
+            # same text json.dumps would produce for the single-image COCO document,
+            # but the header shared by every image is serialized only once per file
+            rawText = f'{parsed["header"]}{json.dumps(imgReference)}], "annotations": [{", ".join(rawAnnotations)}]}}'
+            return {"name": "annotation.coco.json", "rawText": rawText}
     elif format == "createml":
-        imgReferences = [i for i in parsed if i["image"] == image["name"]]
+        imgReferences = imageRows
         if len(imgReferences) > 1:
             print(f"warning: found multiple image entries for image {image['file']} in {annotation['file']}")
         if imgReferences:
@@ -262,7 +491,7 @@ def _filterIndividualAnnotations(image, annotation, format, imgRefMap, annotatio
             }
             return _annotation
     elif format == "csv":
-        imgLines = [ld["line"] for ld in parsed["lines"] if ld["file_name"] == image["name"]]
+        imgLines = [ld["line"] for ld in imageRows]
         if imgLines:
             headers = parsed["headers"]
             _annotation = {
@@ -273,42 +502,176 @@ def _filterIndividualAnnotations(image, annotation, format, imgRefMap, annotatio
         else:
             return None
     elif format == "multilabel_csv":
-        rows = [r for r in parsed["rows"] if r["file_name"] == image["name"]]
-        if rows:
-            labels = rows[0]["labels"]
+        if imageRows:
+            labels = imageRows[0]["labels"]
             return {"type": "classification_multilabel", "labels": labels}
         else:
             return None
     elif format == "jsonl":
-        jsonlLines = [json.dumps(line) for line in parsed if line["image"] == image["name"]]
+        jsonlLines = [json.dumps(line) for line in imageRows]
         if jsonlLines:
             _annotation = {"name": "annotation.jsonl", "rawText": "\n".join(jsonlLines)}
             return _annotation
     return None
 
 
-def _loadAnnotations(folder, annotations):
+def _loadAnnotations(folder, annotations, workers=None, manifest=None):
     valid_extensions = {".json", ".csv", ".jsonl"}
     annotations = [a for a in annotations if a["extension"] in valid_extensions]
-    for ann in annotations:
-        extension = ann["extension"]
-        if extension == ".json":
-            with open(f"{folder}{ann['file']}") as f:
-                parsed = json.load(f)
-                parsedType = _guessAnnotationFileFormat(parsed, extension)
-                if parsedType:
-                    ann["parsed"] = parsed
-                    ann["parsedType"] = parsedType
-        elif extension == ".jsonl":
-            ann["parsed"] = _read_jsonl(f"{folder}{ann['file']}")
-            ann["parsedType"] = "jsonl"
-        elif extension == ".csv":
-            parsed = _parseAnnotationCSV(f"{folder}{ann['file']}")
+    paths = [f"{folder}{ann['file']}" for ann in annotations]
+    results = [manifest.parsed(path) if manifest is not None else None for path in paths]
+    stale = [i for i, result in enumerate(results) if result is None]
+    stale_paths = [paths[i] for i in stale]
+    stale_extensions = [annotations[i]["extension"] for i in stale]
+    if workers and workers > 1 and len(stale) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+            parsed_stale = list(executor.map(_parseAnnotationFile, stale_paths, stale_extensions))
+    else:
+        parsed_stale = list(map(_parseAnnotationFile, stale_paths, stale_extensions))
+    for i, result in zip(stale, parsed_stale):
+        results[i] = result
+        if manifest is not None:
+            manifest.put_parsed(paths[i], *result)
+    for ann, (parsed, parsedType) in zip(annotations, results):
+        if parsedType:
             ann["parsed"] = parsed
-            ann["parsedType"] = parsed.get("type", "csv")
+            ann["parsedType"] = parsedType
     return annotations
 
 
+def _parseAnnotationFile(path, extension):
+    """Return ``(parsed, parsedType)``; module level so it can run in a process pool."""
+    if extension == ".json":
+        return _load_json_annotation(path)
+    if extension == ".jsonl":
+        return _read_jsonl(path), "jsonl"
+    parsed = _parseAnnotationCSV(path)
+    return parsed, parsed.get("type", "csv")
+
+
+def _load_json_annotation(path):
+    """Load a ``.json`` annotation file, streaming it if it is a JSON object (COCO)."""
+    with open(path) as f:
+        first = f.read(1)
+        while first and _JSON_WHITESPACE.fullmatch(first):
+            first = f.read(1)
+        if first == "{":
+            parsed = _load_coco_streaming(f)
+            return parsed, "coco" if parsed else None
+        f.seek(0)
+        parsed = json.load(f)
+    return parsed, _guessAnnotationFileFormat(parsed, ".json")
+
+
+def _load_coco_streaming(f):
+    """Read the rest of a COCO object from ``f`` (just past its opening brace) one element at a time.
+
+    Only the image entries and the small header fields are kept as Python objects.
+    Each annotation is re-serialized as soon as it is decoded and grouped by
+    ``image_id``, so memory stays close to the size of the annotations' text rather
+    than the full decoded object graph. Returns None if the object is not COCO.
+    """
+    reader = _JsonReader(f)
+    header = {}
+    images = None
+    annotationsByImage = None
+    while True:
+        if reader.punct("}", ","):
+            if reader.last == "}":
+                break
+            continue
+        key = reader.value()
+        reader.expect(":")
+        if key == "images" and reader.peek() == "[":
+            images = list(reader.array_items())
+        elif key == "annotations" and reader.peek() == "[":
+            annotationsByImage = defaultdict(list)
+            for annotation in reader.array_items():
+                annotationsByImage[annotation.get("image_id")].append(json.dumps(annotation))
+        elif key in ("info", "licenses", "categories"):
+            header[key] = reader.value()
+        else:
+            reader.value()
+    if images is None or annotationsByImage is None:
+        return None
+    return {
+        "images": images,
+        "annotationsByImage": annotationsByImage,
+        # everything json.dumps emits for a single-image document before the image entry
+        "header": (
+            f'{{"info": {json.dumps(header.get("info", {}))}, '
+            f'"licenses": {json.dumps(header.get("licenses", []))}, '
+            f'"categories": {json.dumps(header.get("categories", []))}, "images": ['
+        ),
+    }
+
+
+class _JsonReader:
+    """Minimal incremental reader over a text file for walking one level of a JSON document."""
+
+    def __init__(self, f):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+        self.last = ""
+
+    def _fill(self, size=_JSON_READ_SIZE):
+        chunk = self._f.read(max(size, len(self._buf) - self._pos))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self._pos = _JSON_WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise json.JSONDecodeError("Unexpected end of file", self._buf, self._pos)
+
+    def punct(self, *chars):
+        """Consume and return True if the next token is one of ``chars``."""
+        if self.peek() in chars:
+            self.last = self._buf[self._pos]
+            self._pos += 1
+            return True
+        return False
+
+    def expect(self, char):
+        if not self.punct(char):
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof or not self._fill():
+                    raise
+                continue
+            # a number or literal running into the end of the buffer may continue in the next read
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array_items(self):
+        self.expect("[")
+        if self.punct("]"):
+            return
+        while True:
+            yield self.value()
+            if self.punct("]"):
+                return
+            self.expect(",")
+
+
 def _read_jsonl(path):
     data = []
     with open(path) as file:
@@ -392,14 +755,13 @@ def _decide_split(images):
             i["split"] = "train"
 
 
-def _infer_classification_labels_from_folders(images):
-    for image in images:
-        if image.get("annotationfile"):
-            continue
-        dirname = image.get("dirname", "").strip("/")
-        if not dirname or dirname == ".":
-            # Skip images in root directory or invalid paths
-            continue
-        class_name = os.path.basename(dirname)
-        if class_name and class_name != ".":
-            image["annotationfile"] = {"classification_label": class_name, "type": "classification_folder"}
+def _infer_classification_label_from_folder(image):
+    if image.get("annotationfile"):
+        return
+    dirname = image.get("dirname", "").strip("/")
+    if not dirname or dirname == ".":
+        # Skip images in root directory or invalid paths
+        return
+    class_name = os.path.basename(dirname)
+    if class_name and class_name != ".":
+        image["annotationfile"] = {"classification_label": class_name, "type": "classification_folder"}
@@ -1,8 +1,11 @@
+import concurrent.futures
 import os
 import sys
+import threading
 import time
 import zipfile
 from random import random
+from typing import List, Optional
 
 from tqdm import tqdm
 
@@ -48,20 +51,59 @@ class Retry:
                     raise
 
 
-def extract_zip(location: str, desc: str = "Extracting"):
+def extract_zip(location: str, desc: str = "Extracting", workers: Optional[int] = None) -> List[str]:
     """Extract ``roboflow.zip`` inside *location* and remove the archive.
 
+    Members are extracted concurrently; each worker thread reads through its own
+    handle on the archive, so decompression and file writes overlap.
+
     Args:
         location: Directory containing ``roboflow.zip``.
         desc: Description shown in the tqdm progress bar.
+        workers: Number of extraction threads; defaults to the standard thread pool size.
+
+    Returns:
+        Paths of the extracted files, relative to *location*.
     """
     zip_path = os.path.join(location, "roboflow.zip")
     tqdm_desc = None if TQDM_DISABLE else desc
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        for member in tqdm(zip_ref.infolist(), desc=tqdm_desc):
+    try:
+        # reads the central directory, so a truncated archive fails before anything is extracted
+        zip_file = zipfile.ZipFile(zip_path, "r")
+    except zipfile.BadZipFile as e:
+        raise RuntimeError(f"Error unzipping download: {zip_path} is not a complete zip archive ({e})")
+
+    handles = threading.local()
+    opened = [zip_file]
+    opened_lock = threading.Lock()
+
+    def _extract(member: zipfile.ZipInfo) -> str:
+        zip_ref = getattr(handles, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = handles.zip_ref = zipfile.ZipFile(zip_path, "r")
+            with opened_lock:
+                opened.append(zip_ref)
+        try:
+            return zip_ref.extract(member, location)
+        except FileExistsError:
+            # another thread created the same parent directory between zipfile's exists() check and makedirs()
+            return zip_ref.extract(member, location)
+
+    try:
+        members = zip_file.infolist()
+        extracted = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract, member) for member in members]
             try:
-                zip_ref.extract(member, location)
+                for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc=tqdm_desc):
+                    extracted.append(future.result())
             except zipfile.error:
+                for future in futures:
+                    future.cancel()
                 raise RuntimeError("Error unzipping download")
+    finally:
+        for zip_ref in opened:
+            zip_ref.close()
 
     os.remove(zip_path)
+    return [os.path.relpath(path, location) for path in extracted if not os.path.isdir(path)]
@@ -10,6 +10,8 @@ import requests
 import yaml
 from PIL import Image
 
+from roboflow.util.preprocessing import Transform
+
 # pi-heif requires Python 3.10+
 try:
     import pi_heif  # type: ignore[import-untyped,import-not-found]
@@ -103,6 +105,44 @@ def file2jpeg(image_path):
     return buffered.getvalue()
 
 
+def encode_frame(frame, bgr=True, quality=90, preprocessor=None):
+    """
+    JPEG-encode a NumPy frame for an inference request with a single encoder call
+    :param frame: HxW or HxWxC uint8 numpy.ndarray (e.g. a cv2 video frame)
+    :param bgr: whether the channels are in OpenCV's BGR(A) order rather than RGB(A); alpha is dropped
+    :param quality: JPEG quality (0-100)
+    :param preprocessor: optional roboflow.util.preprocessing.Preprocessor to crop and shrink the frame first
+    :returns: (JPEG bytes, image_dims of the original frame, Transform back to it)
+    """
+    import cv2
+
+    height, width = frame.shape[:2]
+    image_dims = {"width": str(width), "height": str(height)}
+    transform = Transform()
+    if preprocessor:
+        box, target = preprocessor.plan((width, height))
+        offset_x = offset_y = 0
+        if box is not None:
+            # a view into the frame, not a copy
+            frame = frame[box[1] : box[3], box[0] : box[2]]
+            offset_x, offset_y = box[0], box[1]
+        crop_height, crop_width = frame.shape[:2]
+        if target != (crop_width, crop_height):
+            frame = cv2.resize(frame, target, interpolation=cv2.INTER_AREA)
+        transform = Transform(crop_width / target[0], crop_height / target[1], offset_x, offset_y)
+
+    channels = frame.shape[2] if frame.ndim == 3 else 1
+    if channels == 4:
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR if bgr else cv2.COLOR_RGBA2BGR)
+    elif channels == 3 and not bgr:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+
+    ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, int(quality)])
+    if not ok:
+        raise ValueError(f"Could not encode a frame of shape {frame.shape} and type {frame.dtype} as JPEG")
+    return buffer.tobytes(), image_dims, transform
+
+
 def load_labelmap(f):
     if f.lower().endswith(".yaml") or f.lower().endswith(".yml"):
         with open(f) as file:
@@ -494,6 +494,23 @@ class PredictionGroup:
         prediction_group_json["image"] = self.image_dims
         return prediction_group_json
 
+    def to_arrays(self):
+        """
+        Columnar copy of the group's boxes, scores, classes, polygons and keypoints as NumPy arrays.
+
+        :return: roboflow.util.detections.Detections
+        """
+        from roboflow.util.detections import Detections
+
+        if self.predictions and self.base_prediction_type not in (
+            OBJECT_DETECTION_MODEL,
+            INSTANCE_SEGMENTATION_MODEL,
+            KEYPOINT_DETECTION_MODEL,
+        ):
+            raise ValueError(f"{self.base_prediction_type} predictions have no boxes to convert")
+        image_dims = self.image_dims if isinstance(self.image_dims, dict) else {}
+        return Detections.from_json({"predictions": [p.json() for p in self.predictions], "image": image_dims})
+
     @staticmethod
     def create_prediction_group(json_response, image_path, prediction_type, image_dims, colors=None):
         """
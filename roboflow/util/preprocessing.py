@@ -0,0 +1,163 @@
+"""Client-side share of a version's preprocessing, applied before an image is sent for inference.
+
+Hosted models resize every image to their input size, so uploading a full
+resolution photo only to have it shrunk on the server wastes bandwidth and
+encoding time. :class:`Preprocessor` reads ``Version.preprocessing`` and does
+the size-reducing steps locally:
+
+* ``static-crop``: the crop is cut out before upload and the server is told
+  not to crop again (``disable_preproc_static_crop``);
+* ``resize``: "Stretch to" shrinks the image to the model size; the
+  "Fit ..." (letterbox) and "Fill ..." modes shrink it keeping its aspect
+  ratio, leaving the padding or centre crop to the server.
+
+Images are only ever made smaller. The returned :class:`Transform` maps
+coordinates in the sent image back to the original one; it rescales the boxes,
+polygon points and keypoints of a response in a single vectorised step.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# query parameter telling the inference server the static crop was done client-side
+DISABLE_STATIC_CROP_PARAM = "disable_preproc_static_crop"
+
+
+class Transform(NamedTuple):
+    """``original = sent * scale + offset``, per axis."""
+
+    scale_x: float = 1.0
+    scale_y: float = 1.0
+    offset_x: float = 0.0
+    offset_y: float = 0.0
+
+    @property
+    def is_identity(self) -> bool:
+        return self == Transform()
+
+    def rescale_predictions(self, predictions: List[dict]) -> List[dict]:
+        """
+        Map the coordinates of ``predictions`` (modified in place) from the sent image to the original.
+
+        Handles box centres and sizes (``x``, ``y``, ``width``, ``height``),
+        instance segmentation ``points`` and ``keypoints``.
+        """
+        if self.is_identity or not predictions:
+            return predictions
+        import numpy as np
+
+        # gather every (x, y) pair of every prediction into one array
+        slots: List[dict] = []
+        for prediction in predictions:
+            if "x" in prediction and "y" in prediction:
+                slots.append(prediction)
+            slots.extend(prediction.get("points") or [])
+            slots.extend(prediction.get("keypoints") or [])
+        if slots:
+            xy = np.array([(slot["x"], slot["y"]) for slot in slots], dtype=np.float64)
+            xy = xy * (self.scale_x, self.scale_y) + (self.offset_x, self.offset_y)
+            for slot, (x, y) in zip(slots, xy.tolist()):
+                slot["x"], slot["y"] = x, y
+
+        sized = [p for p in predictions if "width" in p and "height" in p]
+        if sized:
+            wh = np.array([(p["width"], p["height"]) for p in sized], dtype=np.float64) * (self.scale_x, self.scale_y)
+            for prediction, (width, height) in zip(sized, wh.tolist()):
+                prediction["width"], prediction["height"] = width, height
+        return predictions
+
+
+class Preprocessor:
+    """
+    Applies the resize and static crop of a version's preprocessing to images before upload.
+
+    Args:
+        preprocessing (dict): ``Version.preprocessing``
+        static_crop (bool): apply ``static-crop`` client-side; disable for models whose
+            output cannot be mapped back through a crop (e.g. free-form VLM text). The
+            resize is then skipped as well when the version has a static crop, since the
+            server would otherwise crop the shrunken image and upscale the crop.
+
+    Example:
+        >>> preprocessor = Preprocessor(version.preprocessing)
+        >>> image, transform = preprocessor.apply(Image.open("photo.jpg"))
+        >>> # ... send image, then
+        >>> transform.rescale_predictions(response["predictions"])
+    """
+
+    def __init__(self, preprocessing: Optional[dict], static_crop: bool = True):
+        preprocessing = preprocessing or {}
+        crop = _enabled(preprocessing.get("static-crop"))
+        self.static_crop = crop if static_crop else None
+        # a crop left to the server needs the full-resolution image
+        self.resize = _enabled(preprocessing.get("resize")) if static_crop or crop is None else None
+
+    def __bool__(self) -> bool:
+        return bool(self.resize or self.static_crop)
+
+    def plan(self, size: Tuple[int, int]) -> Tuple[Optional[Tuple[int, int, int, int]], Tuple[int, int]]:
+        """
+        ``(crop box or None, size to send)`` for an image of ``size``, without touching any pixels.
+
+        The size equals the (cropped) image size when no resize is needed.
+        """
+        width, height = size
+        box = None
+        if self.static_crop:
+            box = (
+                int(width * float(self.static_crop.get("x_min", 0)) / 100),
+                int(height * float(self.static_crop.get("y_min", 0)) / 100),
+                int(width * float(self.static_crop.get("x_max", 100)) / 100),
+                int(height * float(self.static_crop.get("y_max", 100)) / 100),
+            )
+            if box[2] <= box[0] or box[3] <= box[1] or box == (0, 0, width, height):
+                box = None
+            else:
+                width, height = box[2] - box[0], box[3] - box[1]
+        return box, self._target_size(width, height)
+
+    def apply(self, image: Image.Image) -> Tuple[Image.Image, Transform]:
+        """Crop and shrink ``image``; returns the image to send and the transform back to ``image``'s coordinates."""
+        if not self:
+            return image, Transform()
+        box, target = self.plan(image.size)
+        offset_x = offset_y = 0
+        if box is not None:
+            image = image.crop(box)
+            offset_x, offset_y = box[0], box[1]
+        width, height = image.size
+        if target != (width, height):
+            image = image.resize(target)
+        return image, Transform(width / target[0], height / target[1], offset_x, offset_y)
+
+    def _target_size(self, width: int, height: int) -> Tuple[int, int]:
+        if not self.resize:
+            return width, height
+        try:
+            target_width, target_height = int(self.resize["width"]), int(self.resize["height"])
+        except (KeyError, TypeError, ValueError):
+            return width, height
+        mode = str(self.resize.get("format", ""))
+        if mode.startswith("Stretch"):
+            if width > target_width or height > target_height:
+                return target_width, target_height
+            return width, height
+        if mode.startswith("Fit"):
+            scale = min(target_width / width, target_height / height)
+        elif mode.startswith("Fill"):
+            scale = max(target_width / width, target_height / height)
+        else:
+            return width, height
+        if scale >= 1:
+            return width, height
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def _enabled(step) -> Optional[dict]:
+    if not isinstance(step, dict) or step.get("enabled") is False:
+        return None
+    return step
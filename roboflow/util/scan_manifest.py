@@ -0,0 +1,148 @@
+"""On-disk manifest of previous ``folderparser.parsefolder`` scans.
+
+Rescanning a large, slowly growing dataset folder spends most of its time
+listing directories and parsing shared annotation files that have not changed
+since the last run. The manifest remembers:
+
+* each directory's listing, keyed by its absolute path and mtime. A directory's
+  mtime changes whenever an entry is added, removed or renamed in it, so an
+  unchanged mtime means the listing can be reused without reading the
+  directory again;
+* each parsed annotation file (COCO, CreateML, CSV, JSONL), keyed by its
+  absolute path, size and mtime. The parse result is stored as a single JSON
+  value, so files larger than ``max_parsed_size`` (multi-GB COCO exports) are
+  not cached: reloading them would briefly hold the whole JSON text next to
+  the decoded result, which is the memory spike the streaming COCO parser
+  avoids.
+
+Only new or changed directories and annotation files are read on the next
+run. Entries modified within the last couple of seconds are not recorded,
+since a change in the same mtime tick would otherwise go unnoticed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from roboflow.config import CACHE_DIR
+
+DEFAULT_PATH = os.path.join(CACHE_DIR, "scan-manifest.sqlite")
+
+# Skip recording anything modified this recently (coarse filesystem timestamps).
+_RACY_WINDOW_NS = 2_000_000_000
+
+DEFAULT_MAX_PARSED_SIZE = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    files TEXT NOT NULL,
+    subdirs TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS annotations (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    parsed_type TEXT,
+    parsed TEXT
+);
+"""
+
+
+class ScanManifest:
+    """
+    Thread-safe SQLite cache of directory listings and parsed annotation files.
+
+    Args:
+        path (str): location of the SQLite file; defaults to ``scan-manifest.sqlite``
+            under ``ROBOFLOW_CACHE_DIR``. Parent directories are created.
+        max_parsed_size (int): annotation files larger than this many bytes are parsed
+            on every scan instead of being cached
+
+    Example:
+        >>> from roboflow.util import folderparser
+        >>> from roboflow.util.scan_manifest import ScanManifest
+
+        >>> with ScanManifest() as manifest:
+        ...     parsed = folderparser.parsefolder("dataset/", manifest=manifest)
+    """
+
+    def __init__(self, path: Optional[str] = None, max_parsed_size: int = DEFAULT_MAX_PARSED_SIZE):
+        self.path = path or DEFAULT_PATH
+        self.max_parsed_size = max_parsed_size
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def listing(self, path: str) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Names of the files and subdirectories of ``path`` as of its current mtime, or ``None``.
+
+        ``None`` means the directory changed (or was never recorded) and must be read.
+        """
+        path = os.path.abspath(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        with self._lock:
+            row = self._conn.execute("SELECT mtime_ns, files, subdirs FROM dirs WHERE path = ?", (path,)).fetchone()
+        if row is None or row[0] != mtime_ns:
+            return None
+        return json.loads(row[1]), json.loads(row[2])
+
+    def put_listing(self, path: str, files: List[str], subdirs: List[str]) -> None:
+        path = os.path.abspath(path)
+        mtime_ns = os.stat(path).st_mtime_ns
+        if _is_racy(mtime_ns):
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO dirs (path, mtime_ns, files, subdirs) VALUES (?, ?, ?, ?)",
+                (path, mtime_ns, json.dumps(files), json.dumps(subdirs)),
+            )
+
+    def parsed(self, path: str) -> Optional[Tuple[Any, Optional[str]]]:
+        """``(parsed, parsedType)`` recorded for ``path`` while its size and mtime are unchanged, or ``None``."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if stat.st_size > self.max_parsed_size:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, parsed_type, parsed FROM annotations WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or row[0] != stat.st_size or row[1] != stat.st_mtime_ns:
+            return None
+        return (json.loads(row[3]) if row[3] is not None else None), row[2]
+
+    def put_parsed(self, path: str, parsed: Any, parsed_type: Optional[str]) -> None:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        if _is_racy(stat.st_mtime_ns) or stat.st_size > self.max_parsed_size:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO annotations (path, size, mtime_ns, parsed_type, parsed) VALUES (?, ?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, parsed_type, json.dumps(parsed) if parsed_type else None),
+            )
+
+
+def _is_racy(mtime_ns: int) -> bool:
+    return time.time_ns() - mtime_ns < _RACY_WINDOW_NS
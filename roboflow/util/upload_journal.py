@@ -0,0 +1,123 @@
+"""On-disk journal that lets ``Workspace.upload_dataset`` resume after a crash.
+
+Each image is recorded under ``(project, absolute path)`` together with the
+file's size and mtime, the image id returned by the server and the state of
+its annotation. A rerun that points at the same journal skips images whose
+upload and annotation already completed, re-saves only the annotation when
+the image went through but the annotation did not, and retries everything
+else. A file whose size or mtime changed since it was journaled is treated
+as new.
+
+The journal is a SQLite database, so it survives hard crashes and can be
+shared by the worker threads of a single upload.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+IMAGE_UPLOADED = "uploaded"
+IMAGE_FAILED = "failed"
+
+ANNOTATION_SAVED = "saved"
+ANNOTATION_NONE = "none"
+ANNOTATION_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    project TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    image_id TEXT,
+    image_status TEXT,
+    annotation_status TEXT,
+    error TEXT,
+    updated REAL NOT NULL,
+    PRIMARY KEY (project, path)
+)
+"""
+
+
+class JournalKey(NamedTuple):
+    project: str
+    path: str
+    size: int
+    mtime: float
+
+
+class UploadJournal:
+    """
+    Thread-safe SQLite journal of per-image upload progress.
+
+    Args:
+        path (str): location of the SQLite file; parent directories are created
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def key(self, project: str, path: str) -> JournalKey:
+        """Identify ``path`` in ``project`` by its absolute path and current size/mtime."""
+        stat = os.stat(path)
+        return JournalKey(project, os.path.abspath(path), stat.st_size, stat.st_mtime)
+
+    def lookup(self, key: JournalKey) -> Optional[Dict[str, Any]]:
+        """Return the journal entry for ``key`` if the file is unchanged since it was recorded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM uploads WHERE project = ? AND path = ?", (key.project, key.path)
+            ).fetchone()
+        if row is None or row["size"] != key.size or row["mtime"] != key.mtime:
+            return None
+        return dict(row)
+
+    @staticmethod
+    def is_complete(entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(
+            entry
+            and entry["image_status"] == IMAGE_UPLOADED
+            and entry["annotation_status"] in (ANNOTATION_SAVED, ANNOTATION_NONE)
+        )
+
+    def record_image(self, key: JournalKey, image_id: str) -> None:
+        self._upsert(key, image_id=image_id, image_status=IMAGE_UPLOADED, annotation_status=None, error=None)
+
+    def record_image_failure(self, key: JournalKey, error: str) -> None:
+        self._upsert(key, image_id=None, image_status=IMAGE_FAILED, annotation_status=None, error=error)
+
+    def record_annotation(self, key: JournalKey, status: str, error: Optional[str] = None) -> None:
+        self._upsert(key, annotation_status=status, error=error)
+
+    def _upsert(self, key: JournalKey, **fields: Any) -> None:
+        columns = ["project", "path", "size", "mtime", "updated", *fields]
+        values = [*key, time.time(), *fields.values()]
+        updates = ", ".join(f"{c} = excluded.{c}" for c in ["size", "mtime", "updated", *fields])
+        sql = (
+            f"INSERT INTO uploads ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (project, path) DO UPDATE SET {updates}"
+        )
+        with self._lock:
+            self._conn.execute(sql, values)
@@ -0,0 +1,425 @@
+"""Write dataset directories as zip archives without a single-core deflate pass.
+
+Images in formats that are already compressed (JPEG, PNG, AVIF, HEIC, ...) are
+stored as-is; deflating them costs CPU and saves next to nothing. Everything
+else (annotations, labelmaps, CSV/JSON) is deflated by a pool of threads
+(``zlib`` releases the GIL) and written in directory order. The writer only
+ever appends, so the archive can go to an unseekable stream: :func:`iter_zip`
+yields it in chunks that can be sent as a request body while it is being
+built, without a temporary file. :func:`zip_size` gives the archive's exact
+length beforehand (for a ``Content-Length``) without reading stored files.
+
+``zipfile`` cannot write pre-compressed entry data, so the container format
+(local headers, data descriptors, central directory, ZIP64 records) is
+written here directly; archives read back with ``zipfile`` or any unzip tool.
+"""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import IO, Any, Deque, Iterator, List, NamedTuple, Optional, Tuple
+
+STORED_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".avif",
+        ".heic",
+        ".heif",
+        ".webp",
+        ".gif",
+        ".mp4",
+        ".mov",
+        ".zip",
+        ".gz",
+    }
+)
+
+_STORED = 0
+_DEFLATED = 8
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+_VERSION = 20
+_VERSION_ZIP64 = 45
+_MADE_BY = (3 << 8) | _VERSION_ZIP64  # unix
+_FILE_ATTRS = (0o100644 & 0xFFFF) << 16
+_MAX32 = 0xFFFFFFFF
+_MAX16 = 0xFFFF
+
+_READ_SIZE = 1 << 20
+# Deflatable files up to this size are compressed by the worker pool in memory;
+# larger ones are compressed while streaming so memory stays bounded.
+_MAX_BUFFERED = 32 << 20
+
+
+class _Entry(NamedTuple):
+    name: bytes
+    method: int
+    flags: int
+    dostime: int
+    dosdate: int
+    crc: int
+    compress_size: int
+    file_size: int
+    offset: int
+
+
+def iter_dataset_files(src_dir: str) -> Iterator[Tuple[str, str]]:
+    """Yield ``(path, arcname)`` for every file under ``src_dir``, skipping hidden and macOS-junk entries."""
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__MACOSX"]
+        for name in files:
+            if name.startswith(".") or name == "Thumbs.db":
+                continue
+            path = os.path.join(root, name)
+            yield path, os.path.relpath(path, src_dir).replace(os.sep, "/")
+
+
+def _dos_datetime(mtime: float) -> Tuple[int, int]:
+    t = time.localtime(mtime)
+    if t.tm_year < 1980:
+        return 0, (0 << 9) | (1 << 5) | 1
+    dostime = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dosdate = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dostime, dosdate
+
+
+def _deflate_file(path: str, level: int) -> Tuple[int, int, bytes]:
+    with open(path, "rb") as fh:
+        data = fh.read()
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return zlib.crc32(data), len(data), compressor.compress(data) + compressor.flush()
+
+
+class ZipStreamWriter:
+    """
+    Append-only zip writer for seekable or unseekable binary streams.
+
+    Args:
+        fileobj: binary stream with a ``write`` method; never seeked
+        measure: only count the archive's bytes; stored files are not read and
+            their data is not written
+    """
+
+    def __init__(self, fileobj: IO[bytes], measure: bool = False):
+        self._fh = fileobj
+        self._measure = measure
+        self._offset = 0
+        self._entries: List[_Entry] = []
+
+    @property
+    def size(self) -> int:
+        """Bytes written so far."""
+        return self._offset
+
+    def _write(self, data: bytes) -> None:
+        self._fh.write(data)
+        self._offset += len(data)
+
+    def _local_header(self, entry: _Entry, zip64: bool) -> None:
+        extra = b""
+        crc, compress_size, file_size = entry.crc, entry.compress_size, entry.file_size
+        if zip64:
+            extra = struct.pack("<HHQQ", 1, 16, file_size, compress_size)
+            compress_size = file_size = 0xFFFFFFFF
+        self._write(
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,
+                _VERSION_ZIP64 if zip64 else _VERSION,
+                entry.flags,
+                entry.method,
+                entry.dostime,
+                entry.dosdate,
+                crc,
+                compress_size,
+                file_size,
+                len(entry.name),
+                len(extra),
+            )
+            + entry.name
+            + extra
+        )
+
+    def write_bytes(self, arcname: str, mtime: float, crc: int, file_size: int, data: bytes, method: int) -> None:
+        """Add an entry whose (possibly deflated) payload is already in memory."""
+        dostime, dosdate = _dos_datetime(mtime)
+        entry = _Entry(
+            arcname.encode("utf-8"), method, _FLAG_UTF8, dostime, dosdate, crc, len(data), file_size, self._offset
+        )
+        self._local_header(entry, zip64=max(file_size, len(data)) >= _MAX32)
+        self._write(data)
+        self._entries.append(entry)
+
+    def write_file(self, arcname: str, path: str, deflate: bool, level: int = 6) -> None:
+        """Stream the file at ``path`` into the archive, deflating it on the fly when ``deflate``."""
+        stat = os.stat(path)
+        dostime, dosdate = _dos_datetime(stat.st_mtime)
+        method = _DEFLATED if deflate else _STORED
+        zip64 = stat.st_size >= _MAX32 - (_MAX32 >> 8)  # leave room for deflate overhead
+        header = _Entry(
+            arcname.encode("utf-8"),
+            method,
+            _FLAG_UTF8 | _FLAG_DATA_DESCRIPTOR,
+            dostime,
+            dosdate,
+            0,
+            0,
+            0,
+            self._offset,
+        )
+        self._local_header(header, zip64)
+
+        crc, file_size, compress_size = 0, 0, 0
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15) if deflate else None
+        if self._measure and not deflate:
+            # a stored entry's data is the file itself, and its CRC field is fixed-size
+            file_size = compress_size = stat.st_size
+            self._offset += file_size
+        else:
+            with open(path, "rb") as fh:
+                for chunk in iter(lambda: fh.read(_READ_SIZE), b""):
+                    crc = zlib.crc32(chunk, crc)
+                    file_size += len(chunk)
+                    out = compressor.compress(chunk) if compressor else chunk
+                    compress_size += len(out)
+                    self._write(out)
+        if compressor:
+            out = compressor.flush()
+            compress_size += len(out)
+            self._write(out)
+
+        self._write(struct.pack("<IIQQ" if zip64 else "<IIII", 0x08074B50, crc, compress_size, file_size))
+        self._entries.append(header._replace(crc=crc, compress_size=compress_size, file_size=file_size))
+
+    def close(self) -> None:
+        """Write the central directory; the underlying stream is left open."""
+        cd_offset = self._offset
+        for entry in self._entries:
+            extra_fields = []
+            file_size, compress_size, offset = entry.file_size, entry.compress_size, entry.offset
+            if file_size >= _MAX32:
+                extra_fields.append(file_size)
+                file_size = 0xFFFFFFFF
+            if compress_size >= _MAX32:
+                extra_fields.append(compress_size)
+                compress_size = 0xFFFFFFFF
+            if offset >= _MAX32:
+                extra_fields.append(offset)
+                offset = 0xFFFFFFFF
+            extra = (
+                struct.pack(f"<HH{len(extra_fields)}Q", 1, 8 * len(extra_fields), *extra_fields)
+                if extra_fields
+                else b""
+            )
+            self._write(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII",
+                    0x02014B50,
+                    _MADE_BY,
+                    _VERSION_ZIP64 if extra else _VERSION,
+                    entry.flags,
+                    entry.method,
+                    entry.dostime,
+                    entry.dosdate,
+                    entry.crc,
+                    compress_size,
+                    file_size,
+                    len(entry.name),
+                    len(extra),
+                    0,
+                    0,
+                    0,
+                    _FILE_ATTRS,
+                    offset,
+                )
+                + entry.name
+                + extra
+            )
+        cd_size = self._offset - cd_offset
+        count = len(self._entries)
+
+        # Fields that overflow hold the all-ones marker pointing readers at the ZIP64 record.
+        count16 = count if count <= _MAX16 else 0xFFFF
+        cd_size32 = cd_size if cd_size < _MAX32 else 0xFFFFFFFF
+        cd_offset32 = cd_offset if cd_offset < _MAX32 else 0xFFFFFFFF
+        if count > _MAX16 or cd_size >= _MAX32 or cd_offset >= _MAX32:
+            eocd64_offset = self._offset
+            self._write(
+                struct.pack(
+                    "<IQHHIIQQQQ",
+                    0x06064B50,
+                    44,
+                    _MADE_BY,
+                    _VERSION_ZIP64,
+                    0,
+                    0,
+                    count,
+                    count,
+                    cd_size,
+                    cd_offset,
+                )
+            )
+            self._write(struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1))
+        self._write(
+            struct.pack(
+                "<IHHHHIIH",
+                0x06054B50,
+                0,
+                0,
+                count16,
+                count16,
+                cd_size32,
+                cd_offset32,
+                0,
+            )
+        )
+
+
+def write_zip(
+    src_dir: str, fileobj: IO[bytes], workers: Optional[int] = None, level: int = 6, measure: bool = False
+) -> int:
+    """
+    Write ``src_dir`` to ``fileobj`` as a zip archive and return its size in bytes.
+
+    Files with an extension in :data:`STORED_EXTENSIONS` are stored; the rest
+    are deflated at ``level`` on ``workers`` threads (default: CPU count).
+    With ``measure``, stored files are not read (see :class:`ZipStreamWriter`).
+    """
+    workers = workers or os.cpu_count() or 1
+    writer = ZipStreamWriter(fileobj, measure=measure)
+    pending: Deque[Tuple[str, str, Optional[concurrent.futures.Future]]] = collections.deque()
+
+    def _flush_one() -> None:
+        path, arcname, future = pending.popleft()
+        if future is None:
+            writer.write_file(arcname, path, deflate=_should_deflate(path), level=level)
+        else:
+            crc, file_size, data = future.result()
+            writer.write_bytes(arcname, os.stat(path).st_mtime, crc, file_size, data, _DEFLATED)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, arcname in iter_dataset_files(src_dir):
+            future = None
+            if _should_deflate(path) and os.path.getsize(path) <= _MAX_BUFFERED:
+                future = pool.submit(_deflate_file, path, level)
+            pending.append((path, arcname, future))
+            if len(pending) > 4 * workers:
+                _flush_one()
+        while pending:
+            _flush_one()
+    writer.close()
+    return writer.size
+
+
+def zip_size(src_dir: str, workers: Optional[int] = None, level: int = 6) -> int:
+    """
+    Exact length of the archive :func:`write_zip` and :func:`iter_zip` produce for ``src_dir``.
+
+    Stored files only contribute their size; deflated files are compressed to
+    learn theirs (``zlib`` output is deterministic), so this costs a deflate
+    pass over annotations but no read of the images. The directory must not
+    change between measuring and writing.
+    """
+    return write_zip(src_dir, _NullWriter(), workers=workers, level=level, measure=True)  # type: ignore[arg-type]
+
+
+def _should_deflate(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() not in STORED_EXTENSIONS
+
+
+class _NullWriter:
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+class _Cancelled(Exception):
+    pass
+
+
+_DONE = object()
+
+
+class _QueueWriter:
+    """File-like sink that hands fixed-size chunks to a bounded queue."""
+
+    def __init__(self, chunks: queue.Queue, chunk_size: int, cancelled: threading.Event):
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._cancelled = cancelled
+        self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self.put(bytes(self._buffer[: self._chunk_size]))
+            del self._buffer[: self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.put(bytes(self._buffer))
+            self._buffer.clear()
+
+    def put(self, item: Any) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _Cancelled
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+def iter_zip(
+    src_dir: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 1 << 20,
+    max_buffered_chunks: int = 8,
+) -> Iterator[bytes]:
+    """
+    Yield the zip archive of ``src_dir`` in ``chunk_size`` pieces while it is being written.
+
+    The archive is produced on a background thread and at most
+    ``max_buffered_chunks`` chunks are held in memory. Closing the generator
+    early stops the producer.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=max_buffered_chunks)
+    cancelled = threading.Event()
+    sink = _QueueWriter(chunks, chunk_size, cancelled)
+
+    def _produce() -> None:
+        try:
+            write_zip(src_dir, sink, workers=workers)  # type: ignore[arg-type]
+            sink.flush()
+            sink.put(_DONE)
+        except _Cancelled:
+            pass
+        except BaseException as e:
+            try:
+                sink.put(e)
+            except _Cancelled:
+                pass
+
+    producer = threading.Thread(target=_produce, name="roboflow-zipstream", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = chunks.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        cancelled.set()
+        producer.join()
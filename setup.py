@@ -29,8 +29,10 @@ setuptools.setup(
     packages=find_packages(exclude=("tests",)),
     # create optional [desktop]
     extras_require={
+        "aio": ["httpx"],
         "desktop": ["opencv-python==4.8.0.74"],
         "dev": [
+            "httpx",
             "mypy",
             "responses",
             "ruff",
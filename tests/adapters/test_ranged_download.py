@@ -0,0 +1,180 @@
+import base64
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from roboflow.adapters import ranged_download
+from roboflow.adapters.ranged_download import DownloadError
+
+
+class _FileServer(BaseHTTPRequestHandler):
+    """Serves ``server.data``, honouring Range and If-Range when ``server.ranges`` is set."""
+
+    server: "_Server"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = state.data
+        state.requests.append(self.headers.get("Range"))
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range") or "")
+        if_range = self.headers.get("If-Range")
+        if state.ranges and match and (if_range is None or if_range == state.etag):
+            start, end = int(match.group(1)), int(match.group(2))
+            if start in state.fail_once:
+                state.fail_once.discard(start)
+                self.send_response(500)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if start >= len(data):
+                self.send_response(416)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            end = min(end, len(data) - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+            body = data[start : end + 1]
+        else:
+            self.send_response(200)
+            body = data
+        self.send_header("ETag", state.etag)
+        if state.md5 is not None:
+            self.send_header("x-goog-hash", f"crc32c=AAAAAA==,md5={state.md5}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if match and int(match.group(1)) in state.drop_once:
+            # connection lost mid-body
+            state.drop_once.discard(int(match.group(1)))
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+        if state.replace_after_first:
+            state.etag = '"v2"'
+
+
+class _Server(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FileServer)
+        self.data = b""
+        self.etag = '"v1"'
+        self.ranges = True
+        self.replace_after_first = False
+        self.fail_once = set()
+        self.drop_once = set()
+        self.md5 = None
+        self.requests = []
+
+
+class TestRangedDownload(unittest.TestCase):
+    def setUp(self):
+        self.server = _Server()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/export.zip"
+        self.server.data = os.urandom(3500)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "roboflow.zip")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _read(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def test_downloads_ranges_in_parallel(self):
+        progress = []
+        size = ranged_download.download(
+            self.url, self.path, connections=3, part_size=1000, progress=lambda done, total: progress.append(total)
+        )
+        self.assertEqual(size, 3500)
+        self.assertEqual(self._read(), self.server.data)
+        self.assertEqual(
+            sorted(self.server.requests), ["bytes=0-999", "bytes=1000-1999", "bytes=2000-2999", "bytes=3000-3499"]
+        )
+        self.assertEqual(set(progress), {3500})
+
+    def test_falls_back_to_single_stream_without_range_support(self):
+        self.server.ranges = False
+        size = ranged_download.download(self.url, self.path, connections=4, part_size=1000)
+        self.assertEqual(size, 3500)
+        self.assertEqual(self._read(), self.server.data)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_empty_file(self):
+        self.server.data = b""
+        self.assertEqual(ranged_download.download(self.url, self.path, part_size=1000), 0)
+        self.assertEqual(self._read(), b"")
+
+    def test_file_replaced_mid_download_is_an_error(self):
+        self.server.replace_after_first = True
+        with self.assertRaises(DownloadError):
+            ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+
+    def test_resumes_only_the_missing_parts(self):
+        self.server.fail_once = {3000}
+        with self.assertRaises(DownloadError):
+            ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertTrue(os.path.exists(f"{self.path}.partial.json"))
+
+        self.server.requests.clear()
+        progress = []
+        ranged_download.download(
+            self.url, self.path, connections=2, part_size=1000, progress=lambda done, total: progress.append(done)
+        )
+        self.assertEqual(self._read(), self.server.data)
+        # the first request is always made (it carries the size and ETag); only the failed part is refetched
+        self.assertEqual(self.server.requests, ["bytes=0-999", "bytes=3000-3499"])
+        self.assertEqual(progress[-1], 3500)
+        self.assertFalse(os.path.exists(f"{self.path}.partial"))
+        self.assertFalse(os.path.exists(f"{self.path}.partial.json"))
+
+    def test_connection_lost_mid_part_keeps_the_checkpoint(self):
+        self.server.drop_once = {2000}
+        with self.assertRaisesRegex(DownloadError, "connection lost"):
+            ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+        self.assertTrue(os.path.exists(f"{self.path}.partial.json"))
+
+        self.server.requests.clear()
+        ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+        self.assertEqual(self._read(), self.server.data)
+        self.assertIn("bytes=2000-2999", self.server.requests)
+        self.assertNotIn("bytes=1000-1999", self.server.requests)
+
+    def test_checksum_is_verified(self):
+        self.server.md5 = base64.b64encode(hashlib.md5(self.server.data).digest()).decode()
+        ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+        self.assertEqual(self._read(), self.server.data)
+
+        os.remove(self.path)
+        self.server.md5 = base64.b64encode(hashlib.md5(b"something else").digest()).decode()
+        with self.assertRaisesRegex(DownloadError, "corrupt"):
+            ranged_download.download(self.url, self.path, connections=2, part_size=1000)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(f"{self.path}.partial"))
+
+    def test_http_error(self):
+        url = f"http://127.0.0.1:{self.server.server_port}/missing"
+        with self.assertRaises(DownloadError) as ctx:
+            ranged_download.download(url, self.path)
+        self.assertEqual(ctx.exception.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
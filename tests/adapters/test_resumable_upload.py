@@ -0,0 +1,136 @@
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from roboflow.adapters import resumable_upload
+from roboflow.adapters.resumable_upload import CHUNK_GRANULARITY, ResumableUploadError
+
+
+class _FakeGCS(BaseHTTPRequestHandler):
+    """Minimal stand-in for a GCS resumable upload endpoint."""
+
+    server: "_Server"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.headers.get("x-goog-resumable") != "start":
+            self.send_response(403)
+            self.end_headers()
+            return
+        self.send_response(201)
+        self.send_header("Location", f"http://127.0.0.1:{self.server.server_port}/session")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        first, total = re.match(r"bytes (\d+|\*)-?\d*/(\d+|\*)", self.headers["Content-Range"]).groups()
+        state = self.server
+        if first != "*":
+            state.chunk_starts.append(int(first))
+            if state.failures:
+                keep = state.failures.pop(0)
+                state.data += body[:keep]
+                self._reply(503)
+                return
+            state.data += body[len(state.data) - int(first) :]
+        if total != "*" and len(state.data) == int(total):
+            self._reply(200)
+        else:
+            self._reply(308, {"Range": f"bytes=0-{len(state.data) - 1}"} if state.data else {})
+
+    def _reply(self, status, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class _Server(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeGCS)
+        self.data = b""
+        self.chunk_starts = []
+        self.failures = []  # bytes to keep from each failing PUT, in order
+
+
+class TestResumableUpload(unittest.TestCase):
+    def setUp(self):
+        self.server = _Server()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.signed_url = f"http://127.0.0.1:{self.server.server_port}/upload"
+        self.payload = os.urandom(3 * CHUNK_GRANULARITY + 123)
+        sleep = patch("roboflow.adapters.resumable_upload.time.sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_file_upload_retries_only_the_failed_chunk(self):
+        with tempfile.NamedTemporaryFile(delete=False) as fh:
+            fh.write(self.payload)
+        self.addCleanup(os.unlink, fh.name)
+        self.server.failures = [0]
+        progress = []
+
+        session = resumable_upload.start_session(self.signed_url)
+        resumable_upload.upload(
+            session,
+            fh.name,
+            chunk_size=CHUNK_GRANULARITY,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+        self.assertEqual(self.server.data, self.payload)
+        step = CHUNK_GRANULARITY
+        self.assertEqual(self.server.chunk_starts, [0, 0, step, 2 * step, 3 * step])
+        self.assertEqual(progress[-1], (len(self.payload), len(self.payload)))
+        self.assertEqual(len(progress), 4)
+
+    def test_stream_resends_only_the_unpersisted_tail(self):
+        self.server.failures = [1000]
+        pieces = (self.payload[i : i + 5000] for i in range(0, len(self.payload), 5000))
+
+        session = resumable_upload.start_session(self.signed_url)
+        resumable_upload.upload(session, pieces, chunk_size=2 * CHUNK_GRANULARITY)
+
+        self.assertEqual(self.server.data, self.payload)
+        self.assertEqual(self.server.chunk_starts, [0, 1000, 2 * CHUNK_GRANULARITY])
+
+    def test_resume_skips_bytes_already_in_the_session(self):
+        session = resumable_upload.start_session(self.signed_url)
+        self.server.data = self.payload[:CHUNK_GRANULARITY]
+
+        resumable_upload.upload(session, iter([self.payload]), chunk_size=CHUNK_GRANULARITY, resume=True)
+
+        self.assertEqual(self.server.data, self.payload)
+        self.assertEqual(self.server.chunk_starts[0], CHUNK_GRANULARITY)
+
+    def test_gives_up_after_max_retries(self):
+        self.server.failures = [0, 0, 0]
+        session = resumable_upload.start_session(self.signed_url)
+        with self.assertRaises(ResumableUploadError):
+            resumable_upload.upload(session, iter([self.payload]), max_retries=2)
+
+    def test_start_session_rejected(self):
+        with patch("roboflow.adapters.resumable_upload.transport.post") as post:
+            post.return_value.status_code = 403
+            post.return_value.headers = {}
+            with self.assertRaises(ResumableUploadError) as ctx:
+                resumable_upload.start_session(self.signed_url)
+        self.assertEqual(ctx.exception.status_code, 403)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+import responses
+
+from roboflow.adapters import rfapi, transport
+from roboflow.config import API_URL
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self._previous = transport.get_transport()
+
+    def tearDown(self):
+        transport.set_transport(self._previous)
+
+    def test_session_is_built_once_with_sized_pool(self):
+        t = transport.Transport(pool_connections=3, pool_maxsize=7)
+        session = t.session
+        self.assertIs(session, t.session)
+        adapter = session.get_adapter("https://api.roboflow.com")
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+
+    def test_default_timeout_does_not_override_per_call_timeout(self):
+        session = MagicMock(spec=requests.Session)
+        t = transport.Transport(session=session, timeout=(5, 30))
+
+        t.request("GET", "https://example.com/a")
+        t.request("GET", "https://example.com/b", timeout=1)
+
+        self.assertEqual(session.request.call_args_list[0].kwargs["timeout"], (5, 30))
+        self.assertEqual(session.request.call_args_list[1].kwargs["timeout"], 1)
+
+    def test_set_session_routes_adapter_calls(self):
+        session = MagicMock(spec=requests.Session)
+        session.request.return_value.status_code = 200
+        session.request.return_value.json.return_value = {"workspace": {}}
+        transport.set_session(session)
+
+        self.assertEqual(rfapi.get_workspace("key", "ws"), {"workspace": {}})
+        session.request.assert_called_once_with("GET", f"{API_URL}/ws?api_key=key")
+
+    @responses.activate
+    def test_configure_replaces_shared_transport(self):
+        responses.add(responses.GET, f"{API_URL}/ws?api_key=key", json={"workspace": {}}, status=200)
+        previous = transport.configure(pool_maxsize=4, timeout=10)
+
+        self.assertIs(previous, self._previous)
+        self.assertEqual(transport.get_transport().pool_maxsize, 4)
+        rfapi.get_workspace("key", "ws")
+        self.assertEqual(len(responses.calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,14 @@
+import base64
+import copy
+import io
 import unittest
 
 import responses
-from PIL import UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
 from requests.exceptions import HTTPError
 
 from roboflow.config import OBJECT_DETECTION_URL
+from roboflow.models.inference import PredictionError
 from roboflow.models.object_detection import ObjectDetectionModel
 from roboflow.util.prediction import PredictionGroup
 
@@ -151,3 +155,88 @@ class TestObjectDetection(unittest.TestCase):
 
         with self.assertRaises(HTTPError):
             instance.predict(image_path)
+
+    @responses.activate
+    def test_predict_batch_yields_results_in_order_and_captures_errors(self):
+        instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version)
+        responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
+        images = ["tests/images/rabbit.JPG", "tests/images/missing.jpg", "tests/images/rabbit2.jpg"]
+
+        results = list(instance.predict_batch(images, concurrency=2))
+
+        self.assertEqual(len(results), 3)
+        self.assertIsInstance(results[0], PredictionGroup)
+        self.assertEqual(results[0].base_image_path, images[0])
+        self.assertIsInstance(results[1], PredictionError)
+        self.assertEqual(results[1].image_path, images[1])
+        self.assertIsInstance(results[2], PredictionGroup)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_predict_encodings(self):
+        image_path = "tests/images/rabbit.JPG"
+        with open(image_path, "rb") as f:
+            original = f.read()
+        responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
+
+        sent = {}
+        for encoding in ("png", "jpeg", "passthrough"):
+            instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version, encoding=encoding)
+            group = instance.predict(image_path)
+            sent[encoding] = base64.b64decode(responses.calls[-1].request.body)
+            self.assertEqual(group.image_dims, {"width": "1024", "height": "992"})
+
+        self.assertTrue(sent["png"].startswith(b"\x89PNG"))
+        self.assertTrue(sent["jpeg"].startswith(b"\xff\xd8"))
+        self.assertLess(len(sent["jpeg"]), len(sent["png"]))
+        self.assertEqual(sent["passthrough"], original)
+
+    @responses.activate
+    def test_predict_multipart_sends_raw_bytes(self):
+        image_path = "tests/images/rabbit.JPG"
+        with open(image_path, "rb") as f:
+            original = f.read()
+        responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
+        instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version)
+
+        instance.predict(image_path, encoding="passthrough", multipart=True)
+
+        request = responses.calls[0].request
+        self.assertTrue(request.headers["Content-Type"].startswith("multipart/form-data"))
+        body = request.body if isinstance(request.body, bytes) else request.body.read()
+        self.assertIn(original, body)
+
+    def test_unknown_encoding_raises(self):
+        with self.assertRaises(ValueError):
+            ObjectDetectionModel(self.api_key, self.version_id, version=self.version, encoding="webp")
+
+    @responses.activate
+    def test_predict_shrinks_to_preprocessing_size_and_rescales_boxes(self):
+        image_path = "tests/images/rabbit.JPG"  # 1024x992
+        preprocessing = {"resize": {"enabled": True, "width": "512", "height": "496", "format": "Stretch to"}}
+        instance = ObjectDetectionModel(
+            self.api_key, self.version_id, version=self.version, preprocessing=preprocessing, encoding="jpeg"
+        )
+        responses.add(responses.POST, self.api_url, json=copy.deepcopy(MOCK_RESPONSE))
+
+        group = instance.predict(image_path)
+
+        sent = Image.open(io.BytesIO(base64.b64decode(responses.calls[0].request.body)))
+        self.assertEqual(sent.size, (512, 496))
+        prediction = group.predictions[0]
+        self.assertEqual((prediction["x"], prediction["y"]), (379.0, 200.0))
+        self.assertEqual((prediction["width"], prediction["height"]), (326.0, 372.0))
+        self.assertEqual(group.image_dims, {"width": "1024", "height": "992"})
+
+    @responses.activate
+    def test_predict_on_array_reports_frame_dims(self):
+        import numpy as np
+
+        instance = ObjectDetectionModel(self.api_key, self.version_id, version=self.version)
+        responses.add(responses.POST, self.api_url, json=MOCK_RESPONSE)
+
+        group = instance.predict(np.zeros((120, 160, 3), np.uint8))
+
+        self.assertEqual(group.image_dims, {"width": "160", "height": "120"})
+        sent = base64.b64decode(responses.calls[0].request.body)
+        self.assertTrue(sent.startswith(b"\xff\xd8"))
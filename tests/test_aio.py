@@ -0,0 +1,141 @@
+import asyncio
+import json
+import os
+import unittest
+
+from roboflow.adapters.rfapi import ImageUploadError
+
+try:
+    import httpx
+
+    from roboflow.aio import AsyncWorkspace
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+WORKSPACE = "my-workspace"
+PROJECT = "test-project"
+API_KEY = "my-test-app"
+IMAGE_PATH = os.path.join(os.path.dirname(__file__), "images", "rabbit.JPG")
+
+PROJECT_INFO = {
+    "id": f"{WORKSPACE}/{PROJECT}",
+    "type": "object-detection",
+    "name": "Hard Hat Sample",
+    "created": 1593802673.521,
+    "updated": 1663269501.654,
+    "images": 100,
+    "unannotated": 3,
+    "annotation": "Workers",
+    "public": False,
+    "splits": {"train": 70, "test": 10, "valid": 20},
+    "colors": {"helmet": "#C7FC00"},
+    "classes": {"helmet": 287},
+}
+VERSION_INFO = {
+    "id": f"{WORKSPACE}/{PROJECT}/1",
+    "created": 1663104679.539,
+    "images": 240,
+    "splits": {"train": 210, "test": 10, "valid": 20},
+    "preprocessing": {},
+    "augmentation": {},
+    "exports": [],
+}
+
+
+def _handler(request):
+    path = request.url.path
+    if request.method == "POST" and path == "/":
+        return httpx.Response(200, json={"workspace": WORKSPACE})
+    if path == f"/{WORKSPACE}":
+        return httpx.Response(200, json={"workspace": {"name": "W", "url": WORKSPACE, "projects": []}})
+    if path == f"/{WORKSPACE}/{PROJECT}":
+        return httpx.Response(200, json={"project": PROJECT_INFO, "versions": [VERSION_INFO]})
+    if path == f"/{WORKSPACE}/search/v1":
+        body = json.loads(request.content)
+        if body.get("continuationToken"):
+            return httpx.Response(200, json={"results": [{"id": "b"}], "continuationToken": None})
+        return httpx.Response(200, json={"results": [{"id": "a"}], "continuationToken": "next"})
+    if path == f"/dataset/{PROJECT}/upload":
+        if request.url.params["batch"] == "broken":
+            return httpx.Response(500, json={"error": {"message": "boom"}})
+        assert b"multipart/form-data" in request.headers["content-type"].encode()
+        return httpx.Response(200, json={"success": True, "id": request.url.params["batch"]})
+    if path.startswith(f"/dataset/{PROJECT}/annotate/"):
+        return httpx.Response(200, json={"success": True})
+    if path == f"/{PROJECT}/1":
+        return httpx.Response(
+            200,
+            json={
+                "image": {"width": 640, "height": 480},
+                "predictions": [
+                    {"x": 10, "y": 10, "width": 4, "height": 4, "class": "helmet", "confidence": 0.9},
+                ],
+            },
+        )
+    return httpx.Response(404, text=f"unexpected {request.method} {request.url}")
+
+
+@unittest.skipIf(httpx is None, "httpx is not installed")
+class TestAsyncClient(unittest.TestCase):
+    def _run(self, coro_fn):
+        async def main():
+            client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            async with await AsyncWorkspace.load(api_key=API_KEY, client=client) as ws:
+                result = await coro_fn(ws)
+            self.assertFalse(client.is_closed)  # caller-owned clients are left open
+            await client.aclose()
+            return result
+
+        return asyncio.run(main())
+
+    def test_load_resolves_default_workspace(self):
+        url = self._run(lambda ws: asyncio.sleep(0, ws.url))
+        self.assertEqual(url, WORKSPACE)
+
+    def test_search_all_follows_continuation_token(self):
+        async def collect(ws):
+            return [page async for page in ws.search_all("tag:x")]
+
+        self.assertEqual(self._run(collect), [[{"id": "a"}], [{"id": "b"}]])
+
+    def test_concurrent_uploads_and_annotations(self):
+        async def upload(ws):
+            project = await ws.project(PROJECT)
+            return await asyncio.gather(
+                *(
+                    project.single_upload(
+                        image_path=IMAGE_PATH,
+                        annotation_path={"name": "a.json", "rawText": "{}"},
+                        batch_name=f"batch-{i}",
+                    )
+                    for i in range(5)
+                )
+            )
+
+        results = self._run(upload)
+        self.assertEqual(sorted(r["image"]["id"] for r in results), [f"batch-{i}" for i in range(5)])
+        self.assertTrue(all(r["annotation"] == {"success": True} for r in results))
+
+    def test_upload_error_matches_sync_adapter(self):
+        async def upload(ws):
+            project = await ws.project(PROJECT)
+            return await project.upload_image(IMAGE_PATH, batch_name="broken")
+
+        with self.assertRaises(ImageUploadError) as ctx:
+            self._run(upload)
+        self.assertEqual(ctx.exception.message, "boom")
+        self.assertEqual(ctx.exception.status_code, 500)
+
+    def test_version_predict(self):
+        async def predict(ws):
+            version = await (await ws.project(PROJECT)).version(1)
+            return await version.predict(IMAGE_PATH, confidence=40)
+
+        group = self._run(predict)
+        self.assertEqual(len(group), 1)
+        self.assertEqual(group[0]["class"], "helmet")
+        self.assertEqual(group.image_dims, {"width": "640", "height": "480"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,8 @@
 import json
+import os
+import re
+import tempfile
+import threading
 from unittest.mock import patch
 
 import requests
@@ -8,6 +12,8 @@ from responses.matchers import json_params_matcher
 from roboflow import API_URL
 from roboflow.adapters.rfapi import AnnotationSaveError, ImageUploadError
 from roboflow.config import DEFAULT_BATCH_NAME
+from roboflow.util.adaptive_concurrency import AdaptiveConcurrency
+from roboflow.util.dedupe_cache import DedupeCache
 from tests import PROJECT_NAME, ROBOFLOW_API_KEY, WORKSPACE_NAME, RoboflowTest, ordered
 
 
@@ -366,7 +372,8 @@ class TestProject(RoboflowTest):
                 "name": "concurrent_uploads",
                 "dataset": [{"file": f"image{i}.jpg", "split": "train"} for i in range(10)],
                 "params": {"num_workers": 5},
-                "assertions": {"thread_pool": {"count": 1, "kwargs": {"max_workers": 5}}},
+                # one pool for image uploads, one for annotation saves
+                "assertions": {"thread_pool": {"count": 2, "kwargs": {"max_workers": 5}}},
                 "extra_mocks": [("thread_pool", "concurrent.futures.ThreadPoolExecutor", {})],
             },
             {"name": "empty_dataset", "dataset": [], "params": {}, "assertions": {"upload": {"count": 0}}},
@@ -792,6 +799,132 @@ class TestProject(RoboflowTest):
             for mock in mocks.values():
                 mock.stop()
 
+    def test_upload_dataset_resumes_from_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ("a.jpg", "b.jpg", "c.jpg"):
+                with open(os.path.join(tmp, name), "wb") as fh:
+                    fh.write(name.encode())
+            dataset = {
+                "location": tmp,
+                "images": [
+                    {"file": f"/{name}", "split": "train", "annotationfile": {"rawText": "{}", "name": "x.json"}}
+                    for name in ("a.jpg", "b.jpg", "c.jpg")
+                ],
+            }
+            journal_path = os.path.join(tmp, "journal.sqlite")
+
+            def flaky_upload(image_path, **kwargs):
+                if image_path.endswith("b.jpg"):
+                    raise ImageUploadError("network blip")
+                return ({"id": os.path.basename(image_path), "success": True}, 0.1, 0)
+
+            def flaky_annotation(annotation_path, image_id, **kwargs):
+                if image_id == "c.jpg":
+                    raise AnnotationSaveError("server busy")
+                return ({"success": True}, 0.1, 0)
+
+            mocks = self._setup_upload_dataset_mocks(
+                test_dataset=dataset,
+                upload_image_side_effect=flaky_upload,
+                save_annotation_side_effect=flaky_annotation,
+            )
+            mock_objects = {name: mock.start() for name, mock in mocks.items()}
+            try:
+                params = {"dataset_path": tmp, "project_name": PROJECT_NAME, "journal_path": journal_path}
+                self.workspace.upload_dataset(**params)
+                self.assertEqual(mock_objects["upload"].call_count, 3)
+
+                mock_objects["upload"].reset_mock(side_effect=True)
+                mock_objects["upload"].side_effect = lambda image_path, **kwargs: (
+                    {"id": os.path.basename(image_path), "success": True},
+                    0.1,
+                    0,
+                )
+                mock_objects["save_annotation"].reset_mock(side_effect=True)
+                mock_objects["save_annotation"].return_value = ({"success": True}, 0.1, 0)
+
+                self.workspace.upload_dataset(**params)
+
+                # a.jpg is skipped, b.jpg is re-uploaded, c.jpg only re-saves its annotation
+                uploaded = [c.kwargs["image_path"] for c in mock_objects["upload"].call_args_list]
+                self.assertEqual(uploaded, [f"{tmp}/b.jpg"])
+                annotated = sorted(c.kwargs["image_id"] for c in mock_objects["save_annotation"].call_args_list)
+                self.assertEqual(annotated, ["b.jpg", "c.jpg"])
+            finally:
+                for mock in mocks.values():
+                    mock.stop()
+
+    def test_upload_dataset_with_adaptive_concurrency(self):
+        dataset = self._create_test_dataset([{"file": f"image{i}.jpg", "split": "train"} for i in range(6)])
+        limiter = AdaptiveConcurrency(max_concurrency=4)
+        mocks = self._setup_upload_dataset_mocks(test_dataset=dataset)
+        mock_objects = {name: mock.start() for name, mock in mocks.items()}
+        try:
+            self.workspace.upload_dataset("/test/dataset", PROJECT_NAME, num_workers=4, adaptive_concurrency=limiter)
+            self.assertEqual(mock_objects["upload"].call_count, 6)
+            self.assertEqual(limiter.in_flight, 0)
+            self.assertLessEqual(limiter.concurrency, 4)
+        finally:
+            for mock in mocks.values():
+                mock.stop()
+
+    def test_upload_dataset_uploads_continue_while_annotations_save(self):
+        dataset = self._create_test_dataset(
+            [
+                {"file": f"image{i}.jpg", "split": "train", "annotationfile": {"rawText": "{}", "name": "x.json"}}
+                for i in range(3)
+            ]
+        )
+        all_uploaded = threading.Event()
+        uploaded, waits = [], []
+
+        def upload(image_path, **kwargs):
+            uploaded.append(image_path)
+            if len(uploaded) == 3:
+                all_uploaded.set()
+            return ({"id": os.path.basename(image_path), "success": True}, 0.1, 0)
+
+        def slow_annotation(annotation_path, image_id, **kwargs):
+            # With a single worker per stage this only returns once the upload
+            # stage has moved past the image whose annotation is being saved.
+            waits.append(all_uploaded.wait(5))
+            return ({"success": True}, 0.1, 0)
+
+        mocks = self._setup_upload_dataset_mocks(
+            test_dataset=dataset, upload_image_side_effect=upload, save_annotation_side_effect=slow_annotation
+        )
+        mock_objects = {name: mock.start() for name, mock in mocks.items()}
+        try:
+            self.workspace.upload_dataset("/test/dataset", PROJECT_NAME, num_workers=1, num_annotation_workers=1)
+            self.assertEqual(mock_objects["save_annotation"].call_count, 3)
+            self.assertEqual(waits, [True, True, True])
+        finally:
+            for mock in mocks.values():
+                mock.stop()
+
+    def test_upload_image_skips_images_in_dedupe_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_path = os.path.join(tmp, "a.jpg")
+            copy_path = os.path.join(tmp, "copy-of-a.jpg")
+            for path in (image_path, copy_path):
+                with open(path, "wb") as fh:
+                    fh.write(b"same pixels")
+            cache = DedupeCache(os.path.join(tmp, "dedupe.sqlite"))
+            self.project.use_dedupe_cache(cache)
+            try:
+                with patch(
+                    "roboflow.adapters.rfapi.upload_image", return_value={"id": "img-1", "success": True}
+                ) as upload:
+                    self.project.upload_image(image_path)
+                    image, _, retries = self.project.upload_image(copy_path)
+
+                self.assertEqual(upload.call_count, 1)
+                self.assertEqual(image, {"id": "img-1", "duplicate": True})
+                self.assertEqual(retries, 0)
+            finally:
+                self.project.dedupe_cache = None
+                cache.close()
+
     def test_search_with_annotation_job_params(self):
         """Test that annotation_job and annotation_job_id parameters are properly included in search requests"""
         # Test 1: Search with annotation_job=True
@@ -976,6 +1109,137 @@ class TestZipUpload(RoboflowTest):
             if _os.path.isdir(src_dir):
                 _os.rmdir(src_dir)
 
+    def test_directory_with_stream_zip_uploads_without_temp_file(self):
+        import io
+        import tempfile
+        import zipfile
+
+        with tempfile.TemporaryDirectory() as src_dir:
+            with open(os.path.join(src_dir, "image.jpg"), "wb") as fh:
+                fh.write(b"jpg bytes")
+            sent = {}
+
+            def consume(signed_url, chunks, size):
+                sent["url"] = signed_url
+                sent["body"] = b"".join(chunks)
+                sent["size"] = size
+
+            mocks = self._rfapi_mocks()
+            stream_mock = patch("roboflow.core.workspace.rfapi.upload_zip_stream_to_signed_url", side_effect=consume)
+            zip_dir_mock = patch("roboflow.core.workspace._zip_directory")
+            started = {name: m.start() for name, m in mocks.items()}
+            started["zip_dir"] = zip_dir_mock.start()
+            stream_mock.start()
+            try:
+                self.workspace.upload_dataset(
+                    dataset_path=src_dir, project_name=PROJECT_NAME, use_zip_upload=True, stream_zip=True
+                )
+                started["zip_dir"].assert_not_called()
+                started["put"].assert_not_called()
+                self.assertEqual(sent["url"], "https://signed.example/upload")
+                self.assertEqual(sent["size"], len(sent["body"]))
+                with zipfile.ZipFile(io.BytesIO(sent["body"])) as zf:
+                    self.assertEqual(zf.read("image.jpg"), b"jpg bytes")
+            finally:
+                for m in list(mocks.values()) + [zip_dir_mock, stream_mock]:
+                    m.stop()
+
+    def _fake_zip(self):
+        import tempfile
+
+        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as fh:
+            fh.write(b"fake zip")
+        self.addCleanup(os.unlink, fh.name)
+        return fh.name
+
+    def test_zip_chunk_size_uploads_through_a_resumable_session(self):
+        from roboflow.adapters.resumable_upload import CHUNK_GRANULARITY
+
+        payload = os.urandom(CHUNK_GRANULARITY + 1000)
+        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as fh:
+            fh.write(payload)
+        self.addCleanup(os.unlink, fh.name)
+        resumable_url = (
+            "https://storage.googleapis.com/roboflow-uploads/zip/task-123.zip"
+            "?X-Goog-Algorithm=GOOG4-RSA-SHA256&X-Goog-Credential=sa%2F20260101%2Fauto%2Fstorage%2Fgoog4_request"
+            "&X-Goog-Date=20260101T000000Z&X-Goog-Expires=604800&X-Goog-SignedHeaders=host%3Bx-goog-resumable"
+            "&X-Goog-Signature=abc123"
+        )
+        session_url = (
+            "https://storage.googleapis.com/upload/storage/v1/b/roboflow-uploads/o?uploadType=resumable&upload_id=xyz"
+        )
+        received = bytearray()
+
+        def start(request):
+            self.assertEqual(request.headers["x-goog-resumable"], "start")
+            return 201, {"Location": session_url}, b""
+
+        def put(request):
+            first, last, total = re.match(r"bytes (\d+)-(\d+)/(\d+|\*)", request.headers["Content-Range"]).groups()
+            self.assertEqual(int(first), len(received))
+            received.extend(request.body)
+            if total != "*" and len(received) == int(total):
+                return 200, {}, b""
+            return 308, {"Range": f"bytes=0-{len(received) - 1}"}, b""
+
+        responses.add_callback(responses.POST, resumable_url.split("?")[0], callback=start)
+        responses.add_callback(responses.PUT, session_url.split("?")[0], callback=put)
+
+        mocks = self._rfapi_mocks()
+        mocks["init"] = patch(
+            "roboflow.core.workspace.rfapi.init_zip_upload",
+            return_value={"signedUrl": "https://signed.example/upload", "resumableUrl": resumable_url, "taskId": "t"},
+        )
+        started = {name: m.start() for name, m in mocks.items()}
+        try:
+            self.workspace.upload_dataset(
+                dataset_path=fh.name, project_name=PROJECT_NAME, zip_chunk_size=CHUNK_GRANULARITY
+            )
+            self.assertTrue(started["init"].call_args.kwargs["resumable"])
+            started["put"].assert_not_called()
+            self.assertEqual(bytes(received), payload)
+        finally:
+            for m in mocks.values():
+                m.stop()
+
+    def test_zip_chunk_size_warns_and_falls_back_to_single_put(self):
+        from roboflow.adapters.resumable_upload import ResumableUploadError
+
+        zip_path = self._fake_zip()
+        # the server offers no resumable URL: the PUT signed URL is never used to start a session
+        mocks = self._rfapi_mocks()
+        start_mock = patch("roboflow.adapters.resumable_upload.start_session")
+        started = {name: m.start() for name, m in mocks.items()}
+        started["start"] = start_mock.start()
+        try:
+            with self.assertWarnsRegex(UserWarning, "single request"):
+                self.workspace.upload_dataset(dataset_path=zip_path, project_name=PROJECT_NAME, zip_chunk_size=1 << 20)
+            started["start"].assert_not_called()
+            started["put"].assert_called_once_with("https://signed.example/upload", zip_path)
+        finally:
+            for m in list(mocks.values()) + [start_mock]:
+                m.stop()
+
+        # the session cannot be started
+        mocks = self._rfapi_mocks()
+        mocks["init"] = patch(
+            "roboflow.core.workspace.rfapi.init_zip_upload",
+            return_value={"signedUrl": "https://signed.example/upload", "resumableUrl": "https://r", "taskId": "t"},
+        )
+        start_mock = patch(
+            "roboflow.adapters.resumable_upload.start_session",
+            side_effect=ResumableUploadError("forbidden", status_code=403),
+        )
+        started = {name: m.start() for name, m in mocks.items()}
+        start_mock.start()
+        try:
+            with self.assertWarnsRegex(UserWarning, "forbidden"):
+                self.workspace.upload_dataset(dataset_path=zip_path, project_name=PROJECT_NAME, zip_chunk_size=1 << 20)
+            started["put"].assert_called_once_with("https://signed.example/upload", zip_path)
+        finally:
+            for m in list(mocks.values()) + [start_mock]:
+                m.stop()
+
     def test_directory_default_stays_on_per_image(self):
         import tempfile
 
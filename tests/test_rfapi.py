@@ -1,8 +1,11 @@
+import io
 import json
 import os
+import threading
 import unittest
 import urllib
-from unittest.mock import mock_open, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
 
 import responses
 
@@ -13,6 +16,7 @@ from roboflow.adapters.rfapi import (
     get_training,
     list_trainings_for_version,
     upload_image,
+    upload_zip_stream_to_signed_url,
 )
 from roboflow.config import API_URL, DEFAULT_BATCH_NAME
 
@@ -29,7 +33,7 @@ class TestUploadImage(unittest.TestCase):
     IMAGE_NAME_HOSTED = os.path.basename(IMAGE_PATH_HOSTED)
 
     @responses.activate
-    @patch("roboflow.adapters.rfapi.open", new_callable=mock_open, read_data=b"image_data")
+    @patch("roboflow.adapters.rfapi.open", side_effect=lambda *args, **kwargs: io.BytesIO(b"image_data"))
     def test_upload_image_local(self, _mock_file):
         scenarios = [
             {
@@ -128,7 +132,7 @@ class TestUploadImage(unittest.TestCase):
                 self.assertTrue(result["success"], msg=f"Failed in scenario: {scenario['desc']}")
 
     @responses.activate
-    @patch("roboflow.adapters.rfapi.open", new_callable=mock_open, read_data=b"image_data")
+    @patch("roboflow.adapters.rfapi.open", side_effect=lambda *args, **kwargs: io.BytesIO(b"image_data"))
     def test_upload_image_local_with_metadata(self, _mock_file):
         metadata = {"camera_id": "cam001", "location": "warehouse"}
         expected_url = (
@@ -201,10 +205,76 @@ class TestUploadImage(unittest.TestCase):
         finally:
             os.unlink(tmp_path)
 
+    def test_upload_image_local_streams_from_file_handle(self):
+        import tempfile
+
+        raw_bytes = os.urandom(256 * 1024)
+        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tf:
+            tf.write(raw_bytes)
+            tmp_path = tf.name
+
+        sent = {}
+
+        def fake_post(url, data, **kwargs):
+            sent["file"] = data.fields["file"][1]
+            sent["body"] = b"".join(iter(lambda: data.read(8192), b""))
+            return MagicMock(status_code=200, json=lambda: {"success": True})
+
+        try:
+            with patch("roboflow.adapters.rfapi.transport.post", side_effect=fake_post):
+                result = upload_image(self.API_KEY, self.PROJECT_URL, tmp_path)
+        finally:
+            os.unlink(tmp_path)
+
+        self.assertTrue(result["success"])
+        self.assertNotIsInstance(sent["file"], bytes)
+        self.assertTrue(sent["file"].closed)
+        self.assertIn(raw_bytes, sent["body"])
+
     def _reset_responses(self):
         responses.reset()
 
 
+class _SignedUrlHandler(BaseHTTPRequestHandler):
+    """Like a signed-URL object store: refuses bodies without a Content-Length."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_PUT(self):
+        self.server.headers = dict(self.headers)
+        if "Content-Length" not in self.headers:
+            self.send_response(411)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            self.close_connection = True
+            return
+        self.server.body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class TestUploadZipStream(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SignedUrlHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/bucket/task.zip?X-Goog-Signature=abc"
+
+    def test_stream_is_sent_with_content_length(self):
+        chunks = [b"PK" * 100, b"x" * 50]
+        upload_zip_stream_to_signed_url(self.url, iter(chunks), 250)
+        self.assertEqual(self.server.body, b"".join(chunks))
+        self.assertEqual(self.server.headers["Content-Length"], "250")
+        self.assertNotIn("Transfer-Encoding", self.server.headers)
+
+    def test_stream_shorter_than_announced_is_an_error(self):
+        with self.assertRaisesRegex(RoboflowError, "10 of the announced 20 bytes"):
+            upload_zip_stream_to_signed_url(self.url, iter([b"x" * 10]), 20)
+
+
 class TestV2Trainings(unittest.TestCase):
     API_KEY = "test_api_key"
     WORKSPACE = "test-workspace"
@@ -1,5 +1,7 @@
 import os
+import tempfile
 import unittest
+import zipfile
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
@@ -16,6 +18,7 @@ from roboflow.config import (
 )
 from roboflow.core.version import Version, unwrap_version_id
 from roboflow.models.object_detection import ObjectDetectionModel
+from roboflow.util.dataset_cache import DatasetCache
 from tests.helpers import get_version
 
 
@@ -67,6 +70,78 @@ class TestDownload(unittest.TestCase):
         self.assertEqual(dataset.model_format, "coco")
         self.assertEqual(dataset.location, os.path.abspath("/my-spot"))
 
+    @responses.activate
+    @patch.object(Version, "_Version__download_zip")
+    @patch("roboflow.core.version.extract_zip")
+    @patch.object(Version, "_Version__reformat_yaml")
+    def test_download_resumes_an_interrupted_download(self, _reformat, extract, download_zip):
+        responses.add(responses.GET, self.api_url, json={"export": {"link": "https://example.com/export.zip"}})
+        mock_generating_url_response(self.generating_url)
+        with tempfile.TemporaryDirectory() as location:
+            open(os.path.join(location, "roboflow.zip.partial"), "wb").close()
+            self.version.download("coco", location=location)
+            download_zip.assert_called_once_with("https://example.com/export.zip", location, "coco")
+            extract.assert_called_once()
+
+            # a verified archive that was never extracted is extracted without downloading it again
+            download_zip.reset_mock()
+            extract.reset_mock()
+            os.remove(os.path.join(location, "roboflow.zip.partial"))
+            open(os.path.join(location, "roboflow.zip"), "wb").close()
+            self.version.download("coco", location=location)
+            download_zip.assert_not_called()
+            extract.assert_called_once()
+
+    @responses.activate
+    @patch.object(Version, "_Version__reformat_yaml")
+    def test_download_caches_only_the_exported_files(self, *_):
+        responses.add(responses.GET, self.api_url, json={"export": {"link": "https://example.com/export.zip"}})
+        mock_generating_url_response(self.generating_url)
+
+        def fake_download(link, location, model_format):
+            with zipfile.ZipFile(os.path.join(location, "roboflow.zip"), "w") as zf:
+                zf.writestr("train/a.jpg", b"image")
+                zf.writestr("data.yaml", b"nc: 1\n")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DatasetCache(os.path.join(tmp, "cache"))
+            location = os.path.join(tmp, "dataset")
+            os.makedirs(os.path.join(location, "old"))
+            for rel in ("best.pt", "old/photo.jpg"):
+                with open(os.path.join(location, rel), "wb") as fh:
+                    fh.write(b"not part of the export")
+
+            with patch.object(Version, "_Version__download_zip", side_effect=fake_download):
+                self.version.download("coco", location=location, overwrite=True, cache=cache)
+
+            key = ("test-workspace", "test-project", "4", "coco")
+            self.assertEqual(set(cache.manifest(key)), {"train/a.jpg", "data.yaml"})
+            self.assertEqual(os.stat(os.path.join(location, "old", "photo.jpg")).st_nlink, 1)
+            restored = os.path.join(tmp, "restored")
+            self.assertTrue(cache.restore(key, restored))
+            self.assertFalse(os.path.exists(os.path.join(restored, "best.pt")))
+            self.assertFalse(os.path.exists(os.path.join(restored, "old")))
+
+    @responses.activate
+    @patch.object(Version, "_Version__reformat_yaml")
+    def test_download_restores_cached_export_without_requests(self, *_):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = DatasetCache(os.path.join(tmp, "cache"))
+            export = os.path.join(tmp, "export")
+            os.makedirs(os.path.join(export, "train"))
+            with open(os.path.join(export, "train", "a.jpg"), "wb") as fh:
+                fh.write(b"image")
+            cache.store(("test-workspace", "test-project", "4", "coco"), export)
+
+            location = os.path.join(tmp, "dataset")
+            dataset = self.version.download("coco", location=location, cache=cache)
+
+            self.assertEqual(dataset.location, os.path.abspath(location))
+            self.assertTrue(
+                os.path.samefile(os.path.join(location, "train", "a.jpg"), os.path.join(export, "train", "a.jpg"))
+            )
+            self.assertEqual(len(responses.calls), 0)
+
 
 class TestExport(unittest.TestCase):
     def setUp(self):
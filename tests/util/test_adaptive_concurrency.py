@@ -0,0 +1,101 @@
+import threading
+import unittest
+
+import requests
+
+from roboflow.adapters.rfapi import ImageUploadError
+from roboflow.util.adaptive_concurrency import AdaptiveConcurrency, is_overload_error
+
+
+class TestAdaptiveConcurrency(unittest.TestCase):
+    def _complete(self, limiter, latency=0.1, overloaded=False):
+        limiter.acquire()
+        limiter.release(None if overloaded else latency, overloaded=overloaded)
+
+    def test_grows_one_step_per_healthy_round(self):
+        changes = []
+        limiter = AdaptiveConcurrency(max_concurrency=3, on_change=lambda n, rate: changes.append(n))
+
+        for _ in range(1 + 2 + 3):
+            self._complete(limiter)
+
+        self.assertEqual(limiter.concurrency, 3)
+        self.assertEqual(changes, [2, 3])
+        self.assertGreater(limiter.throughput, 0)
+
+    def test_overload_halves_once_per_round_trip(self):
+        limiter = AdaptiveConcurrency(max_concurrency=16, initial=16)
+        self._complete(limiter)  # establishes a latency estimate for the cooldown
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        limiter.release(overloaded=True)
+        self.assertEqual(limiter.concurrency, 8)
+
+        limiter._last_decrease -= 1.0
+        self._complete(limiter, overloaded=True)
+        self.assertEqual(limiter.concurrency, 4)
+
+    def test_rising_latency_backs_off(self):
+        limiter = AdaptiveConcurrency(max_concurrency=8, initial=8)
+        self._complete(limiter, latency=0.1)
+        for _ in range(3):
+            self._complete(limiter, latency=5.0)
+        self.assertEqual(limiter.concurrency, 4)
+
+    def test_recovers_after_a_fast_outlier(self):
+        limiter = AdaptiveConcurrency(max_concurrency=8, initial=8)
+        self._complete(limiter, latency=0.001)
+        for _ in range(20):
+            self._complete(limiter, latency=0.1)
+        self.assertLess(limiter.concurrency, 8)
+
+        # once the outlier leaves the baseline window, normal latency counts as healthy again
+        for _ in range(200):
+            self._complete(limiter, latency=0.1)
+        self.assertEqual(limiter.concurrency, 8)
+
+    def test_acquire_blocks_at_the_limit(self):
+        limiter = AdaptiveConcurrency(max_concurrency=4)
+        limiter.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        waiter.start()
+
+        self.assertFalse(acquired.wait(0.05))
+        limiter.release(0.1)
+        self.assertTrue(acquired.wait(1))
+        waiter.join()
+
+    def test_slot_classifies_errors(self):
+        limiter = AdaptiveConcurrency(max_concurrency=8, initial=8)
+        with self.assertRaises(ImageUploadError):
+            with limiter.slot():
+                raise ImageUploadError("Invalid image.", status_code=400)
+        self.assertEqual(limiter.concurrency, 8)
+
+        with self.assertRaises(ImageUploadError):
+            with limiter.slot():
+                raise ImageUploadError("Too many requests", status_code=429)
+        self.assertEqual(limiter.concurrency, 4)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_is_overload_error(self):
+        try:
+            try:
+                raise requests.ReadTimeout("timed out")
+            except requests.RequestException as e:
+                raise ImageUploadError(str(e)) from e
+        except ImageUploadError as e:
+            self.assertTrue(is_overload_error(e))
+        self.assertTrue(is_overload_error(ImageUploadError("bad gateway", status_code=502)))
+        self.assertFalse(is_overload_error(ValueError("nope")))
+
+    def test_rejects_invalid_bounds(self):
+        with self.assertRaises(ValueError):
+            AdaptiveConcurrency(max_concurrency=2, min_concurrency=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
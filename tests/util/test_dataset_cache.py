@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+
+from roboflow.util.dataset_cache import DatasetCache
+
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = DatasetCache(os.path.join(self.tmp.name, "cache"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _export(self, name, files):
+        location = os.path.join(self.tmp.name, name)
+        for rel, data in files.items():
+            path = os.path.join(location, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fh:
+                fh.write(data)
+        return location
+
+    def _read(self, path):
+        with open(path, "rb") as fh:
+            return fh.read()
+
+    def test_restore_recreates_export_with_linked_images(self):
+        files = {"train/a.jpg": b"image-a", "train/_annotations.coco.json": b"{}", "data.yaml": b"nc: 1\n"}
+        self.assertEqual(self.cache.store(("ws", "proj", 3, "coco"), self._export("v3", files)), 3)
+
+        restored = os.path.join(self.tmp.name, "restored")
+        self.assertTrue(self.cache.restore(("ws", "proj", 3, "coco"), restored))
+        for rel, data in files.items():
+            self.assertEqual(self._read(os.path.join(restored, rel)), data)
+        self.assertGreater(os.stat(os.path.join(restored, "train/a.jpg")).st_nlink, 1)
+        self.assertEqual(os.stat(os.path.join(restored, "data.yaml")).st_nlink, 1)
+
+        # text files are copies: rewriting one leaves the cache intact
+        with open(os.path.join(restored, "data.yaml"), "w") as fh:
+            fh.write("changed")
+        other = os.path.join(self.tmp.name, "other")
+        self.assertTrue(self.cache.restore(("ws", "proj", 3, "coco"), other))
+        self.assertEqual(self._read(os.path.join(other, "data.yaml")), b"nc: 1\n")
+
+    def test_identical_images_are_shared_across_versions(self):
+        v3 = self._export("v3", {"train/a.jpg": b"same", "train/b.jpg": b"old"})
+        v4 = self._export("v4", {"train/a.jpg": b"same", "train/b.jpg": b"new"})
+        self.cache.store(("ws", "proj", 3, "yolov8"), v3)
+        self.cache.store(("ws", "proj", 4, "yolov8"), v4)
+
+        self.assertTrue(os.path.samefile(os.path.join(v3, "train/a.jpg"), os.path.join(v4, "train/a.jpg")))
+        self.assertFalse(os.path.samefile(os.path.join(v3, "train/b.jpg"), os.path.join(v4, "train/b.jpg")))
+
+    def test_image_edited_in_place_does_not_poison_the_cache(self):
+        key = ("ws", "proj", 3, "coco")
+        self.cache.store(key, self._export("v3", {"train/a.jpg": b"original"}))
+        restored = os.path.join(self.tmp.name, "restored")
+        self.assertTrue(self.cache.restore(key, restored))
+
+        # same size, so only the content check can tell
+        edited = os.path.join(restored, "train/a.jpg")
+        with open(edited, "r+b") as fh:
+            fh.write(b"modified")
+        stat = os.stat(edited)
+        os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.cache.store(("ws", "proj", 3, "yolov8"), restored)
+
+        self.assertFalse(self.cache.restore(key, os.path.join(self.tmp.name, "stale")))
+        # a fresh download of the export replaces the damaged blob
+        self.cache.store(key, self._export("fresh", {"train/a.jpg": b"original"}))
+        again = os.path.join(self.tmp.name, "again")
+        self.assertTrue(self.cache.restore(key, again))
+        self.assertEqual(self._read(os.path.join(again, "train/a.jpg")), b"original")
+        self.assertEqual(self._read(edited), b"modified")
+
+    def test_restore_misses_on_unknown_key_or_missing_blob(self):
+        location = self._export("v3", {"a.png": b"png"})
+        self.cache.store(("ws", "proj", 3, "coco"), location)
+        target = os.path.join(self.tmp.name, "restored")
+
+        self.assertFalse(self.cache.restore(("ws", "proj", 3, "yolov8"), target))
+        for root, _, names in os.walk(os.path.join(self.cache.path, "blobs")):
+            for name in names:
+                os.remove(os.path.join(root, name))
+        self.assertFalse(self.cache.restore(("ws", "proj", 3, "coco"), target))
+        self.assertFalse(os.path.exists(target))
+
+
+if __name__ == "__main__":
+    unittest.main()
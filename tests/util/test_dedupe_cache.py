@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from roboflow.util.dedupe_cache import DedupeCache, hash_file
+
+
+class TestDedupeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image = os.path.join(self.tmp.name, "img.jpg")
+        with open(self.image, "wb") as fh:
+            fh.write(b"pixels")
+        self.cache = DedupeCache(os.path.join(self.tmp.name, "nested", "dedupe.sqlite"))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_digest_tracks_file_changes(self):
+        digest = self.cache.digest(self.image)
+        self.assertEqual(digest, hash_file(self.image))
+
+        with open(self.image, "ab") as fh:
+            fh.write(b" more pixels")
+        os.utime(self.image, (0, 12345))
+        self.assertNotEqual(self.cache.digest(self.image), digest)
+
+    def test_entries_are_scoped_per_project_and_forgettable(self):
+        self.cache.put("ws/proj", "abc", "img-1")
+        self.assertEqual(self.cache.get("ws/proj", "abc"), "img-1")
+        self.assertIsNone(self.cache.get("ws/other", "abc"))
+
+        self.cache.forget("ws/proj", ["img-1"])
+        self.assertIsNone(self.cache.get("ws/proj", "abc"))
+
+    def test_warm_records_results_with_a_hash(self):
+        project = MagicMock(id="ws/proj")
+        project.search_all.return_value = iter([[{"id": "img-1", "hash": "abc"}, {"id": "img-2"}], []])
+
+        self.assertEqual(self.cache.warm(project), 1)
+        self.assertEqual(self.cache.get("ws/proj", "abc"), "img-1")
+        project.search_all.assert_called_once_with(limit=250, fields=["id", "hash"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+
+from roboflow.config import CLASSIFICATION_MODEL, INSTANCE_SEGMENTATION_MODEL
+from roboflow.util.detections import Detections, box_iou
+from roboflow.util.prediction import PredictionGroup
+
+RESPONSE = {
+    "predictions": [
+        {"x": 50, "y": 50, "width": 20, "height": 20, "class": "cat", "class_id": 1, "confidence": 0.9},
+        {"x": 52, "y": 50, "width": 20, "height": 20, "class": "cat", "class_id": 1, "confidence": 0.6},
+        {"x": 50, "y": 50, "width": 20, "height": 20, "class": "dog", "class_id": 0, "confidence": 0.7},
+        {"x": 10, "y": 10, "width": 4, "height": 4, "class": "dog", "class_id": 0, "confidence": 0.2},
+    ],
+    "image": {"width": 100, "height": 80},
+}
+
+
+class TestDetections(unittest.TestCase):
+    def test_from_json_builds_columns(self):
+        import numpy as np
+
+        detections = Detections.from_json(RESPONSE)
+
+        self.assertEqual(len(detections), 4)
+        np.testing.assert_array_equal(detections.xyxy[0], [40, 40, 60, 60])
+        np.testing.assert_array_equal(detections.class_id, [1, 1, 0, 0])
+        self.assertEqual(detections.class_name.tolist(), ["cat", "cat", "dog", "dog"])
+        self.assertEqual(detections.image_size, (100, 80))
+        self.assertIsNone(detections.polygons)
+        self.assertEqual(len(Detections.from_json({"predictions": []})), 0)
+
+    def test_filter_and_boolean_indexing(self):
+        detections = Detections.from_json(RESPONSE)
+
+        self.assertEqual(detections.filter(confidence=0.5, classes=["dog"]).confidence.tolist(), [0.7])
+        self.assertEqual(len(detections[detections.confidence > 0.65]), 2)
+
+    def test_nms_per_class_and_agnostic(self):
+        detections = Detections.from_json(RESPONSE)
+
+        kept = detections.nms(iou_threshold=0.5)
+        self.assertEqual(kept.confidence.tolist(), [0.9, 0.7, 0.2])
+        kept = detections.nms(iou_threshold=0.5, class_agnostic=True)
+        self.assertEqual(kept.confidence.tolist(), [0.9, 0.2])
+
+    def test_iou(self):
+        import numpy as np
+
+        iou = box_iou([[0, 0, 10, 10]], [[0, 0, 10, 10], [5, 0, 15, 10], [20, 20, 30, 30]])
+        np.testing.assert_allclose(iou, [[1.0, 1 / 3, 0.0]])
+        self.assertEqual(Detections.from_json(RESPONSE).iou().shape, (4, 4))
+
+    def test_polygons_keypoints_and_masks(self):
+        import numpy as np
+
+        response = {
+            "predictions": [
+                {
+                    "x": 5,
+                    "y": 5,
+                    "width": 10,
+                    "height": 10,
+                    "class": "a",
+                    "confidence": 0.5,
+                    "points": [{"x": 0, "y": 0}, {"x": 9, "y": 0}, {"x": 9, "y": 9}, {"x": 0, "y": 9}],
+                    "keypoints": [{"x": 1, "y": 2, "confidence": 0.9}],
+                },
+                {"x": 15, "y": 5, "width": 2, "height": 2, "class": "b", "confidence": 0.4, "points": []},
+            ],
+            "image": {"width": 20, "height": 10},
+        }
+        detections = Detections.from_json(response)
+
+        self.assertEqual(detections.keypoints.shape, (2, 1, 3))
+        np.testing.assert_array_equal(detections.keypoints[0, 0], [1, 2, 0.9])
+        self.assertTrue(np.isnan(detections.keypoints[1]).all())
+        masks = detections.masks()
+        self.assertEqual(masks.shape, (2, 10, 20))
+        self.assertEqual(int(masks[0].sum()), 100)
+        self.assertFalse(masks[1].any())
+        self.assertEqual(len(detections[1:].polygons), 1)
+
+    def test_prediction_group_to_arrays(self):
+        group = PredictionGroup.create_prediction_group(
+            {"predictions": [dict(p) for p in RESPONSE["predictions"]]},
+            image_path="image.jpg",
+            prediction_type=INSTANCE_SEGMENTATION_MODEL,
+            image_dims={"width": "100", "height": "80"},
+        )
+        detections = group.to_arrays()
+        self.assertEqual(len(detections), 4)
+        self.assertEqual(detections.image_size, (100, 80))
+
+        classification = PredictionGroup.create_prediction_group(
+            {"top": "cat"}, image_path="image.jpg", prediction_type=CLASSIFICATION_MODEL, image_dims={}
+        )
+        with self.assertRaises(ValueError):
+            classification.to_arrays()
+
+
+if __name__ == "__main__":
+    unittest.main()
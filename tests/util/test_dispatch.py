@@ -0,0 +1,81 @@
+import threading
+import time
+import unittest
+
+from roboflow.util.dispatch import imap_bounded, run_bounded
+
+
+class TestRunBounded(unittest.TestCase):
+    def test_consumes_items_lazily_with_bounded_backlog(self):
+        release = threading.Event()
+        pulled = []
+        done = []
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        def work(i):
+            release.wait(5)
+            done.append(i)
+
+        runner = threading.Thread(target=run_bounded, args=(work, items()), kwargs={"max_workers": 2})
+        runner.start()
+        try:
+            # 2 running + 2 queued, plus the item waiting for a free slot
+            for _ in range(50):
+                if len(pulled) >= 5:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(len(pulled), 5)
+        finally:
+            release.set()
+            runner.join(5)
+
+        self.assertEqual(sorted(done), list(range(100)))
+
+    def test_first_error_stops_dispatch_and_is_raised(self):
+        calls = []
+
+        def work(i):
+            calls.append(i)
+            if i == 3:
+                raise ValueError("bad item")
+
+        with self.assertRaises(ValueError):
+            run_bounded(work, iter(range(1000)), max_workers=1, max_pending=1)
+        self.assertEqual(calls, [0, 1, 2, 3])
+
+
+class TestImapBounded(unittest.TestCase):
+    def test_ordered_results_keep_item_order_and_capture_errors(self):
+        def work(i):
+            time.sleep(0.01 * (5 - i))
+            if i == 2:
+                raise ValueError("bad item")
+            return i * 10
+
+        results = list(imap_bounded(work, range(5), max_workers=3))
+
+        self.assertEqual([item for item, _ in results], [0, 1, 2, 3, 4])
+        self.assertIsInstance(results[2][1].exception(), ValueError)
+        self.assertEqual([f.result() for i, f in results if i != 2], [0, 10, 30, 40])
+
+    def test_unordered_results_and_bounded_backlog(self):
+        pulled = []
+
+        def items():
+            for i in range(20):
+                pulled.append(i)
+                yield i
+
+        results = imap_bounded(lambda i: i, items(), max_workers=2, max_pending=3, ordered=False)
+        first = next(results)
+        self.assertLessEqual(len(pulled), 3)
+        rest = list(results)
+        self.assertEqual(sorted(f.result() for _, f in [first] + rest), list(range(20)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import os
 import tempfile
 import unittest
 from os.path import abspath, dirname
+from unittest.mock import patch
 
 from roboflow.util import folderparser
 
@@ -205,6 +206,115 @@ class TestFolderParser(unittest.TestCase):
             self.assertEqual(len(ann_data["annotations"]), 1, "Should have one annotation")
             self.assertEqual(ann_data["annotations"][0]["bbox"], [10, 20, 100, 200])
 
+    def test_coco_streaming_matches_full_json_load(self):
+        coco_path = f"{thisdir}/../datasets/sharks-tiny-coco/train/_annotations.coco.json"
+        with open(coco_path) as f:
+            coco = json.load(f)
+        # tiny reads force values to straddle buffer refills
+        with patch.object(folderparser, "_JSON_READ_SIZE", 7):
+            parsed, parsedType = folderparser._load_json_annotation(coco_path)
+        self.assertEqual(parsedType, "coco")
+        self.assertEqual(parsed["images"], coco["images"])
+
+        imgRefMap, annotationMap = folderparser._build_image_and_annotation_maps(
+            [{"file": "/ann.json", "parsed": parsed, "parsedType": "coco"}]
+        )
+        imageRef = coco["images"][0]
+        image = {"file": f"/{imageRef['file_name']}", "name": imageRef["file_name"], "key": ""}
+        result = folderparser._filterIndividualAnnotations(
+            image, {"file": "/ann.json", "parsed": parsed}, "coco", imgRefMap, annotationMap
+        )
+        expected = json.dumps(
+            {
+                "info": coco["info"],
+                "licenses": coco["licenses"],
+                "categories": coco["categories"],
+                "images": [imageRef],
+                "annotations": [a for a in coco["annotations"] if a["image_id"] == imageRef["id"]],
+            }
+        )
+        self.assertEqual(result["rawText"], expected)
+
+    def test_non_coco_json_object_is_ignored(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            f.write('{"images": {"not": "a list"}, "annotations": [], "extra": 12345}')
+        self.addCleanup(os.unlink, f.name)
+        with patch.object(folderparser, "_JSON_READ_SIZE", 3):
+            self.assertEqual(folderparser._load_json_annotation(f.name), (None, None))
+
+    def test_iter_parsefolder_matches_parsefolder(self):
+        folder = f"{thisdir}/../datasets/sharks-tiny-createml"
+        images = folderparser.iter_parsefolder(folder)
+        self.assertEqual(len(images), len(folderparser.parsefolder(folder)["images"]))
+        self.assertEqual(list(images), folderparser.parsefolder(folder)["images"])
+        self.assertEqual(list(images), [])
+
+    def test_iter_parsefolder_builds_annotations_on_demand(self):
+        folder = f"{thisdir}/../datasets/mosquitos"
+        with patch.object(
+            folderparser, "_filterIndividualAnnotations", wraps=folderparser._filterIndividualAnnotations
+        ) as f:
+            images = folderparser.iter_parsefolder(folder)
+            self.assertEqual(f.call_count, 0)
+            first = next(images)
+            calls = f.call_count
+        self.assertGreater(calls, 0)
+        self.assertEqual(first["annotationfile"]["name"], "annotation.csv")
+
+    def test_parallel_scan_matches_os_walk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for rel in ("a.jpg", "x/b.jpg", "x/y/c.txt", "x/y/z/d.png", "w/e.jpg"):
+                os.makedirs(os.path.dirname(os.path.join(tmpdir, rel)), exist_ok=True)
+                open(os.path.join(tmpdir, rel), "wb").close()
+            os.symlink(os.path.join(tmpdir, "x"), os.path.join(tmpdir, "link"))
+            expected = sorted(
+                os.path.relpath(os.path.join(root, f), tmpdir) for root, _, files in os.walk(tmpdir) for f in files
+            )
+            for workers in (None, 1, 4):
+                self.assertEqual(sorted(folderparser._scan_files(tmpdir, workers)), expected)
+
+    def test_parse_with_worker_processes(self):
+        for folder in ("sharks-tiny-createml", "paligemma"):
+            path = f"{thisdir}/../datasets/{folder}"
+            self.assertEqual(folderparser.parsefolder(path, workers=2), folderparser.parsefolder(path, workers=1))
+
+    def test_file_descriptor_behaves_like_dict(self):
+        desc = folderparser._describe_file("\\train\\Images\\labels/Photo.v2.JPG")
+        self.assertEqual(
+            dict(desc),
+            {
+                "file": "/train/Images/labels/Photo.v2.JPG",
+                "dirname": "/train/Images/labels",
+                "name": "Photo.v2.JPG",
+                "extension": ".jpg",
+                "key": "photo.v2",
+                "fullkey": "/train/images/labels/photo.v2",
+                "fullkey2": "/train/images/photo.v2",
+            },
+        )
+        self.assertIsNone(desc.get("annotationfile"))
+        desc["split"] = "train"
+        desc["custom"] = 1
+        self.assertEqual(dict(desc, split="valid")["split"], "valid")
+        self.assertEqual((desc["split"], desc["custom"]), ("train", 1))
+        self.assertEqual(folderparser._describe_file("/root.jpg")["file"], "/root.jpg")
+        with self.assertRaises(TypeError):
+            desc["file"] = "/elsewhere.jpg"
+
+    def test_csv_rows_are_grouped_per_image_in_file_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.jpg", "b.jpg", "c.jpg"):
+                open(os.path.join(tmpdir, name), "wb").close()
+            with open(os.path.join(tmpdir, "_annotations.csv"), "w") as f:
+                f.write("filename,class\na.jpg,cat\nb.jpg,dog\na.jpg,bird\n")
+
+            parsed = folderparser.parsefolder(tmpdir)
+            byfile = {i["file"]: i.get("annotationfile") for i in parsed["images"]}
+
+            self.assertEqual(byfile["/a.jpg"]["rawText"], "filename,class\na.jpg,cat\na.jpg,bird\n")
+            self.assertEqual(byfile["/b.jpg"]["rawText"], "filename,class\nb.jpg,dog\n")
+            self.assertIsNone(byfile["/c.jpg"])
+
 
 def _assertJsonMatchesFile(actual, filename):
     with open(filename) as file:
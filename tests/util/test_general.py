@@ -0,0 +1,40 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from roboflow.util.general import extract_zip
+
+
+class TestExtractZip(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.location = tmp.name
+        self.zip_path = os.path.join(self.location, "roboflow.zip")
+        self.files = {f"train/images/{i % 3}/img{i}.jpg": os.urandom(64) * (i + 1) for i in range(40)}
+        with zipfile.ZipFile(self.zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("train/", "")
+            for name, data in self.files.items():
+                zf.writestr(name, data)
+
+    def test_extracts_members_concurrently(self):
+        extract_zip(self.location, workers=8)
+
+        self.assertFalse(os.path.exists(self.zip_path))
+        for name, data in self.files.items():
+            with open(os.path.join(self.location, name), "rb") as fh:
+                self.assertEqual(fh.read(), data)
+
+    def test_truncated_archive_fails_before_extracting(self):
+        size = os.path.getsize(self.zip_path)
+        with open(self.zip_path, "r+b") as fh:
+            fh.truncate(size // 2)
+
+        with self.assertRaises(RuntimeError):
+            extract_zip(self.location)
+        self.assertEqual(os.listdir(self.location), ["roboflow.zip"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,8 @@ import unittest
 
 import responses
 
-from roboflow.util.image_utils import check_image_path, check_image_url, load_labelmap
+from roboflow.util.image_utils import check_image_path, check_image_url, encode_frame, load_labelmap
+from roboflow.util.preprocessing import Preprocessor, Transform
 
 
 class TestCheckImagePath(unittest.TestCase):
@@ -40,3 +41,43 @@ class TestLoadLabelmap(unittest.TestCase):
     def test_yaml_dict_names(self):
         labelmap = load_labelmap("tests/annotations/dict_names.yaml")
         self.assertEqual(labelmap, {0: "cat", 1: "dog", 2: "fish"})
+
+
+class TestEncodeFrame(unittest.TestCase):
+    def _decode(self, payload):
+        import cv2
+        import numpy as np
+
+        return cv2.imdecode(np.frombuffer(payload, np.uint8), cv2.IMREAD_COLOR)
+
+    def test_reports_frame_dims_and_channel_order(self):
+        import numpy as np
+
+        frame = np.zeros((48, 64, 3), np.uint8)
+        frame[..., 0] = 255  # blue in BGR, red in RGB
+
+        payload, dims, transform = encode_frame(frame)
+        self.assertEqual(dims, {"width": "64", "height": "48"})
+        self.assertEqual(transform, Transform())
+        self.assertGreater(self._decode(payload)[0, 0, 0], 200)
+
+        payload, _, _ = encode_frame(frame, bgr=False)
+        self.assertGreater(self._decode(payload)[0, 0, 2], 200)
+
+        payload, _, _ = encode_frame(np.zeros((48, 64, 4), np.uint8))
+        self.assertEqual(self._decode(payload).shape, (48, 64, 3))
+
+    def test_crops_and_shrinks_with_preprocessor(self):
+        import numpy as np
+
+        preprocessor = Preprocessor(
+            {
+                "resize": {"width": 50, "height": 50, "format": "Stretch to"},
+                "static-crop": {"x_min": 50, "x_max": 100, "y_min": 0, "y_max": 100},
+            }
+        )
+        payload, dims, transform = encode_frame(np.zeros((100, 200, 3), np.uint8), preprocessor=preprocessor)
+
+        self.assertEqual(dims, {"width": "200", "height": "100"})
+        self.assertEqual(self._decode(payload).shape, (50, 50, 3))
+        self.assertEqual(transform, Transform(2.0, 2.0, 100, 0))
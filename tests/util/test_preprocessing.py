@@ -0,0 +1,59 @@
+import unittest
+
+from PIL import Image
+
+from roboflow.util.preprocessing import Preprocessor, Transform
+
+
+def _resize(mode, width=400, height=400):
+    return {"resize": {"enabled": True, "width": str(width), "height": str(height), "format": mode}}
+
+
+class TestPreprocessor(unittest.TestCase):
+    def test_resize_modes_only_shrink(self):
+        self.assertEqual(Preprocessor(_resize("Stretch to")).plan((1000, 500)), (None, (400, 400)))
+        self.assertEqual(Preprocessor(_resize("Fit (black edges) in")).plan((1000, 500)), (None, (400, 200)))
+        self.assertEqual(Preprocessor(_resize("Fill (with center crop) in")).plan((1000, 500)), (None, (800, 400)))
+        self.assertEqual(Preprocessor(_resize("Stretch to")).plan((300, 200)), (None, (300, 200)))
+        self.assertEqual(Preprocessor({}).plan((1000, 500)), (None, (1000, 500)))
+        self.assertFalse(Preprocessor({"resize": {"enabled": False, "width": 1, "height": 1}}))
+
+    def test_static_crop_then_resize(self):
+        preprocessing = _resize("Stretch to", 100, 100)
+        preprocessing["static-crop"] = {"x_min": 10, "x_max": 60, "y_min": 0, "y_max": 50}
+        image, transform = Preprocessor(preprocessing).apply(Image.new("RGB", (1000, 800)))
+
+        self.assertEqual(image.size, (100, 100))
+        self.assertEqual(transform, Transform(5.0, 4.0, 100, 0))
+
+    def test_server_side_crop_keeps_full_resolution(self):
+        preprocessing = _resize("Stretch to", 100, 100)
+        self.assertEqual(Preprocessor(preprocessing, static_crop=False).plan((1000, 800)), (None, (100, 100)))
+
+        preprocessing["static-crop"] = {"x_min": 10, "x_max": 60, "y_min": 0, "y_max": 50}
+        image = Image.new("RGB", (1000, 800))
+        self.assertFalse(Preprocessor(preprocessing, static_crop=False))
+        self.assertIs(Preprocessor(preprocessing, static_crop=False).apply(image)[0], image)
+
+    def test_rescale_predictions_maps_boxes_points_and_keypoints(self):
+        predictions = [
+            {
+                "x": 10,
+                "y": 20,
+                "width": 4,
+                "height": 6,
+                "points": [{"x": 1, "y": 2}],
+                "keypoints": [{"x": 3, "y": 4, "class": "nose"}],
+            }
+        ]
+        Transform(2.0, 3.0, 100, 0).rescale_predictions(predictions)
+
+        prediction = predictions[0]
+        self.assertEqual((prediction["x"], prediction["y"]), (120, 60))
+        self.assertEqual((prediction["width"], prediction["height"]), (8, 18))
+        self.assertEqual(prediction["points"], [{"x": 102, "y": 6}])
+        self.assertEqual(prediction["keypoints"], [{"x": 106, "y": 12, "class": "nose"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
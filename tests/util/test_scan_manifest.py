@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from roboflow.util import folderparser
+from roboflow.util.scan_manifest import ScanManifest
+
+
+class TestScanManifest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.tmp.name, "dataset")
+        for rel in ("train/a.jpg", "train/b.jpg", "valid/c.jpg"):
+            self._write(rel, b"")
+        self._write("_annotations.csv", b"filename,class\na.jpg,cat\nb.jpg,dog\nc.jpg,cat\n")
+        self._age()
+        self.manifest = ScanManifest(os.path.join(self.tmp.name, "cache", "manifest.sqlite"))
+
+    def tearDown(self):
+        self.manifest.close()
+        self.tmp.cleanup()
+
+    def _write(self, rel, data):
+        path = os.path.join(self.folder, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as fh:
+            fh.write(data)
+
+    def _age(self):
+        # keep every entry outside the window in which changes are not recorded
+        for root, dirs, files in os.walk(self.folder):
+            for name in dirs + files + [""]:
+                os.utime(os.path.join(root, name), (1_000_000, 1_000_000))
+
+    def _parse(self):
+        return folderparser.parsefolder(self.folder, manifest=self.manifest)
+
+    def test_unchanged_folder_is_not_read_again(self):
+        first = self._parse()
+        with (
+            patch.object(folderparser, "_list_dir") as list_dir,
+            patch.object(folderparser, "_parseAnnotationFile") as parse,
+        ):
+            second = self._parse()
+        list_dir.assert_not_called()
+        parse.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(len(second["images"]), 3)
+
+    def test_only_changed_directories_and_annotations_are_reread(self):
+        self._parse()
+        self._write("valid/d.jpg", b"")
+        self._write("_annotations.csv", b"filename,class\na.jpg,cat\nb.jpg,dog\nc.jpg,cat\nd.jpg,bird\n")
+
+        with (
+            patch.object(folderparser, "_list_dir", wraps=folderparser._list_dir) as list_dir,
+            patch.object(folderparser, "_parseAnnotationFile", wraps=folderparser._parseAnnotationFile) as parse,
+        ):
+            parsed = self._parse()
+
+        listed = sorted(os.path.relpath(call.args[0], self.folder) for call in list_dir.call_args_list)
+        self.assertEqual(listed, ["valid"])
+        self.assertEqual(parse.call_count, 1)
+        images = {i["file"]: i for i in parsed["images"]}
+        self.assertEqual(images["/valid/d.jpg"]["annotationfile"]["rawText"], "filename,class\nd.jpg,bird\n")
+
+    def test_large_annotation_files_are_not_cached(self):
+        self.manifest.max_parsed_size = 10
+        self._parse()
+        with patch.object(folderparser, "_parseAnnotationFile", wraps=folderparser._parseAnnotationFile) as parse:
+            self._parse()
+        self.assertEqual(parse.call_count, 1)
+        self.assertIsNone(self.manifest.parsed(os.path.join(self.folder, "_annotations.csv")))
+
+    def test_recent_changes_are_not_recorded(self):
+        self._write("train/e.jpg", b"")
+        self._parse()
+        self.assertIsNone(self.manifest.listing(os.path.join(self.folder, "train")))
+        self.assertIsNotNone(self.manifest.listing(os.path.join(self.folder, "valid")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+
+from roboflow.util.upload_journal import ANNOTATION_NONE, ANNOTATION_SAVED, UploadJournal
+
+
+class TestUploadJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.image = os.path.join(self.tmp.name, "img.jpg")
+        with open(self.image, "wb") as fh:
+            fh.write(b"pixels")
+        self.journal_path = os.path.join(self.tmp.name, "nested", "journal.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_entries_persist_across_reopen(self):
+        with UploadJournal(self.journal_path) as journal:
+            key = journal.key("ws/proj", self.image)
+            journal.record_image(key, "img-1")
+            self.assertFalse(journal.is_complete(journal.lookup(key)))
+            journal.record_annotation(key, ANNOTATION_SAVED)
+
+        with UploadJournal(self.journal_path) as journal:
+            entry = journal.lookup(journal.key("ws/proj", self.image))
+            self.assertEqual(entry["image_id"], "img-1")
+            self.assertTrue(journal.is_complete(entry))
+            self.assertIsNone(journal.lookup(journal.key("ws/other", self.image)))
+
+    def test_modified_file_is_not_matched(self):
+        with UploadJournal(self.journal_path) as journal:
+            key = journal.key("ws/proj", self.image)
+            journal.record_image(key, "img-1")
+            journal.record_annotation(key, ANNOTATION_NONE)
+
+            with open(self.image, "ab") as fh:
+                fh.write(b" more pixels")
+            self.assertIsNone(journal.lookup(journal.key("ws/proj", self.image)))
+
+    def test_failed_image_resets_previous_state(self):
+        with UploadJournal(self.journal_path) as journal:
+            key = journal.key("ws/proj", self.image)
+            journal.record_image(key, "img-1")
+            journal.record_annotation(key, ANNOTATION_SAVED)
+            journal.record_image_failure(key, "boom")
+
+            entry = journal.lookup(key)
+            self.assertFalse(journal.is_complete(entry))
+            self.assertIsNone(entry["image_id"])
+            self.assertEqual(entry["error"], "boom")
+
+
+if __name__ == "__main__":
+    unittest.main()
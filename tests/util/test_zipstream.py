@@ -0,0 +1,88 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+from roboflow.util import zipstream
+
+
+class TestZipStream(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.src = self.tmp.name
+        self.files = {
+            "train/images/a.jpg": os.urandom(4096),
+            "train/labels/a.txt": b"0 0.5 0.5 0.1 0.1\n" * 200,
+            "data.yaml": "names: [café]\n".encode(),
+            "big.json": b'{"k": "v"}' * 50_000,
+        }
+        for name, data in self.files.items():
+            path = os.path.join(self.src, *name.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fh:
+                fh.write(data)
+        with open(os.path.join(self.src, ".DS_Store"), "wb") as fh:
+            fh.write(b"junk")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _read_back(self, payload):
+        with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+            self.assertIsNone(zf.testzip())
+            return {info.filename: (info.compress_type, zf.read(info)) for info in zf.infolist()}
+
+    def test_stores_compressed_formats_and_deflates_the_rest(self):
+        out = io.BytesIO()
+        zipstream.write_zip(self.src, out, workers=3)
+
+        entries = self._read_back(out.getvalue())
+        self.assertEqual({name: data for name, (_, data) in entries.items()}, self.files)
+        self.assertEqual(entries["train/images/a.jpg"][0], zipfile.ZIP_STORED)
+        self.assertEqual(entries["train/labels/a.txt"][0], zipfile.ZIP_DEFLATED)
+
+    def test_streamed_deflate_for_large_files(self):
+        out = io.BytesIO()
+        with patch.object(zipstream, "_MAX_BUFFERED", 1024):
+            zipstream.write_zip(self.src, out, workers=2)
+
+        entries = self._read_back(out.getvalue())
+        self.assertEqual(entries["big.json"], (zipfile.ZIP_DEFLATED, self.files["big.json"]))
+
+    def test_zip64_records(self):
+        # Lower the 16/32-bit limits so the ZIP64 paths run on small files.
+        for limits in ({"_MAX16": 2}, {"_MAX32": 5000}):
+            out = io.BytesIO()
+            with patch.multiple(zipstream, **limits):
+                zipstream.write_zip(self.src, out)
+
+            entries = self._read_back(out.getvalue())
+            self.assertEqual({name: data for name, (_, data) in entries.items()}, self.files)
+
+    def test_iter_zip_matches_written_archive(self):
+        chunks = list(zipstream.iter_zip(self.src, workers=2, chunk_size=1000))
+        self.assertTrue(all(len(c) == 1000 for c in chunks[:-1]))
+        entries = self._read_back(b"".join(chunks))
+        self.assertEqual({name: data for name, (_, data) in entries.items()}, self.files)
+
+    def test_zip_size_is_exact_without_reading_stored_files(self):
+        # in-memory deflate, streamed deflate, ZIP64 records
+        for limits in ({"_MAX_BUFFERED": zipstream._MAX_BUFFERED}, {"_MAX_BUFFERED": 1024}, {"_MAX32": 5000}):
+            with patch.multiple(zipstream, **limits):
+                payload = b"".join(zipstream.iter_zip(self.src, workers=2))
+                self.assertEqual(zipstream.zip_size(self.src, workers=2), len(payload))
+
+        with patch("builtins.open", wraps=open) as spy:
+            zipstream.zip_size(self.src)
+        self.assertFalse([c for c in spy.call_args_list if str(c.args[0]).endswith(".jpg")])
+
+    def test_iter_zip_can_be_abandoned(self):
+        stream = zipstream.iter_zip(self.src, chunk_size=16, max_buffered_chunks=1)
+        next(stream)
+        stream.close()  # must not hang waiting on the producer
+
+
+if __name__ == "__main__":
+    unittest.main()